@@ -2,10 +2,18 @@
 Data loader service - Parses USC sections on-the-fly from source XML/XHTML files.
 """
 
+import hashlib
+import os
+import pickle
+import re
 from pathlib import Path
 from typing import Dict, List, Optional
 from .usc_parser import parse_xml_section, parse_xhtml_section
 
+# Section numbers the index records in full; other shapes (e.g. '2257A')
+# are only ever looked up by parsing
+_INDEXED_SECTION_NUM = re.compile(r'\d+[a-z]?')
+
 
 class SectionDataLoader:
     """
@@ -25,13 +33,19 @@ class SectionDataLoader:
         1994: {'format': 'xhtml', 'file': '1994/1994/1994usc18.htm'},
     }
 
-    def __init__(self, data_dir: Path):
+    def __init__(self, data_dir: Path, cache_dir: Optional[Path] = None):
         self.data_dir = data_dir
         self.raw_dir = data_dir / 'raw' / 'uslm'
 
-        # Cache for parsed sections: "section_num:year" -> parsed_data
+        # Cache for parsed sections: "section_num:year" -> parsed_data, or None
+        # for a section that is not in that year's file
         self._cache = {}
 
+        # Optional directory keeping parsed sections on disk between runs
+        self.cache_dir = cache_dir
+        if cache_dir is not None:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+
         # Cache section numbers per year (fast lookup for availability)
         self._section_index = {}
         print("Building section index...")
@@ -54,6 +68,13 @@ class SectionDataLoader:
         if cache_key in self._cache:
             return self._cache[cache_key]
 
+        # A section the index has no entry for is not in that year's file,
+        # which saves parsing the whole file to find that out
+        year_index = self._section_index.get(year)
+        if (year_index is not None and _INDEXED_SECTION_NUM.fullmatch(section_num)
+                and section_num not in year_index):
+            return None
+
         # Get file info for this year
         config = self.YEARS_CONFIG.get(year)
         if not config:
@@ -67,14 +88,11 @@ class SectionDataLoader:
 
         # Parse based on format
         try:
-            if config['format'] == 'xml':
-                data = parse_xml_section(source_file, section_num, year)
-            else:  # xhtml
-                data = parse_xhtml_section(source_file, section_num, year)
+            data = self._parse_section(source_file, config['format'], section_num, year)
 
-            # Cache the result
-            if data:
-                self._cache[cache_key] = data
+            # Cache the result; a miss is cached too, since finding out
+            # that a section is absent means parsing the whole file
+            self._cache[cache_key] = data
 
             return data
 
@@ -82,6 +100,58 @@ class SectionDataLoader:
             print(f"Error parsing {source_file} section {section_num}: {e}")
             return None
 
+    def _parse_section(self, source_file: Path, format_name: str, section_num: str, year: int) -> Optional[dict]:
+        """
+        Parse a section, reusing a copy pickled in cache_dir when there is one.
+
+        A cache entry is keyed on the source file's mtime and on the parser
+        modules' own, so editing either one re-parses instead of serving
+        stale data. The cache is best effort: an unreadable entry is parsed
+        again and a failed write only loses the cached copy.
+        """
+        parse = parse_xml_section if format_name == 'xml' else parse_xhtml_section
+        if self.cache_dir is None:
+            return parse(source_file, section_num, year)
+
+        cache_file = self._disk_cache_file(source_file, section_num, year)
+        try:
+            return pickle.loads(cache_file.read_bytes())
+        except Exception:
+            # Missing or unreadable; a truncated or corrupt pickle can raise
+            # nearly any exception type. Parse again and overwrite it below
+            pass
+
+        data = parse(source_file, section_num, year)
+
+        # Write under a per-process name and rename into place, so loaders
+        # filling the same entry never read a partially written pickle
+        tmp_file = cache_file.with_name(f'{cache_file.name}.{os.getpid()}.tmp')
+        try:
+            tmp_file.write_bytes(pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))
+            os.replace(tmp_file, cache_file)
+
+            # Entries for older source or parser mtimes can never be hit again
+            for stale_file in self.cache_dir.glob(f'{section_num}_{year}_*.pkl'):
+                if stale_file != cache_file:
+                    stale_file.unlink(missing_ok=True)
+        except OSError as e:
+            print(f"Could not update cache for section {section_num} ({year}): {e}")
+            if tmp_file.exists():
+                tmp_file.unlink(missing_ok=True)
+        return data
+
+    def _disk_cache_file(self, source_file: Path, section_num: str, year: int) -> Path:
+        """Path of the on-disk cache entry for a section of source_file."""
+        services_dir = Path(__file__).parent
+        stamps = [
+            f'{name}:{(services_dir / name).stat().st_mtime_ns}'
+            for name in ('usc_parser.py', 'usc_rules.py')
+        ]
+        key = hashlib.sha1(
+            f'{source_file}:{source_file.stat().st_mtime_ns}:{stamps}'.encode()
+        ).hexdigest()
+        return self.cache_dir / f'{section_num}_{year}_{key}.pkl'
+
     def get_section_versions(self, section_num: str) -> Dict[int, dict]:
         """
         Load all versions of a section.
@@ -116,9 +186,9 @@ class SectionDataLoader:
 
         This parses each year's file ONCE to extract section numbers only,
         avoiding the N×M bottleneck of parsing 9,100+ times.
+        get_section also relies on it to answer for absent sections, so a
+        year that fails to index is left out rather than recorded as empty.
         """
-        import re
-
         for year, config in self.YEARS_CONFIG.items():
             source_file = self.raw_dir / config['file']
             if not source_file.exists():
@@ -145,26 +215,36 @@ class SectionDataLoader:
                     print(f"  {year}: {len(section_nums)} sections (XML)")
 
                 else:  # xhtml
-                    # Quick extract of section numbers from XHTML
-                    from bs4 import BeautifulSoup
-                    with open(source_file, 'r', encoding='utf-8', errors='ignore') as f:
-                        soup = BeautifulSoup(f.read(), 'html.parser')
+                    # Quick extract of section numbers from XHTML section headers
+                    from io import BytesIO
+                    from lxml import etree
+                    content = source_file.read_bytes()
+                    try:
+                        content.decode('utf-8')
+                        encoding = 'utf-8'
+                    except UnicodeDecodeError:
+                        encoding = 'iso-8859-1'
 
-                    section_headers = soup.find_all('h3', class_='section-head')
                     section_nums = set()
-
-                    for header in section_headers:
-                        text = header.get_text()
-                        match = re.search(r'§(\d+[a-z]?)', text)
-                        if match:
-                            section_nums.add(match.group(1))
+                    for _, header in etree.iterparse(BytesIO(content), events=('end',), tag='h3',
+                                                     html=True, encoding=encoding):
+                        if 'section-head' in (header.get('class') or '').split():
+                            # Every number in the header, as the parser accepts
+                            # a header mentioning "§<num>." anywhere
+                            section_nums.update(re.findall(r'§(\d+[a-z]?)', ''.join(header.itertext())))
+
+                        # Only headers are needed; drop everything read so far
+                        header.clear()
+                        parent = header.getparent()
+                        if parent is not None:
+                            while header.getprevious() is not None:
+                                del parent[0]
 
                     self._section_index[year] = section_nums
                     print(f"  {year}: {len(section_nums)} sections (XHTML)")
 
             except Exception as e:
                 print(f"  Error indexing {year}: {e}")
-                self._section_index[year] = set()
 
     def list_all_sections(self) -> List[dict]:
         """
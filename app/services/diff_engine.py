@@ -106,6 +106,20 @@ def compare_versions(version1: dict, version2: dict) -> List[dict]:
     The diffs are sorted by provision ID, which maintains hierarchical order.
     """
     tree1 = build_provision_tree(version1)
+
+    # The same object cannot differ from itself: skip the second tree and the
+    # per-provision comparison, every provision is unchanged
+    if version2 is version1:
+        return [
+            {
+                'type': 'unchanged',
+                'id': provision_id,
+                'old': node,
+                'new': node
+            }
+            for provision_id, node in sorted(tree1.items())
+        ]
+
     tree2 = build_provision_tree(version2)
 
     # Get all unique provision IDs from both versions
@@ -5,11 +5,52 @@ This module contains the parsing logic extracted from scripts/extract_sections.p
 adapted for use in the Flask app to parse sections dynamically.
 """
 
+import functools
+import mmap
+import os
+import pickle
 import re
+import sys
+from io import BytesIO
 from pathlib import Path
 from typing import List
 from lxml import etree
-from bs4 import BeautifulSoup
+
+USLM_NS = 'http://xml.house.gov/schemas/uslm/1.0'
+_NS = {'uslm': USLM_NS}
+_SECTION_TAG = f'{{{USLM_NS}}}section'
+
+# Compiled once; num/heading/chapeau/content are looked up on the direct children only
+_NUM_XP = etree.XPath('uslm:num', namespaces=_NS)
+_HEADING_XP = etree.XPath('uslm:heading', namespaces=_NS)
+_CHAPEAU_XP = etree.XPath('uslm:chapeau', namespaces=_NS)
+_CONTENT_XP = etree.XPath('uslm:content', namespaces=_NS)
+_REFS_XP = etree.XPath('.//uslm:ref[@href]', namespaces=_NS)
+
+# Nested provision levels, in the order they are emitted under a parent
+USLM_CHILD_TAGS = ('subsection', 'paragraph', 'subparagraph', 'clause', 'subclause')
+
+# Keys holding a parsed provision's children, shallowest level first. Interned,
+# like the tag names and provision numbers below: the same few strings recur
+# in every node, so each is stored once and compared by identity.
+PROVISION_CHILD_KEYS = tuple(sys.intern(tag + 's') for tag in USLM_CHILD_TAGS)
+# Child key for each namespace-qualified provision tag, so children are
+# dispatched straight from elem.tag without splitting off the namespace
+_CHILD_KEY_BY_TAG = {
+    f'{{{USLM_NS}}}{tag}': child_key
+    for tag, child_key in zip(USLM_CHILD_TAGS, PROVISION_CHILD_KEYS)
+}
+
+# String value of an element: its text plus all descendant text
+_STRING_XP = etree.XPath('string()', smart_strings=False)
+
+# Run of provision numbers opening an XHTML paragraph, e.g. "(p)(1) " or
+# "(v), (w) ", and the single numbers within it
+_PROVISION_NUMS_RE = re.compile(r'(?:\([a-zA-Z0-9]+\)[\s,]*)+')
+_PROVISION_NUM_RE = re.compile(r'\([a-zA-Z0-9]+\)')
+
+# Markup whitespace between inline elements (not &nbsp; and other Unicode spaces)
+_ASCII_WHITESPACE = ' \t\n\f\r'
 
 
 def parse_xml_section(xml_file: Path, section_num: str, year: int) -> dict:
@@ -24,66 +65,17 @@ def parse_xml_section(xml_file: Path, section_num: str, year: int) -> dict:
     Returns:
         Dictionary with parsed section data
     """
-    tree = etree.parse(xml_file)
-
-    # Handle namespace
-    ns = {'uslm': 'http://xml.house.gov/schemas/uslm/1.0'}
-    section = tree.xpath(f'//uslm:section[@identifier="/us/usc/t18/s{section_num}"]', namespaces=ns)
+    return _parse_memoized(_parse_xml_section, xml_file, section_num, year)
 
-    if not section:
-        return None
-
-    section = section[0]
 
-    def parse_element(elem):
-        """Recursively parse USLM element."""
-        # Strip namespace from tag
-        tag = elem.tag.split('}')[-1] if '}' in elem.tag else elem.tag
+def _parse_xml_section(xml_file: Path, section_num: str, year: int) -> dict:
+    """Parse section from USLM XML format, without memoization."""
+    section = _find_xml_section(xml_file, f'/us/usc/t18/s{section_num}')
 
-        result = {
-            'id': elem.get('identifier', ''),
-            'tag': tag,
-        }
+    if section is None:
+        return None
 
-        # Extract num if present (direct child only)
-        num_elem = elem.find(f'{{{ns["uslm"]}}}num')
-        if num_elem is not None:
-            result['num'] = ''.join(num_elem.itertext())
-
-        # Extract heading if present (direct child only)
-        heading_elem = elem.find(f'{{{ns["uslm"]}}}heading')
-        if heading_elem is not None:
-            result['heading'] = ''.join(heading_elem.itertext())
-
-        # Extract text from direct child <chapeau> or <content> element
-        # Subsections/paragraphs use <chapeau>, subparagraphs/clauses use <content>
-        chapeau_elem = elem.find(f'{{{ns["uslm"]}}}chapeau')
-        content_elem = elem.find(f'{{{ns["uslm"]}}}content')
-
-        # Prefer chapeau if it exists, otherwise use content
-        text_elem = chapeau_elem if chapeau_elem is not None else content_elem
-
-        if text_elem is not None:
-            result['text'] = ''.join(text_elem.itertext())
-            # Extract references from the text element (refs can be nested in the text)
-            refs = text_elem.findall(f'.//{{{ns["uslm"]}}}ref[@href]')
-            if refs:
-                result['refs'] = [
-                    {'target': ref.get('href'), 'text': ref.text or ''}
-                    for ref in refs
-                ]
-
-        # Recursively extract child elements
-        for child_tag in ['subsection', 'paragraph', 'subparagraph', 'clause', 'subclause']:
-            children = elem.findall(f'.//{{{ns["uslm"]}}}{child_tag}')
-            # Only include direct children, not nested
-            direct_children = [c for c in children if c.getparent() == elem]
-            if direct_children:
-                result[child_tag + 's'] = [parse_element(child) for child in direct_children]
-
-        return result
-
-    data = parse_element(section)
+    data = _parse_uslm_element(section)
     data['metadata'] = {
         'year': year,
         'source': xml_file.name,
@@ -93,6 +85,106 @@ def parse_xml_section(xml_file: Path, section_num: str, year: int) -> dict:
     return data
 
 
+def _parse_uslm_element(elem) -> dict:
+    """Recursively parse USLM element."""
+    # Strip namespace from tag
+    tag = sys.intern(elem.tag.split('}')[-1] if '}' in elem.tag else elem.tag)
+
+    result = {
+        'id': elem.get('identifier', ''),
+        'tag': tag,
+    }
+
+    # Extract num if present (direct child only)
+    num_elems = _NUM_XP(elem)
+    if num_elems:
+        result['num'] = sys.intern(_STRING_XP(num_elems[0]))
+
+    # Extract heading if present (direct child only)
+    heading_elems = _HEADING_XP(elem)
+    if heading_elems:
+        result['heading'] = _STRING_XP(heading_elems[0])
+
+    # Extract text from direct child <chapeau> or <content> element
+    # Subsections/paragraphs use <chapeau>, subparagraphs/clauses use <content>
+    # Prefer chapeau if it exists, otherwise use content
+    text_elems = _CHAPEAU_XP(elem) or _CONTENT_XP(elem)
+
+    if text_elems:
+        text_elem = text_elems[0]
+        # Only this provision's own chapeau/content: child provisions are
+        # siblings of it, never inside, so their text is not repeated here
+        result['text'] = _STRING_XP(text_elem)
+        # Extract references from the text element (refs can be nested in the text)
+        refs = _REFS_XP(text_elem)
+        if refs:
+            result['refs'] = [
+                {'target': ref.get('href'), 'text': ref.text or ''}
+                for ref in refs
+            ]
+
+    # Recursively extract direct child elements, bucketed by tag in one pass
+    # over the children (in document order within each tag)
+    children = {child_key: [] for child_key in PROVISION_CHILD_KEYS}
+    for child in elem:
+        child_key = _CHILD_KEY_BY_TAG.get(child.tag)
+        if child_key is not None:
+            children[child_key].append(child)
+    for child_key, direct_children in children.items():
+        if direct_children:
+            result[child_key] = [_parse_uslm_element(child) for child in direct_children]
+
+    return result
+
+
+def _find_xml_section(xml_file: Path, identifier: str):
+    """
+    Stream a USLM file up to the end of the first <section> with identifier.
+
+    Only that section's subtree is returned complete: sections read before it
+    are cleared as they end, and the rest of the file is never parsed.
+    """
+    # A missing section is usually answered by a scan of the raw bytes,
+    # without parsing the file at all
+    if not _mentions_identifier(xml_file, identifier):
+        return None
+
+    target = None
+    for event, elem in etree.iterparse(str(xml_file), events=('start', 'end'), tag=_SECTION_TAG):
+        if event == 'start':
+            # Matching on start keeps document order when sections are nested
+            if target is None and elem.get('identifier') == identifier:
+                target = elem
+        elif elem is target:
+            return elem
+        elif target is None:
+            # Free the finished section and everything before it
+            elem.clear(keep_tail=True)
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+
+    return None
+
+
+def _mentions_identifier(xml_file: Path, identifier: str) -> bool:
+    """
+    Check the raw bytes of a file for an identifier="..." attribute with this value.
+
+    A match does not mean the section exists, but no match means it cannot.
+    Files that are empty or UTF-16 encoded are passed on to the parser.
+    """
+    pattern = re.compile(rb'identifier\s*=\s*(["\'])' + re.escape(identifier.encode('utf-8')) + rb'\1')
+    with open(xml_file, 'rb') as f:
+        if f.read(2) in (b'\xff\xfe', b'\xfe\xff'):
+            return True
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                return pattern.search(data) is not None
+        except ValueError:
+            # An empty file cannot be mapped
+            return True
+
+
 class ParseContext:
     """Track rich hierarchical parsing state for context-aware parsing."""
 
@@ -115,20 +207,20 @@ class ParseContext:
         )
 
 
+# Valid roman numeral characters; a numeral of one case contains nothing else,
+# so checking membership needs no case conversion of the string
+_LOWERCASE_ROMAN_CHARS = frozenset('ivxlcdm')
+_UPPERCASE_ROMAN_CHARS = frozenset('IVXLCDM')
+
+
 def _is_lowercase_roman(s: str) -> bool:
     """Check if string is a lowercase Roman numeral."""
-    if not s:
-        return False
-    # Valid lowercase roman numeral characters
-    return all(c in 'ivxlcdm' for c in s.lower()) and s.islower()
+    return bool(s) and _LOWERCASE_ROMAN_CHARS.issuperset(s)
 
 
 def _is_uppercase_roman(s: str) -> bool:
     """Check if string is an uppercase Roman numeral."""
-    if not s:
-        return False
-    # Valid uppercase roman numeral characters
-    return all(c in 'IVXLCDM' for c in s.upper()) and s.isupper()
+    return bool(s) and _UPPERCASE_ROMAN_CHARS.issuperset(s)
 
 
 def _get_level_from_number_pattern(clean_num: str, css_level: int, parent_stack: dict, prev_css_level: int) -> int:
@@ -224,49 +316,92 @@ def _parse_provision_numbers(text: str) -> tuple:
         text = text[1:].strip()
         is_repealed = True
 
-    # Find all consecutive provision numbers at start
-    while True:
-        # Match both () and [] brackets, with optional comma/space between
-        match = re.match(r'^[\(]([a-zA-Z0-9]+)[\)][\s,]*', text)
-        if not match:
-            break
-        numbers.append(f'({match.group(1)})')
+    # Find all consecutive provision numbers at start, with optional
+    # comma/space between, in one match
+    match = _PROVISION_NUMS_RE.match(text)
+    if match:
+        numbers = [sys.intern(num) for num in _PROVISION_NUM_RE.findall(text, 0, match.end())]
         text = text[match.end():].strip()
 
     return numbers, text, is_repealed
 
 
-def _extract_direct_text_only(elem) -> str:
+def _text_node(text: str) -> str:
+    """A text node as provision text: whitespace-only runs count as one newline or space."""
+    # isspace() stops at the first visible character, so real text returns at once
+    if not text.isspace() or text.strip(_ASCII_WHITESPACE):
+        return text
+    return '\n' if '\n' in text else ' '
+
+
+def _text_content(elem) -> str:
+    """All text inside an element, with whitespace-only text nodes collapsed."""
+    return ''.join(_text_node(text) for text in elem.itertext())
+
+
+# Inline elements whose text belongs to the paragraph they appear in
+_INLINE_TAGS = frozenset({'em', 'a', 'span'})
+
+
+def _extract_text_and_refs(elem) -> tuple:
     """
-    Extract only direct text from element, not including nested elements.
+    Extract a paragraph's direct text and its references in one pass.
+
+    The string value of an element recursively gets ALL text including children.
+    We need only the direct text to avoid duplication: the element's own
+    text, inline elements, and the text following each child. References
+    are taken from every <a href> inside the paragraph, in document order.
 
-    BeautifulSoup's .get_text() recursively gets ALL text including children.
-    We need only the direct text to avoid duplication.
+    Returns:
+        Tuple of (direct_text, refs)
     """
     direct_texts = []
-    for content in elem.children:
-        if isinstance(content, str):
-            # Direct text node
-            direct_texts.append(content)
-        elif content.name in ['em', 'a', 'span']:
+    refs = []
+    if elem.text:
+        # Direct text node
+        direct_texts.append(_text_node(elem.text))
+    for child in elem:
+        if child.tag in _INLINE_TAGS:
             # Inline elements are part of this provision's text
-            direct_texts.append(content.get_text())
+            text = _text_content(child)
+            direct_texts.append(text)
+            if child.tag == 'a':
+                href = child.get('href', '')
+                if href:
+                    # A direct link's text is the text just extracted
+                    refs.append({'target': href, 'text': text})
         # Skip child <p> elements - they're child provisions
+        if len(child):
+            # Links nested inside any child still count as references
+            for link in child.iterdescendants('a'):
+                href = link.get('href', '')
+                if href:
+                    refs.append({
+                        'target': href,
+                        'text': _text_content(link)
+                    })
+        if child.tail:
+            # Text following a child element is direct text again
+            direct_texts.append(_text_node(child.tail))
 
-    return ' '.join(direct_texts).strip()
+    return ' '.join(direct_texts).strip(), refs
 
 
-def _extract_refs(elem) -> list:
-    """Extract references from <a> tags."""
-    refs = []
-    for link in elem.find_all('a'):
-        href = link.get('href', '')
-        if href:
-            refs.append({
-                'target': href,
-                'text': link.get_text()
-            })
-    return refs
+def _has_class(elem, css_class: str) -> bool:
+    """Check if css_class is one of the element's class tokens."""
+    return css_class in (elem.get('class') or '').split()
+
+
+def _only_string(elem):
+    """
+    Return the text of an element whose entire content is a single string.
+
+    Descends through elements wrapping nothing but one child, as in
+    <h3><span>text</span></h3>; returns None for empty or mixed content.
+    """
+    while len(elem) == 1 and not elem.text and not elem[0].tail:
+        elem = elem[0]
+    return None if len(elem) else elem.text
 
 
 def _get_css_level_from_class(css_class) -> int:
@@ -294,61 +429,102 @@ LEVEL_TO_TAG = {
     9: 'subclause',
 }
 
+LEVEL_TO_CHILD_KEY = {level: sys.intern(tag + 's') for level, tag in LEVEL_TO_TAG.items()}
 
-def _extract_raw_elements(soup, section_header) -> List[dict]:
+
+def _extract_raw_element(p) -> dict:
     """
-    PASS 1: Extract all provision elements as flat list with metadata.
+    PASS 1: Extract a provision paragraph as a flat element with metadata.
 
     Args:
-        soup: BeautifulSoup object
-        section_header: Section header element
+        p: <p> element following the section header
 
     Returns:
-        List of elements with css_level, nums, text, elem, and is_root_css metadata
+        Element with css_level, nums, text, refs, and is_root_css metadata,
+        or None for continuation text without provision numbers
     """
-    elements = []
+    css_class = (p.get('class') or '').split()
+    css_class_str = css_class[0] if css_class else ''
 
-    # Extract all content until next section header
-    for sibling in section_header.next_siblings:
-        if sibling.name == 'h3' and 'section-head' in sibling.get('class', []):
-            break
+    css_level = _get_css_level_from_class(css_class)
 
-        if sibling.name == 'p':
-            css_class = sibling.get('class', [])
-            if isinstance(css_class, list):
-                css_class_str = css_class[0] if css_class else ''
-            else:
-                css_class_str = css_class
+    # Check if this is root CSS level (statutory-body, not statutory-body-Xem)
+    is_root_css = css_class_str == 'statutory-body'
 
-            css_level = _get_css_level_from_class(css_class)
+    # Extract direct text and parse provision numbers
+    text_content, refs = _extract_text_and_refs(p)
+    provision_nums, clean_text, is_repealed = _parse_provision_numbers(text_content)
 
-            # Check if this is root CSS level (statutory-body, not statutory-body-Xem)
-            is_root_css = css_class_str == 'statutory-body'
+    # Skip if no provision numbers (continuation text, not a provision)
+    if not provision_nums:
+        return None
 
-            # Extract direct text and parse provision numbers
-            text_content = _extract_direct_text_only(sibling)
-            provision_nums, clean_text, is_repealed = _parse_provision_numbers(text_content)
+    return {
+        'css_level': css_level,
+        'nums': provision_nums,
+        'text': clean_text,
+        'refs': refs,
+        'is_root_css': is_root_css,  # Metadata for Pass 2
+        'is_repealed': is_repealed   # Metadata for repealed provisions
+    }
 
-            # Skip if no provision numbers (continuation text, not a provision)
-            if not provision_nums:
-                continue
 
-            elements.append({
-                'css_level': css_level,
-                'nums': provision_nums,
-                'text': clean_text,
-                'elem': sibling,
-                'is_root_css': is_root_css,  # Metadata for Pass 2
-                'is_repealed': is_repealed   # Metadata for repealed provisions
-            })
+def _stream_section_elements(content: bytes, encoding: str, section_num: str):
+    """
+    Stream an XHTML document, collecting one section's provision elements.
+
+    The section is the first <h3 class="section-head"> mentioning
+    "§<num>." and the <p> siblings after it, up to the next section header
+    at the same level. Elements are cleared as soon as they have been read
+    and parsing stops at the end of the section, so neither the rest of the
+    title nor everything before the section is kept in memory.
 
-    return elements
+    Returns:
+        (heading, elements) tuple, or None if the section is not found
+    """
+    marker = f'§{section_num}.'
+    heading = None
+    header_parent = None
 
+    elements = []
+    # The encoding is detected from the bytes, so any encoding declaration
+    # in the document itself must be ignored
+    context = etree.iterparse(BytesIO(content), events=('end',),
+                              tag=('h3', 'p'), html=True, encoding=encoding)
+    for _, elem in context:
+        parent = elem.getparent()
+
+        if heading is None:
+            # Find section header: <h3 class="section-head">&sect;922. ...
+            if elem.tag == 'h3' and _has_class(elem, 'section-head'):
+                text = _only_string(elem)
+                if text and marker in text:
+                    heading = _STRING_XP(elem)
+                    header_parent = parent
+        elif parent is header_parent:
+            if elem.tag == 'p':
+                element = _extract_raw_element(elem)
+                if element:
+                    elements.append(element)
+            elif _has_class(elem, 'section-head'):
+                break
+        elif header_parent not in elem.iterancestors():
+            # The section ran to the end of its parent element
+            break
 
-def _attach_node(node, parent_stack, root_subsections):
-    """Attach node to parent or root."""
-    level = node['level']
+        # Drop the element and everything before it once it has been read
+        elem.clear()
+        if parent is not None:
+            while elem.getprevious() is not None:
+                del parent[0]
 
+    if heading is None:
+        return None
+    return heading, elements
+
+
+def _attach_node(level, node, parent_stack, root_subsections):
+    """Attach node at the given level to parent or root."""
     if level == 5:
         # Root subsection
         root_subsections.append(node)
@@ -357,7 +533,7 @@ def _attach_node(node, parent_stack, root_subsections):
         # Find parent at level-1
         parent = _find_parent(level - 1, parent_stack)
         if parent:
-            child_key = LEVEL_TO_TAG[level] + 's'
+            child_key = LEVEL_TO_CHILD_KEY[level]
             if child_key not in parent:
                 parent[child_key] = []
             parent[child_key].append(node)
@@ -369,14 +545,15 @@ def _attach_node(node, parent_stack, root_subsections):
         parent_stack[l] = None
 
 
-def _handle_combined_number(elem, next_elem, parent_stack, section_base, prev_css_level) -> List[dict]:
+def _handle_combined_number(elem, parent_stack, section_base, prev_css_level) -> List[tuple]:
     """
     Process combined number like (p)(1) or repealed provisions like [(v), (w)].
 
     For repealed provisions (square brackets), all numbers are SIBLINGS at same level.
     For normal combined numbers, subsequent numbers are CHILDREN.
 
-    Creates nodes for each number in the combined provision.
+    Creates nodes for each number in the combined provision, returned as
+    (level, node) pairs.
     """
     nodes = []
     is_repealed = elem.get('is_repealed', False)
@@ -395,7 +572,7 @@ def _handle_combined_number(elem, next_elem, parent_stack, section_base, prev_cs
                 level = _get_level_from_number_pattern(clean_num, elem['css_level'], {}, prev_css_level)
             else:
                 # Normal combined: subsequent numbers are CHILDREN of previous
-                level = nodes[-1]['level'] + 1
+                level = nodes[-1][0] + 1
                 # USC hierarchy only goes to level 9 (subclause)
                 if level > 9:
                     level = 9  # Cap at deepest level
@@ -417,31 +594,30 @@ def _handle_combined_number(elem, next_elem, parent_stack, section_base, prev_cs
                 provision_id = f"{section_base}/{clean_num}"
         else:
             # Child of previous number
-            provision_id = f"{nodes[-1]['id']}/{clean_num}"
+            provision_id = f"{nodes[-1][1]['id']}/{clean_num}"
 
         node = {
             'id': provision_id,
             'tag': LEVEL_TO_TAG[level],
             'num': num,
             'text': text,
-            'refs': _extract_refs(elem['elem']),
-            'level': level
+            'refs': list(elem['refs'])
         }
 
-        nodes.append(node)
+        nodes.append((level, node))
         parent_stack[level] = node
 
     # Clear deeper levels
-    deepest = nodes[-1]['level']
+    deepest = nodes[-1][0]
     for l in range(deepest + 1, 10):
         parent_stack[l] = None
 
     return nodes
 
 
-def _handle_single_number(elem, parent_stack, section_base, prev_css_level) -> dict:
+def _handle_single_number(elem, parent_stack, section_base, prev_css_level) -> tuple:
     """
-    Process single provision number.
+    Process single provision number, returning its (level, node) pair.
 
     Uses number pattern to determine level, but trusts root CSS level.
     """
@@ -470,51 +646,37 @@ def _handle_single_number(elem, parent_stack, section_base, prev_css_level) -> d
         'tag': LEVEL_TO_TAG[level],
         'num': num,
         'text': elem['text'],
-        'refs': _extract_refs(elem['elem']),
-        'level': level
+        'refs': elem['refs']
     }
 
-    return node
+    return level, node
 
 
 def _build_hierarchy_from_elements(elements: List[dict], section_base: str) -> List[dict]:
     """
     PASS 2: Build hierarchical structure from flat element list.
 
-    Uses look-ahead and number patterns to correctly build hierarchy.
+    Uses number patterns and the previous element's CSS level to correctly
+    build hierarchy, in a single forward pass.
     """
     root_subsections = []
     parent_stack = {}
     prev_css_level = 0  # Track previous element's CSS level
 
-    for i, elem in enumerate(elements):
-        # Look-ahead: get next element if exists
-        next_elem = elements[i + 1] if i + 1 < len(elements) else None
-
+    for elem in elements:
         if len(elem['nums']) > 1:
             # Combined number - creates multiple nodes
-            nodes = _handle_combined_number(elem, next_elem, parent_stack, section_base, prev_css_level)
-            for node in nodes:
-                _attach_node(node, parent_stack, root_subsections)
+            nodes = _handle_combined_number(elem, parent_stack, section_base, prev_css_level)
+            for level, node in nodes:
+                _attach_node(level, node, parent_stack, root_subsections)
             # Update prev_css_level to the CHILD's level (last node in combined)
             prev_css_level = elem['css_level']
         else:
             # Single number - creates one node
-            node = _handle_single_number(elem, parent_stack, section_base, prev_css_level)
-            _attach_node(node, parent_stack, root_subsections)
+            level, node = _handle_single_number(elem, parent_stack, section_base, prev_css_level)
+            _attach_node(level, node, parent_stack, root_subsections)
             prev_css_level = elem['css_level']
 
-    # Remove 'level' field from all nodes
-    def remove_level(node):
-        if 'level' in node:
-            del node['level']
-        for child_type in ['subsections', 'paragraphs', 'subparagraphs', 'clauses', 'subclauses']:
-            for child in node.get(child_type, []):
-                remove_level(child)
-
-    for node in root_subsections:
-        remove_level(node)
-
     return root_subsections
 
 
@@ -530,33 +692,34 @@ def parse_xhtml_section(xhtml_file: Path, section_num: str, year: int) -> dict:
     Returns:
         Dictionary with parsed section data
     """
-    # Try multiple encodings
-    content = None
-    for encoding in ['utf-8', 'latin-1', 'cp1252']:
-        try:
-            with open(xhtml_file, 'r', encoding=encoding) as f:
-                content = f.read()
-            break
-        except UnicodeDecodeError:
-            continue
+    return _parse_memoized(_parse_xhtml_section, xhtml_file, section_num, year)
+
+
+def _parse_xhtml_section(xhtml_file: Path, section_num: str, year: int) -> dict:
+    """Parse section from XHTML format, without memoization."""
+    # Read the file once and parse its bytes as they are: UTF-8 if they are
+    # valid UTF-8, otherwise Latin-1 (which any byte sequence decodes as)
+    with open(xhtml_file, 'rb') as f:
+        content = f.read()
 
     if not content:
         raise ValueError(f"Could not decode {xhtml_file}")
 
-    soup = BeautifulSoup(content, 'html.parser')
-
-    # Find section header: <h3 class="section-head">&sect;922. ...
-    section_header = soup.find('h3', class_='section-head', string=lambda s: s and f'§{section_num}.' in s)
+    try:
+        content.decode('utf-8')
+        encoding = 'utf-8'
+    except UnicodeDecodeError:
+        encoding = 'iso-8859-1'
 
-    if not section_header:
+    # PASS 1: Extract raw elements while streaming up to the end of the section
+    found = _stream_section_elements(content, encoding, section_num)
+    if found is None:
         return None
+    heading, elements = found
 
     # Section base ID
     section_base = f'/us/usc/t18/s{section_num}'
 
-    # PASS 1: Extract raw elements
-    elements = _extract_raw_elements(soup, section_header)
-
     # PASS 2: Build hierarchy
     subsections = _build_hierarchy_from_elements(elements, section_base)
 
@@ -565,7 +728,7 @@ def parse_xhtml_section(xhtml_file: Path, section_num: str, year: int) -> dict:
         'id': section_base,
         'tag': 'section',
         'num': f'§\u202f{section_num}.',
-        'heading': section_header.get_text().replace('§', '').strip().replace(section_num + '.', '').strip(),
+        'heading': heading.replace('§', '').strip().replace(section_num + '.', '').strip(),
         'subsections': subsections,
         'metadata': {
             'year': year,
@@ -579,3 +742,46 @@ def parse_xhtml_section(xhtml_file: Path, section_num: str, year: int) -> dict:
     result = apply_post_parse_fixes(result, section_num)
 
     return result
+
+
+def _parse_memoized(parse_fn, path: Path, section_num: str, year: int) -> dict:
+    """
+    Call parse_fn(path, section_num, year), reusing the result of an earlier
+    call while the file is unchanged on disk.
+
+    Each call returns a fresh copy, so callers are free to modify it.
+    """
+    stat = os.stat(path)
+    return pickle.loads(_parse_pickled(parse_fn, path, section_num, year,
+                                       stat.st_mtime_ns, stat.st_size))
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_pickled(parse_fn, path: Path, section_num: str, year: int,
+                   mtime_ns: int, size: int) -> bytes:
+    """
+    Parse a section and pickle the result.
+
+    The file's mtime and size only key the cache, so editing the file
+    invalidates it. Pickled bytes are immutable and far smaller than the
+    parsed tree, and unpickling is several times faster than a deep copy.
+    """
+    return pickle.dumps(parse_fn(path, section_num, year), protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def iter_provisions(node: dict):
+    """
+    Yield a parsed section or provision and every provision below it.
+
+    Walks depth-first in document order (a node, then its subsections,
+    paragraphs, ... in turn) with an explicit stack rather than recursion.
+    """
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        yield node
+        # Pushed deepest level and last child first, so they pop in order
+        for key in reversed(PROVISION_CHILD_KEYS):
+            children = node.get(key)
+            if children:
+                stack.extend(reversed(children))
@@ -7,12 +7,18 @@ Generates HTML and CSV reports showing change frequency and timelines.
 import json
 import csv
 import sys
+from html import escape
 from pathlib import Path
 from typing import Optional
 from lxml import etree
 from bs4 import BeautifulSoup
 import re
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Hierarchy level mappings
 TAG_TO_LEVEL = {
     'subsection': 5,
@@ -43,6 +49,14 @@ LEVEL_TO_NAME = {
 # Tree Building Functions (from diff_paragraphs.py)
 # ============================================================================
 
+def load_json(json_file: Path):
+    """Load a JSON file, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(json_file.read_bytes())
+    with open(json_file) as f:
+        return json.load(f)
+
+
 def extract_key_from_id(identifier: str) -> str:
     """Extract subdivision key from identifier."""
     parts = identifier.split('/')
@@ -133,8 +147,7 @@ def build_xhtml_tree(html: str) -> dict:
 
 def load_section_tree(json_file: Path) -> dict:
     """Load section JSON and build tree."""
-    with open(json_file) as f:
-        data = json.load(f)
+    data = load_json(json_file)
 
     fmt = data.get('metadata', {}).get('format', 'xml')
 
@@ -160,6 +173,19 @@ def get_all_paths(tree: dict, prefix: str = '') -> list:
     return paths
 
 
+def flatten_tree(tree: dict) -> dict:
+    """Map every provision path to its node in one iterative pre-order walk."""
+    flat = {}
+    stack = list(reversed(tree.items()))
+    while stack:
+        path, node = stack.pop()
+        flat[path] = node
+        children = node.get('children')
+        if children:
+            stack.extend((f'{path}/{key}', child) for key, child in reversed(children.items()))
+    return flat
+
+
 def get_node_at_path(tree: dict, path: str) -> Optional[dict]:
     """Get node at specific path in tree."""
     parts = path.split('/')
@@ -225,22 +251,29 @@ def track_provision_history(versions: dict) -> dict:
             'first_seen': 1994,
             'last_modified': 2000,
             'total_changes': 1,
+            'change_years': [2000],
+            'years_existed': 2,
             'status': 'active'
         }
     }
     """
     all_provisions = {}
 
+    # Flatten each tree once so per-year lookups are a single dict get
+    flat_versions = {year: flatten_tree(tree) for year, tree in versions.items()}
+
     # Collect all unique provision paths
-    for year, tree in sorted(versions.items()):
-        for path in get_all_paths(tree):
+    for year, flat in sorted(flat_versions.items()):
+        for path, node in flat.items():
             if path not in all_provisions:
                 all_provisions[path] = {
-                    'level': get_level_from_path(path, tree),
+                    'level': node['level'],
                     'history': {},
                     'first_seen': year,
                     'last_modified': None,
                     'total_changes': 0,
+                    'change_years': [],
+                    'years_existed': 0,
                     'status': 'active'
                 }
 
@@ -250,12 +283,13 @@ def track_provision_history(versions: dict) -> dict:
         prev_text = None
 
         for year in years:
-            node = get_node_at_path(versions[year], path)
+            node = flat_versions[year].get(path)
 
             if node is None:
                 provision_data['history'][year] = {'status': 'missing', 'text': ''}
             else:
                 text = node['text'].strip()
+                provision_data['years_existed'] += 1
 
                 if prev_text is None:
                     # First appearance
@@ -265,6 +299,7 @@ def track_provision_history(versions: dict) -> dict:
                     status = 'modified'
                     provision_data['total_changes'] += 1
                     provision_data['last_modified'] = year
+                    provision_data['change_years'].append(year)
                 else:
                     # Unchanged
                     status = 'unchanged'
@@ -328,14 +363,21 @@ def calculate_statistics(provision_history: dict) -> dict:
 # Report Generation
 # ============================================================================
 
-def find_all_refs(node: dict, refs_list: list):
-    """Recursively find all references in a section tree."""
-    if 'refs' in node:
-        refs_list.extend(node['refs'])
-    for key in ['subsections', 'paragraphs', 'subparagraphs', 'clauses', 'subclauses']:
-        if key in node:
-            for child in node[key]:
-                find_all_refs(child, refs_list)
+REF_CHILD_KEYS = ('subsections', 'paragraphs', 'subparagraphs', 'clauses', 'subclauses')
+
+
+def iter_refs(root: dict):
+    """Yield (target, text) for every reference in a section tree, in document order."""
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        for ref in node.get('refs', ()):
+            yield ref['target'], ref['text']
+        # Pushed deepest level and last child first, so they pop in order
+        for key in reversed(REF_CHILD_KEYS):
+            children = node.get(key)
+            if children:
+                stack.extend(reversed(children))
 
 
 def generate_reference_section(section_num: str) -> str:
@@ -345,39 +387,36 @@ def generate_reference_section(section_num: str) -> str:
     if not latest_json.exists():
         return ''
 
-    with open(latest_json) as f:
-        data = json.load(f)
-
-    refs = []
-    find_all_refs(data, refs)
+    data = load_json(latest_json)
 
-    if not refs:
-        return ''
-
-    # Group by target
-    import re
+    # Group by target while walking the tree
     ref_groups = {}
-    for ref in refs:
-        target = ref['target']
-        if target not in ref_groups:
-            ref_groups[target] = {
-                'texts': [],
-                'title': None,
-                'section': None,
-                'type': 'external'
-            }
-        ref_groups[target]['texts'].append(ref['text'])
+    for target, text in iter_refs(data):
+        group = ref_groups.get(target)
+        if group is not None:
+            group['texts'].append(text)
+            continue
+
+        group = ref_groups[target] = {
+            'texts': [text],
+            'title': None,
+            'section': None,
+            'type': 'external'
+        }
 
-        # Parse target
+        # Parse target (once per unique target)
         match = re.search(r'/t(\d+)/s(\d+)', target)
         if match:
             title, sec = match.groups()
-            ref_groups[target]['title'] = title
-            ref_groups[target]['section'] = sec
+            group['title'] = title
+            group['section'] = sec
             if title == '18':
                 # Check if we have this section
                 if Path(f'data/sections/{sec}/2024.json').exists():
-                    ref_groups[target]['type'] = 'internal'
+                    group['type'] = 'internal'
+
+    if not ref_groups:
+        return ''
 
     html = '<h2>Cross-References</h2>\n'
     html += f'<p>This section references {len(ref_groups)} other statute(s):</p>\n<ul class="ref-list">\n'
@@ -393,7 +432,7 @@ def generate_reference_section(section_num: str) -> str:
             html += f'</li>\n'
         elif info['title'] and info['section']:
             # External reference - link to uscode.house.gov
-            external_url = f'https://uscode.house.gov/view.xhtml?req={target.replace("/", ":")}'
+            external_url = escape(f'https://uscode.house.gov/view.xhtml?req={target.replace("/", ":")}')
             html += f'<li class="ref-item">'
             html += f'<a href="{external_url}" class="external-ref" target="_blank">'
             html += f'Title {info["title"]} § {info["section"]}'
@@ -402,7 +441,7 @@ def generate_reference_section(section_num: str) -> str:
             html += f'</li>\n'
         else:
             # Other reference (public law, etc.)
-            html += f'<li class="ref-item other-ref">{target}'
+            html += f'<li class="ref-item other-ref">{escape(target)}'
             html += f' <span class="ref-count">({len(info["texts"])} reference{"s" if len(info["texts"]) > 1 else ""})</span>'
             html += f'</li>\n'
 
@@ -508,7 +547,7 @@ def generate_html_report(section_num: str, provision_history: dict, stats: dict,
     # Generate table rows with hierarchy
     table_rows = []
     for path, data in sorted_provisions:
-        status_class = data['status']
+        status_class = escape(data['status'])
         level_name = LEVEL_TO_NAME.get(data['level'], 'unknown')
         timeline = generate_timeline(years, data['history'])
         level = data['level']
@@ -526,7 +565,7 @@ def generate_html_report(section_num: str, provision_history: dict, stats: dict,
             change_badge = f'<span class="badge badge-high">{changes}</span>'
 
         # Format provision with tree structure
-        provision_display = f'{tree_prefix}{format_path(path)} {change_badge}'
+        provision_display = f'{tree_prefix}{escape(format_path(path))} {change_badge}'
 
         table_rows.append(f"""
             <tr class="{status_class}">
@@ -535,7 +574,7 @@ def generate_html_report(section_num: str, provision_history: dict, stats: dict,
                 <td>{data['total_changes']}</td>
                 <td>{data['first_seen']}</td>
                 <td>{data['last_modified'] or '-'}</td>
-                <td>{data['status']}</td>
+                <td>{status_class}</td>
                 <td class="timeline">{timeline}</td>
             </tr>
         """)
@@ -546,7 +585,7 @@ def generate_html_report(section_num: str, provision_history: dict, stats: dict,
     for path, data in top_changed:
         if data['total_changes'] == 0:
             continue
-        formatted = format_path(path)
+        formatted = escape(format_path(path))
         timeline = generate_timeline(years, data['history'])
         timeline_viz.append(f"""
             <div style="margin-bottom: 15px;">
@@ -555,7 +594,7 @@ def generate_html_report(section_num: str, provision_history: dict, stats: dict,
             </div>
         """)
 
-    most_changed_str = f"{format_path(stats['most_changed'][0])} - {stats['most_changed'][1]} changes" if stats['most_changed'] else "None"
+    most_changed_str = f"{escape(format_path(stats['most_changed'][0]))} - {stats['most_changed'][1]} changes" if stats['most_changed'] else "None"
 
     html = f"""
 <!DOCTYPE html>
@@ -760,25 +799,15 @@ def generate_csv_report(provision_history: dict, output_path: Path):
         ])
 
         for path, data in sorted(provision_history.items()):
-            change_years = [
-                str(year) for year, info in sorted(data['history'].items())
-                if info.get('status') == 'modified'
-            ]
-
-            years_existed = len([
-                y for y, info in data['history'].items()
-                if info.get('status') != 'missing'
-            ])
-
             writer.writerow([
                 format_path(path),
                 data['level'],
                 data['total_changes'],
-                years_existed,
+                data['years_existed'],
                 data['first_seen'],
                 data['last_modified'] or '-',
                 data['status'],
-                ';'.join(change_years)
+                ';'.join(map(str, data['change_years']))
             ])
 
 
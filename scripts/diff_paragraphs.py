@@ -12,9 +12,25 @@ import json
 import re
 import argparse
 import difflib
+import functools
+import hashlib
+import os
+import pickle
+from dataclasses import dataclass, field
+from html import escape
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
-from bs4 import BeautifulSoup
+
+try:
+    from lxml import etree
+    from lxml import html as lxml_html
+except ImportError:
+    lxml_html = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 # Hierarchy level mappings (from docs/usc-hierarchy.md)
@@ -34,22 +50,39 @@ CLASS_TO_LEVEL = {
     'statutory-body-4em': 9,  # Subclause
 }
 
+# Compiled once; build_xhtml_tree runs these per <p> element
+STATUTORY_BODY_RE = re.compile(r'statutory-body')
+PROVISION_NUM_RE = re.compile(r'^\(([a-zA-Z0-9]+)\)\s')
+
+# Markup whitespace between inline elements (not &nbsp; and other Unicode spaces)
+_ASCII_WHITESPACE = ' \t\n\f\r'
+
+# Documents are handed to lxml as UTF-8 bytes: lxml refuses a str carrying an
+# <?xml encoding=...?> declaration, and any declared encoding must be ignored
+_HTML_PARSER = lxml_html.HTMLParser(encoding='utf-8') if lxml_html is not None else None
+
+# Diff row status codes, indexing DIFF_STATUSES and DiffBatch.counts
+ADDED, DELETED, MODIFIED, UNCHANGED = range(4)
+DIFF_STATUSES = ('added', 'deleted', 'modified', 'unchanged')
 
+# Share of word positions that must match for the positional word diff
+FAST_WORD_DIFF_MIN_MATCH = 0.8
+
+# Bump when the built tree layout changes to invalidate pickled trees
+TREE_CACHE_VERSION = 2
+
+
+@functools.lru_cache(maxsize=None)
 def extract_key_from_id(identifier: str) -> str:
     """Extract key from XML identifier.
 
-    Example: /us/usc/t18/s922/a/1/A → a
+    Example: /us/usc/t18/s922/a/1/A → A
              /us/usc/t18/s922/a/1/A/i → i
+             /us/usc/t18/s922 → '' (no key below the section)
     """
-    parts = identifier.split('/')
-    # Find section (starts with 's'), return the part after it
-    try:
-        section_idx = next(i for i, p in enumerate(parts) if p.startswith('s'))
-        if section_idx + 1 < len(parts):
-            return parts[-1]  # Return last part (the specific key at this level)
-    except (StopIteration, IndexError):
-        pass
-    return ''
+    head, _, key = identifier.rpartition('/')
+    # The last part is a key only if a section part ('s922') precedes it
+    return key if '/s' in f'/{head}' else ''
 
 
 def build_xml_tree(data: dict) -> dict:
@@ -67,6 +100,7 @@ def build_xml_tree(data: dict) -> dict:
             'children': _build_xml_children(subsection)
         }
 
+    _add_subtree_hashes(tree)
     return tree
 
 
@@ -91,21 +125,60 @@ def _build_xml_children(node: dict) -> dict:
     return children
 
 
+def _text_node(text: str) -> str:
+    """A text node as paragraph text: whitespace-only runs count as one newline or space.
+
+    This is how BeautifulSoup stores such text nodes, so both parsers agree.
+    """
+    # isspace() stops at the first visible character, so real text returns at once
+    if not text.isspace() or text.strip(_ASCII_WHITESPACE):
+        return text
+    return '\n' if '\n' in text else ' '
+
+
+def _iter_statutory_paragraphs(html: str):
+    """Yield (classes tuple, text) for each statutory-body <p> in document order.
+
+    Uses lxml when available and falls back to BeautifulSoup otherwise. Both
+    give the same text: lxml's whitespace-only text nodes are collapsed the
+    way BeautifulSoup collapses them.
+    """
+    # libxml2 turns \r\n into \n, while BeautifulSoup keeps carriage returns
+    if lxml_html is None or '\r' in html:
+        from bs4 import BeautifulSoup
+        soup = BeautifulSoup(html, 'html.parser')
+        for p in soup.find_all('p', class_=STATUTORY_BODY_RE):
+            yield tuple(p.get('class', [])), p.get_text()
+        return
+
+    try:
+        doc = lxml_html.fromstring(html.encode('utf-8'), parser=_HTML_PARSER)
+    except etree.ParserError:
+        # Nothing but whitespace or comments, so no paragraphs either
+        return
+
+    # One in-order walk instead of an XPath selection
+    for p in doc.iter('p'):
+        classes = p.get('class')
+        if not classes or 'statutory-body' not in classes:
+            continue
+        yield tuple(classes.split()), ''.join(_text_node(text) for text in p.itertext())
+
+
 def build_xhtml_tree(html: str) -> dict:
     """Build hierarchical tree from XHTML by parsing CSS classes."""
-    soup = BeautifulSoup(html, 'html.parser')
     tree = {}
 
     # Stack to track current position: [(node_dict, level), ...]
     stack = [(tree, 4)]  # Start with root at section level (4)
 
-    for p in soup.find_all('p', class_=re.compile(r'statutory-body')):
+    for classes, text in _iter_statutory_paragraphs(html):
         # Get level from CSS class
-        level = _get_level_from_class(p.get('class', []))
+        level = _get_level_from_class(classes)
 
         # Extract numbering from text
-        text = p.get_text().strip()
-        match = re.match(r'^\(([a-zA-Z0-9]+)\)\s', text)
+        text = text.strip()
+        match = PROVISION_NUM_RE.match(text)
 
         if not match:
             continue  # Skip non-numbered elements (blocks, etc.)
@@ -138,10 +211,35 @@ def build_xhtml_tree(html: str) -> dict:
         # Push to stack for potential children
         stack.append((node['children'], level))
 
+    _add_subtree_hashes(tree)
     return tree
 
 
-def _get_level_from_class(classes: list) -> int:
+def _add_subtree_hashes(tree: dict) -> None:
+    """Store a content hash of each node's whole subtree under node['hash'].
+
+    Two nodes at the same path with equal hashes produce identical diff rows
+    for their entire subtrees, which lets diff_trees skip comparing them.
+    """
+    # Pre-order list; walking it backwards visits children before parents
+    nodes = []
+    stack = list(tree.values())
+    while stack:
+        node = stack.pop()
+        nodes.append(node)
+        stack.extend(node['children'].values())
+
+    for node in reversed(nodes):
+        digest = hashlib.blake2b(f"{node['level']}\0{node['text']}".encode(), digest_size=8)
+        children = node['children']
+        for key in sorted(children):
+            digest.update(f'\0{key}\0'.encode())
+            digest.update(children[key]['hash'])
+        node['hash'] = digest.digest()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_level_from_class(classes: tuple) -> int:
     """Map CSS class to hierarchy level."""
     for cls in classes:
         if cls in CLASS_TO_LEVEL:
@@ -149,72 +247,140 @@ def _get_level_from_class(classes: list) -> int:
     return 5  # Default to subsection
 
 
-def diff_trees(old_tree: dict, new_tree: dict, path: str = '') -> List[Tuple]:
-    """Recursively diff two hierarchical trees.
+def _child_pairs(old_children: Optional[dict], new_children: Optional[dict],
+                 path: str, display: str) -> List[Tuple]:
+    """Pair up children of two nodes in output order.
 
-    Returns list of (status, path, level, old_node, new_node) tuples.
-    Status: 'added', 'deleted', 'modified', 'unchanged'
+    Returns (path, display_path, old_node, new_node) tuples, where
+    display_path is the formatted form, e.g. a/1 -> (a)(1). A side of None
+    marks a wholly added/deleted subtree, whose children keep their document
+    order; otherwise keys from both sides are sorted.
     """
-    results = []
-
-    all_keys = sorted(set(old_tree.keys()) | set(new_tree.keys()))
-
-    for key in all_keys:
-        current_path = f'{path}/{key}' if path else key
-        old_node = old_tree.get(key)
-        new_node = new_tree.get(key)
+    if old_children is None:
+        return [
+            (f'{path}/{key}' if path else key, f'{display}({key})', None, child)
+            for key, child in new_children.items()
+        ]
+    if new_children is None:
+        return [
+            (f'{path}/{key}' if path else key, f'{display}({key})', child, None)
+            for key, child in old_children.items()
+        ]
+
+    all_keys = sorted(old_children.keys() | new_children.keys())
+    return [
+        (f'{path}/{key}' if path else key, f'{display}({key})', old_children.get(key), new_children.get(key))
+        for key in all_keys
+    ]
+
+
+@dataclass
+class DiffBatch:
+    """Diff results as parallel per-row lists, in hierarchical pre-order.
+
+    Row i is (statuses[i], paths[i], display_paths[i], levels[i],
+    old_texts[i], new_texts[i]); display paths are preformatted, e.g. (a)(1).
+    Statuses are the ADDED/DELETED/MODIFIED/UNCHANGED codes. Texts are ''
+    on the side where the provision does not exist. ``counts`` holds the
+    row count per status code, accumulated by diff_trees as rows are added.
+    """
+    statuses: List[int] = field(default_factory=list)
+    paths: List[str] = field(default_factory=list)
+    display_paths: List[str] = field(default_factory=list)
+    levels: List[int] = field(default_factory=list)
+    old_texts: List[str] = field(default_factory=list)
+    new_texts: List[str] = field(default_factory=list)
+    counts: List[int] = field(default_factory=lambda: [0] * len(DIFF_STATUSES))
+
+    def __len__(self) -> int:
+        return len(self.statuses)
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Row counts keyed by status name."""
+        return dict(zip(DIFF_STATUSES, self.counts))
+
+
+def diff_trees(old_tree: dict, new_tree: dict, path: str = '') -> DiffBatch:
+    """Diff two hierarchical trees in pre-order using an explicit stack."""
+    diffs = DiffBatch()
+    add_status = diffs.statuses.append
+    add_path = diffs.paths.append
+    add_display = diffs.display_paths.append
+    add_level = diffs.levels.append
+    add_old = diffs.old_texts.append
+    add_new = diffs.new_texts.append
+    counts = diffs.counts
+
+    # Pending (path, display_path, old_node, new_node) entries, pushed in reverse so that
+    # pops come out in pre-order
+    stack = _child_pairs(old_tree, new_tree, path, format_path(path) if path else '')
+    stack.reverse()
+
+    while stack:
+        current_path, current_display, old_node, new_node = stack.pop()
 
         if old_node is None:
-            # Added node
-            level = new_node['level']
-            results.append(('added', current_path, level, None, new_node))
-            # Add all descendants as added
-            results.extend(_get_all_descendants(new_node, current_path, 'added'))
+            # Added node; all descendants are added too
+            add_status(ADDED)
+            counts[ADDED] += 1
+            add_level(new_node['level'])
+            add_old('')
+            add_new(new_node['text'])
+            children = _child_pairs(None, new_node.get('children', {}), current_path, current_display)
 
         elif new_node is None:
-            # Deleted node
-            level = old_node['level']
-            results.append(('deleted', current_path, level, old_node, None))
-            # Add all descendants as deleted
-            results.extend(_get_all_descendants(old_node, current_path, 'deleted'))
+            # Deleted node; all descendants are deleted too
+            add_status(DELETED)
+            counts[DELETED] += 1
+            add_level(old_node['level'])
+            add_old(old_node['text'])
+            add_new('')
+            children = _child_pairs(old_node.get('children', {}), None, current_path, current_display)
+
+        elif old_node['hash'] == new_node['hash']:
+            # Identical subtree: emit it all as unchanged without comparing
+            identical = [(current_path, current_display, old_node)]
+            while identical:
+                node_path, node_display, node = identical.pop()
+                add_status(UNCHANGED)
+                counts[UNCHANGED] += 1
+                add_path(node_path)
+                add_display(node_display)
+                add_level(node['level'])
+                add_old(node['text'])
+                add_new(node['text'])
+                node_children = node['children']
+                identical.extend(
+                    (f'{node_path}/{key}', f'{node_display}({key})', node_children[key])
+                    for key in sorted(node_children, reverse=True)
+                )
+            continue
 
         else:
-            # Node exists in both - check if modified
-            level = old_node['level']
-            old_text = old_node['text'].strip()
-            new_text = new_node['text'].strip()
-
-            if old_text != new_text:
-                results.append(('modified', current_path, level, old_node, new_node))
-            else:
-                results.append(('unchanged', current_path, level, old_node, new_node))
-
-            # Recursively diff children
-            results.extend(diff_trees(
+            # Node exists in both - check if modified (text is stripped at build time)
+            old_text = old_node['text']
+            new_text = new_node['text']
+
+            status = MODIFIED if old_text != new_text else UNCHANGED
+            add_status(status)
+            counts[status] += 1
+            add_level(old_node['level'])
+            add_old(old_text)
+            add_new(new_text)
+
+            children = _child_pairs(
                 old_node.get('children', {}),
                 new_node.get('children', {}),
-                current_path
-            ))
-
-    return results
+                current_path,
+                current_display
+            )
 
+        add_path(current_path)
+        add_display(current_display)
+        stack.extend(reversed(children))
 
-def _get_all_descendants(node: dict, path: str, status: str) -> List[Tuple]:
-    """Get all descendant nodes as diff results."""
-    results = []
-    for key, child in node.get('children', {}).items():
-        child_path = f'{path}/{key}'
-        level = child['level']
-
-        if status == 'added':
-            results.append((status, child_path, level, None, child))
-        else:  # deleted
-            results.append((status, child_path, level, child, None))
-
-        # Recurse for grandchildren
-        results.extend(_get_all_descendants(child, child_path, status))
-
-    return results
+    return diffs
 
 
 def format_path(path: str) -> str:
@@ -226,35 +392,77 @@ def format_path(path: str) -> str:
     return ''.join(f'({p})' for p in parts)
 
 
+def _positional_word_opcodes(old_words: List[str], new_words: List[str]) -> Optional[List[Tuple]]:
+    """Cheap opcodes for near-identical word lists, or None if not applicable.
+
+    Compares words index by index, which is only a good alignment when the
+    lengths differ by at most one word and nearly all positions still match
+    (e.g. a single word substituted). Opcodes have SequenceMatcher's shape.
+    """
+    old_len, new_len = len(old_words), len(new_words)
+    if abs(old_len - new_len) > 1:
+        return None
+
+    max_len = max(old_len, new_len)
+    same = [a == b for a, b in zip(old_words, new_words)]
+    same.extend([False] * (max_len - len(same)))
+    if sum(same) < FAST_WORD_DIFF_MIN_MATCH * max_len:
+        return None
+
+    opcodes = []
+    start = 0
+    for i in range(1, max_len + 1):
+        if i < max_len and same[i] == same[start]:
+            continue
+        if same[start]:
+            opcodes.append(('equal', start, i, start, i))
+        else:
+            i2, j2 = min(i, old_len), min(i, new_len)
+            if start < i2 and start < j2:
+                opcodes.append(('replace', start, i2, start, j2))
+            elif start < i2:
+                opcodes.append(('delete', start, i2, start, start))
+            else:
+                opcodes.append(('insert', start, start, start, j2))
+        start = i
+
+    return opcodes
+
+
 def word_diff_html(old_text: str, new_text: str) -> Tuple[str, str]:
     """Generate word-level diff with HTML highlighting."""
     old_words = old_text.split()
     new_words = new_text.split()
 
-    differ = difflib.SequenceMatcher(None, old_words, new_words)
+    # Small in-place edits skip SequenceMatcher's LCS search entirely.
+    # Otherwise disable autojunk: its popularity heuristic only adds overhead
+    # on short paragraphs and can mis-align common words like "the"
+    opcodes = _positional_word_opcodes(old_words, new_words)
+    if opcodes is None:
+        opcodes = difflib.SequenceMatcher(None, old_words, new_words, autojunk=False).get_opcodes()
+    join = ' '.join
 
     old_html = []
     new_html = []
 
-    for tag, i1, i2, j1, j2 in differ.get_opcodes():
+    for tag, i1, i2, j1, j2 in opcodes:
         if tag == 'equal':
-            old_html.append(' '.join(old_words[i1:i2]))
-            new_html.append(' '.join(new_words[j1:j2]))
+            old_html.append(escape(join(old_words[i1:i2])))
+            new_html.append(escape(join(new_words[j1:j2])))
         elif tag == 'delete':
-            old_html.append(f'<span class="diff-remove">{" ".join(old_words[i1:i2])}</span>')
+            old_html.append(f'<span class="diff-remove">{escape(join(old_words[i1:i2]))}</span>')
         elif tag == 'insert':
-            new_html.append(f'<span class="diff-add">{" ".join(new_words[j1:j2])}</span>')
+            new_html.append(f'<span class="diff-add">{escape(join(new_words[j1:j2]))}</span>')
         elif tag == 'replace':
-            old_html.append(f'<span class="diff-remove">{" ".join(old_words[i1:i2])}</span>')
-            new_html.append(f'<span class="diff-add">{" ".join(new_words[j1:j2])}</span>')
+            old_html.append(f'<span class="diff-remove">{escape(join(old_words[i1:i2]))}</span>')
+            new_html.append(f'<span class="diff-add">{escape(join(new_words[j1:j2]))}</span>')
 
-    return ' '.join(old_html), ' '.join(new_html)
+    return join(old_html), join(new_html)
 
 
-def generate_html_report(section_num: str, year1: int, year2: int, diff_results: List[Tuple]) -> str:
-    """Generate HTML report with hierarchical indentation."""
-
-    html = f"""<!DOCTYPE html>
+# HTML report templates: the head and stats blocks are formatted once per
+# report, row templates once per diff row
+REPORT_HEAD_TEMPLATE = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -374,16 +582,11 @@ def generate_html_report(section_num: str, year1: int, year2: int, diff_results:
         <div class="summary-stats">
 """
 
-    # Calculate statistics
-    stats = {'added': 0, 'deleted': 0, 'modified': 0, 'unchanged': 0}
-    for status, _, _, _, _ in diff_results:
-        stats[status] += 1
-
-    html += f"""
-            <div class="stat stat-added">Added: {stats['added']}</div>
-            <div class="stat stat-deleted">Deleted: {stats['deleted']}</div>
-            <div class="stat stat-modified">Modified: {stats['modified']}</div>
-            <div class="stat">Unchanged: {stats['unchanged']}</div>
+REPORT_STATS_TEMPLATE = """
+            <div class="stat stat-added">Added: {added}</div>
+            <div class="stat stat-deleted">Deleted: {deleted}</div>
+            <div class="stat stat-modified">Modified: {modified}</div>
+            <div class="stat">Unchanged: {unchanged}</div>
         </div>
     </div>
 
@@ -398,61 +601,87 @@ def generate_html_report(section_num: str, year1: int, year2: int, diff_results:
         <tbody>
 """
 
-    # Generate rows with hierarchy
-    for status, path, level, old_node, new_node in diff_results:
-        indent_level = level - 5  # Subsection=0, paragraph=1, etc.
-        indent_class = f'indent-{indent_level}'
-        level_class = f'level-{level}'
-        display_path = format_path(path)
-
-        if status == 'added':
-            html += f"""
+# Per-row report templates, keyed by diff status code
+ROW_TEMPLATES = {
+    ADDED: """
             <tr class="added {level_class}">
                 <td class="para-num {indent_class}">{display_path}</td>
                 <td class="empty-cell">—</td>
-                <td>{new_node['text']}</td>
+                <td>{new_html}</td>
             </tr>
-"""
-        elif status == 'deleted':
-            html += f"""
+""",
+    DELETED: """
             <tr class="deleted {level_class}">
                 <td class="para-num {indent_class}">{display_path}</td>
-                <td>{old_node['text']}</td>
+                <td>{old_html}</td>
                 <td class="empty-cell">—</td>
             </tr>
-"""
-        elif status == 'modified':
-            old_html, new_html = word_diff_html(old_node['text'], new_node['text'])
-            html += f"""
+""",
+    MODIFIED: """
             <tr class="modified {level_class}">
                 <td class="para-num {indent_class}">{display_path}</td>
                 <td>{old_html}</td>
                 <td>{new_html}</td>
             </tr>
-"""
-        else:  # unchanged
-            html += f"""
+""",
+    UNCHANGED: """
             <tr class="unchanged {level_class}">
                 <td class="para-num {indent_class}">{display_path}</td>
-                <td>{old_node['text']}</td>
-                <td>{new_node['text']}</td>
+                <td>{old_html}</td>
+                <td>{new_html}</td>
             </tr>
-"""
+""",
+}
 
-    html += """
+REPORT_FOOT = """
         </tbody>
     </table>
 </body>
 </html>
 """
 
-    return html
 
+def generate_html_report(section_num: str, year1: int, year2: int, diffs: DiffBatch) -> str:
+    """Generate HTML report with hierarchical indentation."""
+
+    out = [REPORT_HEAD_TEMPLATE.format(section_num=section_num, year1=year1, year2=year2)]
+
+    out.append(REPORT_STATS_TEMPLATE.format(year1=year1, year2=year2, **diffs.stats))
+
+    # Generate rows with hierarchy
+    statuses, display_paths, levels = diffs.statuses, diffs.display_paths, diffs.levels
+    old_texts, new_texts = diffs.old_texts, diffs.new_texts
+
+    for i in range(len(diffs)):
+        status = statuses[i]
+        level = levels[i]
+
+        # Texts are escaped on every row; word_diff_html escapes the words it marks up
+        if status == MODIFIED:
+            old_html, new_html = word_diff_html(old_texts[i], new_texts[i])
+        else:
+            old_html, new_html = escape(old_texts[i]), escape(new_texts[i])
+
+        out.append(ROW_TEMPLATES[status].format(
+            level_class=f'level-{level}',
+            indent_class=f'indent-{level - 5}',  # Subsection=0, paragraph=1, etc.
+            display_path=display_paths[i],
+            old_html=old_html,
+            new_html=new_html,
+        ))
+
+    out.append(REPORT_FOOT)
+
+    return ''.join(out)
 
-def load_section_tree(section_file: Path) -> dict:
-    """Load section JSON and build hierarchical tree."""
-    with open(section_file, 'r') as f:
-        data = json.load(f)
+
+def _build_section_tree(section_file: Path) -> dict:
+    """Parse section JSON and build hierarchical tree."""
+    if orjson is not None:
+        data = orjson.loads(section_file.read_bytes())
+    else:
+        with open(section_file, 'r') as f:
+            data = json.load(f)
 
     # Check format
     if data.get('metadata', {}).get('format') == 'xml':
@@ -462,6 +691,45 @@ def load_section_tree(section_file: Path) -> dict:
         return build_xhtml_tree(data.get('raw_html', ''))
 
 
+def load_section_tree(section_file: Path) -> dict:
+    """Load section JSON and build hierarchical tree.
+
+    Built trees are pickled to a .cache/ directory beside the JSON file and
+    reused while the source file's mtime and size (and TREE_CACHE_VERSION)
+    are unchanged.
+    """
+    stat = section_file.stat()
+    source_key = (TREE_CACHE_VERSION, stat.st_mtime_ns, stat.st_size)
+    cache_file = section_file.parent / '.cache' / f'{section_file.stem}.pkl'
+
+    try:
+        with open(cache_file, 'rb') as f:
+            if pickle.load(f) == source_key:
+                return pickle.load(f)
+    except Exception:
+        # Missing or unreadable; a truncated or corrupt pickle can raise
+        # nearly any exception type. Rebuild below
+        pass
+
+    tree = _build_section_tree(section_file)
+
+    # Write under a per-process name and rename into place, so an interrupted
+    # or concurrent run never leaves a partially written pickle behind
+    tmp_file = cache_file.with_name(f'{cache_file.name}.{os.getpid()}.tmp')
+    try:
+        cache_file.parent.mkdir(exist_ok=True)
+        with open(tmp_file, 'wb') as f:
+            pickle.dump(source_key, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(tree, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        # Caching is best-effort (e.g. read-only data directory)
+        if tmp_file.exists():
+            tmp_file.unlink(missing_ok=True)
+
+    return tree
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Generate hierarchical diff of USC sections',
@@ -515,10 +783,8 @@ Examples:
     print("\nComputing hierarchical diff...")
     diff_results = diff_trees(old_tree, new_tree)
 
-    # Statistics
-    stats = {'added': 0, 'deleted': 0, 'modified': 0, 'unchanged': 0}
-    for status, _, _, _, _ in diff_results:
-        stats[status] += 1
+    # Statistics (counted during the diff)
+    stats = diff_results.stats
 
     print(f"  ✓ Added: {stats['added']}")
     print(f"  ✓ Deleted: {stats['deleted']}")
@@ -548,9 +814,12 @@ Examples:
 
 def _count_nodes(tree: dict) -> int:
     """Count total nodes in tree."""
-    count = len(tree)
-    for node in tree.values():
-        count += _count_nodes(node.get('children', {}))
+    count = 0
+    stack = [tree]
+    while stack:
+        level = stack.pop()
+        count += len(level)
+        stack.extend(node['children'] for node in level.values() if node.get('children'))
     return count
 
 
@@ -12,13 +12,16 @@ Usage:
 """
 
 import argparse
+import re
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from urllib.request import urlretrieve, Request, urlopen
-from urllib.error import URLError, HTTPError
 import zipfile
 
+import requests
+
 # Target years for statutory history of 18 USC 922 and 933
 RECOMMENDED_YEARS = {
     2024: {"format": "xml", "pl": "119-46", "description": "Current version"},
@@ -30,6 +33,25 @@ RECOMMENDED_YEARS = {
     1994: {"format": "xhtml", "description": "Assault Weapons Ban"},
 }
 
+# Archive member names that belong to Title 18, by download format.
+# USLM XML ships usc18.xml; annual XHTML archives ship e.g. 2018usc18.htm.
+TITLE18_MEMBER_PATTERNS = {
+    "xml": re.compile(r"(?:usc|title)18\.xml$", re.IGNORECASE),
+    "xhtml": re.compile(r"title18|usc18\.html?$", re.IGNORECASE),
+}
+
+DOWNLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+
+_thread_local = threading.local()
+
+
+def _get_session() -> requests.Session:
+    """Return this thread's HTTP session so retries reuse the connection."""
+    session = getattr(_thread_local, "session", None)
+    if session is None:
+        session = _thread_local.session = requests.Session()
+    return session
+
 
 def construct_xml_url(title: int, pl_code: str) -> str:
     """Construct URL for USLM XML download (Public Law release point)."""
@@ -45,112 +67,125 @@ def construct_xhtml_url(year: int) -> str:
     return f"https://uscode.house.gov/download/annualhistoricalarchives/XHTML/{year}.zip"
 
 
-def download_with_progress(url: str, output_path: Path, max_retries: int = 3) -> bool:
-    """Download file with progress reporting and retry logic."""
+def download_with_progress(url: str, output_path: Path, max_retries: int = 3, log=print) -> bool:
+    """Download file with retry logic, reporting the final size.
+
+    Data is streamed to a ``.part`` file that is renamed on completion; an
+    existing ``.part`` file is resumed with an HTTP Range request.
+    """
+    session = _get_session()
+    part_path = output_path.with_name(output_path.name + ".part")
+
     for attempt in range(1, max_retries + 1):
         try:
-            print(f"  [Attempt {attempt}/{max_retries}] {url}")
+            log(f"  [Attempt {attempt}/{max_retries}] {url}")
+
+            offset = part_path.stat().st_size if part_path.exists() else 0
+            headers = {"Range": f"bytes={offset}-"} if offset else {}
+
+            with session.get(url, headers=headers, stream=True, timeout=60) as resp:
+                # 416: the partial file already holds the whole resource
+                if resp.status_code != 416:
+                    resp.raise_for_status()
 
-            def progress_hook(block_num, block_size, total_size):
-                if total_size > 0:
-                    downloaded = block_num * block_size
-                    percent = min(100, downloaded * 100 / total_size)
-                    print(f"\r  Progress: {percent:.1f}%", end="", flush=True)
+                    # 206 means the server honoured the Range header
+                    if resp.status_code == 206:
+                        log(f"  → Resuming from {offset / 1024 / 1024:.2f} MB")
+                        mode = "ab"
+                    else:
+                        mode = "wb"
 
-            urlretrieve(url, output_path, reporthook=progress_hook)
-            print()  # Newline after progress
+                    with open(part_path, mode) as f:
+                        for chunk in resp.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                            f.write(chunk)
+
+            part_path.replace(output_path)
 
             if output_path.exists() and output_path.stat().st_size > 0:
                 size_mb = output_path.stat().st_size / 1024 / 1024
-                print(f"  ✓ Downloaded: {output_path.name} ({size_mb:.2f} MB)")
+                log(f"  ✓ Downloaded: {output_path.name} ({size_mb:.2f} MB)")
                 return True
             else:
-                print(f"  ✗ Failed: File is empty")
+                log(f"  ✗ Failed: File is empty")
                 return False
 
-        except HTTPError as e:
-            print(f"\n  ✗ HTTP {e.code}: {e.reason}")
-            if e.code == 404:
-                print(f"  → File not available at this URL")
+        except requests.HTTPError as e:
+            log(f"  ✗ HTTP {e.response.status_code}: {e.response.reason}")
+            if e.response.status_code == 404:
+                log(f"  → File not available at this URL")
                 return False
-        except URLError as e:
-            print(f"\n  ✗ Network error: {e.reason}")
+        except requests.RequestException as e:
+            log(f"  ✗ Network error: {e}")
         except Exception as e:
-            print(f"\n  ✗ Error: {e}")
+            log(f"  ✗ Error: {e}")
 
         if attempt < max_retries:
             wait = attempt * 2
-            print(f"  → Retrying in {wait}s...")
+            log(f"  → Retrying in {wait}s...")
             time.sleep(wait)
 
-    print(f"  ✗ Failed after {max_retries} attempts")
+    log(f"  ✗ Failed after {max_retries} attempts")
     return False
 
 
-def extract_title18(zip_path: Path, extract_dir: Path, year: int, format_type: str) -> bool:
+def extract_title18(zip_path: Path, extract_dir: Path, year: int, format_type: str, log=print) -> bool:
     """Extract Title 18 files from ZIP archive."""
     try:
-        print(f"  Extracting Title 18 from {zip_path.name}...")
-
-        with zipfile.ZipFile(zip_path, 'r') as zf:
-            # List all files
-            all_files = zf.namelist()
+        log(f"  Extracting Title 18 from {zip_path.name}...")
 
-            # Find Title 18 files
-            if format_type == "xml":
-                # USLM XML: look for usc18.xml or title18.xml
-                title18_files = [f for f in all_files if 'usc18.xml' in f.lower() or 'title18.xml' in f.lower()]
-            else:
-                # XHTML: look for files in title18 directory
-                title18_files = [f for f in all_files if '/title18/' in f.lower() or 'title18' in f.lower()]
-
-            if not title18_files:
-                print(f"  ✗ No Title 18 files found in archive")
-                # Extract everything to inspect
-                zf.extractall(extract_dir)
-                print(f"  → Extracted all files to {extract_dir}")
-                return True
+        is_title18 = TITLE18_MEMBER_PATTERNS[format_type].search
 
-            # Extract Title 18 files
-            for file in title18_files:
-                zf.extract(file, extract_dir)
+        with zipfile.ZipFile(zip_path, 'r') as zf:
+            # Single pass over the archive; only Title 18 members hit disk
+            title18_files = []
+            for info in zf.infolist():
+                if is_title18(info.filename):
+                    zf.extract(info, extract_dir)
+                    title18_files.append(info.filename)
+
+        if not title18_files:
+            log(f"  ✗ No Title 18 files found in archive")
+            return False
 
-            print(f"  ✓ Extracted {len(title18_files)} Title 18 file(s)")
-            for f in title18_files[:5]:  # Show first 5
-                print(f"    - {f}")
-            if len(title18_files) > 5:
-                print(f"    ... and {len(title18_files) - 5} more")
+        log(f"  ✓ Extracted {len(title18_files)} Title 18 file(s)")
+        for f in title18_files[:5]:  # Show first 5
+            log(f"    - {f}")
+        if len(title18_files) > 5:
+            log(f"    ... and {len(title18_files) - 5} more")
 
         return True
 
     except zipfile.BadZipFile:
-        print(f"  ✗ Invalid ZIP file")
+        log(f"  ✗ Invalid ZIP file")
         return False
     except Exception as e:
-        print(f"  ✗ Extraction error: {e}")
+        log(f"  ✗ Extraction error: {e}")
         return False
 
 
-def download_version(title: int, year: int, output_dir: Path) -> bool:
-    """Download a specific year version of Title 18."""
+def download_version(title: int, year: int, output_dir: Path, log=print) -> bool:
+    """Download a specific year version of Title 18.
+
+    Output goes through ``log`` so parallel downloads can buffer it per year.
+    """
     config = RECOMMENDED_YEARS.get(year)
     if not config:
-        print(f"✗ Year {year} not in recommended years")
+        log(f"✗ Year {year} not in recommended years")
         return False
 
     format_type = config["format"]
     description = config.get("description", "")
 
-    print(f"\n{'='*70}")
-    print(f"Year {year} - {description}")
-    print(f"Format: {format_type.upper()}")
-    print(f"{'='*70}")
+    log(f"\n{'='*70}")
+    log(f"Year {year} - {description}")
+    log(f"Format: {format_type.upper()}")
+    log(f"{'='*70}")
 
     # Construct URL based on format
     if format_type == "xml":
         pl_code = config.get("pl")
         if not pl_code:
-            print(f"✗ No Public Law code specified for {year}")
+            log(f"✗ No Public Law code specified for {year}")
             return False
         url = construct_xml_url(title, pl_code)
         zip_filename = f"title{title}-{year}-pl{pl_code}.zip"
@@ -165,18 +200,18 @@ def download_version(title: int, year: int, output_dir: Path) -> bool:
 
     # Check if already downloaded
     if zip_path.exists():
-        print(f"  → ZIP exists: {zip_path.name}")
+        log(f"  → ZIP exists: {zip_path.name}")
         if extract_dir.exists() and any(extract_dir.iterdir()):
-            print(f"  → Already extracted to: {extract_dir}")
+            log(f"  → Already extracted to: {extract_dir}")
             return True
 
     # Download
-    success = download_with_progress(url, zip_path)
+    success = download_with_progress(url, zip_path, log=log)
 
     if success:
         # Extract Title 18
         extract_dir.mkdir(exist_ok=True)
-        extract_title18(zip_path, extract_dir, year, format_type)
+        extract_title18(zip_path, extract_dir, year, format_type, log=log)
 
     return success
 
@@ -227,11 +262,20 @@ Examples:
     print(f"Output: {args.output}")
     print(f"Years: {', '.join(map(str, years))}")
 
-    # Download each year
-    results = {}
-    for year in years:
-        success = download_version(args.title, year, args.output)
-        results[year] = success
+    # Download years in parallel (I/O-bound); each year's output is
+    # buffered and printed as a block once that year finishes
+    results = dict.fromkeys(years, False)
+    with ThreadPoolExecutor(max_workers=min(8, len(years))) as executor:
+        futures = {}
+        for year in years:
+            lines = []
+            future = executor.submit(download_version, args.title, year, args.output, lines.append)
+            futures[future] = (year, lines)
+
+        for future in as_completed(futures):
+            year, lines = futures[future]
+            results[year] = future.result()
+            print('\n'.join(lines))
 
     # Summary
     print(f"\n{'='*70}")
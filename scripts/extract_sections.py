@@ -5,67 +5,168 @@ Outputs structured JSON preserving hierarchy, references, and metadata.
 """
 
 import json
+import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
 from pathlib import Path
 from lxml import etree
-from bs4 import BeautifulSoup
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+USLM_NS = 'http://xml.house.gov/schemas/uslm/1.0'
+_NS = {'uslm': USLM_NS}
+
+# Compiled once; num/heading/chapeau/content are looked up on the direct children only
+_SECTION_BY_ID_XP = etree.XPath('//uslm:section[@identifier=$identifier]', namespaces=_NS)
+_NUM_XP = etree.XPath('uslm:num', namespaces=_NS)
+_HEADING_XP = etree.XPath('uslm:heading', namespaces=_NS)
+_CHAPEAU_XP = etree.XPath('uslm:chapeau', namespaces=_NS)
+_CONTENT_XP = etree.XPath('uslm:content', namespaces=_NS)
+_REFS_XP = etree.XPath('.//uslm:ref[@href]', namespaces=_NS)
+
+# Nested provision levels, in the order they are emitted under a parent
+USLM_CHILD_TAGS = ('subsection', 'paragraph', 'subparagraph', 'clause', 'subclause')
+_USLM_CHILD_QNAMES = tuple(f'{{{USLM_NS}}}{tag}' for tag in USLM_CHILD_TAGS)
+_SECTION_TAG = f'{{{USLM_NS}}}section'
+
+# XHTML CSS class to hierarchy level mapping
+CLASS_TO_LEVEL = {
+    'statutory-body': 5,          # subsection
+    'statutory-body-1em': 6,      # paragraph
+    'statutory-body-2em': 7,      # subparagraph
+    'statutory-body-3em': 8,      # clause
+    'statutory-body-4em': 9,      # subclause
+}
+
+LEVEL_TO_TAG = {
+    5: 'subsection',
+    6: 'paragraph',
+    7: 'subparagraph',
+    8: 'clause',
+    9: 'subclause',
+}
+
+# Markup whitespace between inline elements (not &nbsp; and other Unicode spaces)
+_ASCII_WHITESPACE = ' \t\n\f\r'
+
+# Section numbers mentioned in a heading's "§922." text
+_SECTION_HEAD_NUM_RE = re.compile(r'§([^\s.§]+)\.')
+
+# Section number in a USLM identifier, e.g. /us/usc/t18/s922 -> 922
+_SECTION_ID_RE = re.compile(r'/s(\d+[a-z]?)')
+
+# Leading provision number of an XHTML paragraph: (a), (1), (A), ...
+_PROVISION_RE = re.compile(r'^\(([a-zA-Z0-9]+)\)')
+
+
+def _dump_json(output_file: Path, data: dict, pretty: bool = False) -> None:
+    """Serialize JSON in memory (orjson when installed) and write it in one call."""
+    if orjson is not None:
+        output_file.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0))
+    else:
+        if pretty:
+            text = json.dumps(data, indent=2, ensure_ascii=False)
+        else:
+            text = json.dumps(data, separators=(',', ':'), ensure_ascii=False)
+        output_file.write_text(text, encoding='utf-8')
+
+
+def write_section_json(section_dir: Path, section_num: str, year: int, data: dict,
+                       pretty: bool = False) -> Path:
+    """
+    Write <year>.json for an extracted section plus its <year>.meta sidecar.
+
+    Output is compact unless pretty is set; the files are read by the other
+    scripts rather than by people.
+
+    The sidecar holds just num/heading/year so the index can be built without
+    decoding every section body; it is not named *.json so tools that glob a
+    section's versions never see it.
+    """
+    output_file = section_dir / f'{year}.json'
+    _dump_json(output_file, data, pretty)
+
+    meta = {'num': section_num, 'year': year}
+    if 'heading' in data:
+        meta['heading'] = data['heading']
+    _dump_json(section_dir / f'{year}.meta', meta)
+
+    return output_file
+
+
+def _is_up_to_date(output_file: Path, source_mtime: float) -> bool:
+    """True if output_file exists and is at least as new as its source."""
+    try:
+        return output_file.stat().st_mtime >= source_mtime
+    except FileNotFoundError:
+        return False
+
+
+def _group_child_provisions(elem) -> dict:
+    """Bucket the direct provision children of a USLM element by tag, in one pass."""
+    buckets = {tag: [] for tag in USLM_CHILD_TAGS}
+    for child in elem.iterchildren(*_USLM_CHILD_QNAMES):
+        buckets[etree.QName(child).localname].append(child)
+    return buckets
+
+
+def _parse_uslm_element(elem) -> dict:
+    """Recursively parse a USLM section or provision element."""
+    # Strip namespace from tag
+    tag = elem.tag.split('}')[-1] if '}' in elem.tag else elem.tag
+
+    result = {
+        'id': elem.get('identifier', ''),
+        'tag': tag,
+    }
+
+    # Extract num if present
+    num_elems = _NUM_XP(elem)
+    if num_elems:
+        result['num'] = ''.join(num_elems[0].itertext())
+
+    # Extract heading if present
+    heading_elems = _HEADING_XP(elem)
+    if heading_elems:
+        result['heading'] = ''.join(heading_elems[0].itertext())
+
+    # Extract text with references; subsections/paragraphs use <chapeau>,
+    # subparagraphs/clauses use <content>, and chapeau wins if both exist
+    text_elems = _CHAPEAU_XP(elem) or _CONTENT_XP(elem)
+    if text_elems:
+        text_elem = text_elems[0]
+        result['text'] = ''.join(text_elem.itertext())
+        refs = _REFS_XP(text_elem)
+        if refs:
+            result['refs'] = [
+                {'target': ref.get('href'), 'text': ref.text or ''}
+                for ref in refs
+            ]
+
+    # Recursively extract direct child elements
+    for child_tag, children in _group_child_provisions(elem).items():
+        if children:
+            result[child_tag + 's'] = [_parse_uslm_element(child) for child in children]
+
+    return result
 
 
 def extract_xml_section(xml_file: Path, section_num: str, year: int) -> dict:
     """Extract section from USLM XML format."""
     tree = etree.parse(xml_file)
 
-    # Handle namespace
-    ns = {'uslm': 'http://xml.house.gov/schemas/uslm/1.0'}
-    section = tree.xpath(f'//uslm:section[@identifier="/us/usc/t18/s{section_num}"]', namespaces=ns)
+    section = _SECTION_BY_ID_XP(tree, identifier=f'/us/usc/t18/s{section_num}')
 
     if not section:
         return None
 
     section = section[0]
 
-    def parse_element(elem):
-        """Recursively parse USLM element."""
-        # Strip namespace from tag
-        tag = elem.tag.split('}')[-1] if '}' in elem.tag else elem.tag
-
-        result = {
-            'id': elem.get('identifier', ''),
-            'tag': tag,
-        }
-
-        # Extract num if present
-        num_elem = elem.find('.//{http://xml.house.gov/schemas/uslm/1.0}num')
-        if num_elem is not None:
-            result['num'] = num_elem.text
-
-        # Extract heading if present
-        heading_elem = elem.find('.//{http://xml.house.gov/schemas/uslm/1.0}heading')
-        if heading_elem is not None:
-            result['heading'] = heading_elem.text
-
-        # Extract content with references
-        content_elem = elem.find('.//{http://xml.house.gov/schemas/uslm/1.0}content')
-        if content_elem is not None:
-            result['text'] = ''.join(content_elem.itertext())
-            refs = content_elem.findall('.//{http://xml.house.gov/schemas/uslm/1.0}ref[@href]')
-            if refs:
-                result['refs'] = [
-                    {'target': ref.get('href'), 'text': ref.text}
-                    for ref in refs
-                ]
-
-        # Recursively extract child elements
-        for child_tag in ['subsection', 'paragraph', 'subparagraph', 'clause', 'subclause']:
-            children = elem.findall(f'.//{{{ns["uslm"]}}}{child_tag}')
-            # Only include direct children, not nested
-            direct_children = [c for c in children if c.getparent() == elem]
-            if direct_children:
-                result[child_tag + 's'] = [parse_element(child) for child in direct_children]
-
-        return result
-
-    data = parse_element(section)
+    data = _parse_uslm_element(section)
     data['metadata'] = {
         'year': year,
         'source': xml_file.name,
@@ -75,10 +176,52 @@ def extract_xml_section(xml_file: Path, section_num: str, year: int) -> dict:
     return data
 
 
-def extract_xhtml_section(xhtml_file: Path, section_num: str, year: int) -> dict:
-    """Extract section from XHTML format, converting to same structure as XML."""
-    import re
+def _text_node(text: str) -> str:
+    """A text node as provision text: whitespace-only runs count as one newline or space."""
+    # isspace() stops at the first visible character, so real text returns at once
+    if not text.isspace() or text.strip(_ASCII_WHITESPACE):
+        return text
+    return '\n' if '\n' in text else ' '
+
+
+def _text_content(elem) -> str:
+    """All text inside an element, with whitespace-only text nodes collapsed."""
+    return ''.join(_text_node(text) for text in elem.itertext())
+
+
+def _only_string(elem):
+    """
+    Return the text of an element whose entire content is a single string.
 
+    Descends through elements wrapping nothing but one child, as in
+    <h3><span>text</span></h3>; returns None for empty or mixed content.
+    """
+    while len(elem) == 1 and not elem.text and not elem[0].tail:
+        elem = elem[0]
+    return None if len(elem) else elem.text
+
+
+def _text_and_refs(elem) -> tuple:
+    """Return the stripped text of an XHTML paragraph and its <a href> references."""
+    text = _text_content(elem).strip()
+
+    # Paragraphs without child elements (most of them) cannot contain links
+    if not len(elem):
+        return text, []
+
+    refs = []
+    for link in elem.iter('a'):
+        href = link.get('href', '')
+        if href:
+            refs.append({
+                'target': href,
+                'text': _text_content(link)
+            })
+    return text, refs
+
+
+def _read_xhtml(xhtml_file: Path) -> bytes:
+    """Read an XHTML title file, returning its content re-encoded as UTF-8."""
     # Try multiple encodings
     content = None
     for encoding in ['utf-8', 'latin-1', 'cp1252']:
@@ -92,136 +235,158 @@ def extract_xhtml_section(xhtml_file: Path, section_num: str, year: int) -> dict
     if not content:
         raise ValueError(f"Could not decode {xhtml_file}")
 
-    soup = BeautifulSoup(content, 'html.parser')
+    return content.encode('utf-8')
+
+
+def _iter_xhtml_sections(xhtml_file: Path, section_nums):
+    """Stream an XHTML title file, yielding (section_num, heading, items).
+
+    A section is the first <h3 class="section-head"> whose content is a single
+    string mentioning "§<num>.", and the leveled <p> siblings after it, up to
+    the next section heading at the same level. items holds (text, refs,
+    level) for each such paragraph.
+
+    Paragraphs and headings are cleared as soon as they have been read, so
+    memory stays bounded by the paragraph being parsed rather than the whole
+    document, and parsing stops once every requested section is complete.
+    """
+    wanted = set(section_nums)
+    # Sections still collecting paragraphs, keyed by the heading's parent:
+    # only siblings of a heading belong to its section
+    open_sections = {}
+
+    # The text is re-encoded as UTF-8 before parsing, so any encoding
+    # declaration in the document itself must be ignored
+    context = etree.iterparse(BytesIO(_read_xhtml(xhtml_file)), events=('end',),
+                              tag=('h3', 'p'), html=True, encoding='utf-8')
+    for _, elem in context:
+        parent = elem.getparent()
+        css_class = elem.get('class')
+
+        if elem.tag == 'p':
+            section = open_sections.get(parent)
+            if section is not None:
+                # Only the first CSS class determines the level; a single
+                # class token is the common case and needs just one dict lookup
+                level = CLASS_TO_LEVEL.get(css_class)
+                if level is None and css_class:
+                    classes = css_class.split()
+                    level = CLASS_TO_LEVEL.get(classes[0]) if classes else None
+                if level:
+                    text, refs = _text_and_refs(elem)
+                    section[2].append((text, refs, level))
+        elif css_class and 'section-head' in css_class.split():
+            # A heading ends the section being collected among its siblings
+            finished = open_sections.pop(parent, None)
+            if finished is not None:
+                nums, heading, items = finished
+                for num in nums:
+                    yield num, heading, items
+
+            if not wanted and not open_sections:
+                break
+
+            # Find section header: <h3 class="section-head">&sect;922. ...
+            heading = _only_string(elem)
+            nums = [num for num in _SECTION_HEAD_NUM_RE.findall(heading) if num in wanted] if heading else None
+            if nums:
+                wanted.difference_update(nums)
+                open_sections[parent] = (nums, heading, [])
+
+        # Drop the element and everything before it once it has been read
+        elem.clear()
+        if parent is not None:
+            while elem.getprevious() is not None:
+                del parent[0]
+
+    # Sections running to the end of their parent element
+    for nums, heading, items in open_sections.values():
+        for num in nums:
+            yield num, heading, items
 
-    # Find section header: <h3 class="section-head">&sect;922. ...
-    section_header = soup.find('h3', class_='section-head', string=lambda s: s and f'§{section_num}.' in s)
 
-    if not section_header:
-        return None
+def extract_xhtml_section(xhtml_file: Path, section_num: str, year: int) -> dict:
+    """Extract section from XHTML format, converting to same structure as XML."""
+    for num, heading, items in _iter_xhtml_sections(xhtml_file, [section_num]):
+        return _build_xhtml_section(num, heading, items, year, xhtml_file)
 
-    # CSS class to hierarchy level mapping
-    CLASS_TO_LEVEL = {
-        'statutory-body': 5,          # subsection
-        'statutory-body-1em': 6,      # paragraph
-        'statutory-body-2em': 7,      # subparagraph
-        'statutory-body-3em': 8,      # clause
-        'statutory-body-4em': 9,      # subclause
-    }
+    return None
+
+
+def extract_xhtml_sections(xhtml_file: Path, section_nums, year: int) -> dict:
+    """Extract several sections from one XHTML file, parsing it only once.
 
-    LEVEL_TO_TAG = {
-        5: 'subsection',
-        6: 'paragraph',
-        7: 'subparagraph',
-        8: 'clause',
-        9: 'subclause',
+    Returns a dict mapping each section number found to its extracted data;
+    requested sections missing from the file are simply absent.
+    """
+    return {
+        num: _build_xhtml_section(num, heading, items, year, xhtml_file)
+        for num, heading, items in _iter_xhtml_sections(xhtml_file, section_nums)
     }
 
-    # Extract all content until next section header
-    elements = []
-    for sibling in section_header.next_siblings:
-        if sibling.name == 'h3' and 'section-head' in sibling.get('class', []):
-            break
-        if sibling.name == 'p':
-            # Get CSS class to determine level
-            css_class = sibling.get('class', [])
-            if css_class:
-                css_class = css_class[0] if isinstance(css_class, list) else css_class
-                level = CLASS_TO_LEVEL.get(css_class)
-                if level:
-                    elements.append({
-                        'element': sibling,
-                        'level': level,
-                        'tag': LEVEL_TO_TAG[level]
-                    })
 
+def _build_xhtml_section(section_num: str, heading: str, items: list, year: int, xhtml_file: Path) -> dict:
+    """Build the section structure from its heading and provision paragraphs."""
     def parse_provision_number(text: str) -> str:
         """Extract (a), (1), (A) from beginning of text."""
         text = text.strip()
-        match = re.match(r'^\(([a-zA-Z0-9]+)\)', text)
+        match = _PROVISION_RE.match(text)
         return f'({match.group(1)})' if match else ''
 
-    def extract_refs(elem) -> list:
-        """Extract references from <a> tags."""
-        refs = []
-        for link in elem.find_all('a'):
-            href = link.get('href', '')
-            if href:
-                refs.append({
-                    'target': href,
-                    'text': link.get_text()
-                })
-        return refs
-
-    def build_tree(elements: list) -> list:
-        """Build hierarchical tree from flat list of elements."""
-        if not elements:
+    def build_tree(items: list) -> list:
+        """Build hierarchical tree from flat list of paragraphs."""
+        if not items:
             return []
 
-        # Parse all elements into provisional nodes
+        # Parse all paragraphs into provisional nodes
         nodes = []
-        for item in elements:
-            elem = item['element']
-            text_content = elem.get_text().strip()
-
+        for text_content, refs, level in items:
             node = {
                 'id': f'/us/usc/t18/s{section_num}',  # Will be updated with full path
-                'tag': item['tag'],
+                'tag': LEVEL_TO_TAG[level],
                 'num': parse_provision_number(text_content),
                 'text': text_content,
-                'refs': extract_refs(elem),
-                'level': item['level']
+                'refs': refs,
+                'level': level
             }
             nodes.append(node)
 
-        # Build parent-child relationships
+        # Build parent-child relationships. open_nodes is the chain of
+        # (level, node) ancestors still accepting children, shallowest first;
+        # its levels strictly increase, so the parent is always the last entry
+        # left after popping everything at the new node's level or deeper.
         root_subsections = []
-        parent_stack = {5: None, 6: None, 7: None, 8: None, 9: None}
+        open_nodes = []
 
         for node in nodes:
-            level = node['level']
+            level = node.pop('level')  # not part of the final output
+
+            while open_nodes and open_nodes[-1][0] >= level:
+                open_nodes.pop()
 
             if level == 5:
                 # Top level subsection
                 root_subsections.append(node)
-                parent_stack[5] = node
-                # Clear lower levels
-                for l in range(6, 10):
-                    parent_stack[l] = None
-            else:
-                # Find parent (next higher level)
-                parent = None
-                for parent_level in range(level - 1, 4, -1):
-                    if parent_stack.get(parent_level):
-                        parent = parent_stack[parent_level]
-                        break
-
-                if parent:
-                    # Add as child to parent
-                    child_key = LEVEL_TO_TAG[level] + 's'  # e.g., 'paragraphs'
-                    if child_key not in parent:
-                        parent[child_key] = []
-                    parent[child_key].append(node)
-
-                # Update parent stack
-                parent_stack[level] = node
-                # Clear lower levels
-                for l in range(level + 1, 10):
-                    parent_stack[l] = None
-
-            # Remove 'level' from final output
-            del node['level']
+            elif open_nodes:
+                # Add as child to the nearest higher-level provision
+                parent = open_nodes[-1][1]
+                child_key = LEVEL_TO_TAG[level] + 's'  # e.g., 'paragraphs'
+                if child_key not in parent:
+                    parent[child_key] = []
+                parent[child_key].append(node)
+
+            open_nodes.append((level, node))
 
         return root_subsections
 
-    subsections = build_tree(elements)
+    subsections = build_tree(items)
 
     # Build final structure matching XML format
     return {
         'id': f'/us/usc/t18/s{section_num}',
         'tag': 'section',
         'num': f'§\u202f{section_num}.',
-        'heading': section_header.get_text().replace('§', '').strip().replace(section_num + '.', '').strip(),
+        'heading': heading.replace('§', '').strip().replace(section_num + '.', '').strip(),
         'subsections': subsections,
         'metadata': {
             'year': year,
@@ -231,76 +396,164 @@ def extract_xhtml_section(xhtml_file: Path, section_num: str, year: int) -> dict
     }
 
 
-def extract_all_xml_sections(xml_file: Path, year: int, output_dir: Path) -> int:
-    """Extract all sections from an XML file."""
-    tree = etree.parse(xml_file)
-    ns = {'uslm': 'http://xml.house.gov/schemas/uslm/1.0'}
+def extract_all_xml_sections(xml_file: Path, year: int, output_dir: Path, log=print,
+                             force: bool = False, pretty: bool = False) -> int:
+    """
+    Extract all sections from an XML file.
 
-    sections = tree.xpath('//uslm:section', namespaces=ns)
-    print(f"  Found {len(sections)} sections")
+    Sections whose JSON is already newer than xml_file are counted but not
+    rewritten unless force is set. Sections quoted inside another section
+    (amendment text in the notes) are not sections of the title and are
+    skipped.
+    """
+    source_mtime = None if force else xml_file.stat().st_mtime
 
-    extracted = 0
-    for section_elem in sections:
-        identifier = section_elem.get('identifier', '')
+    # Stream the file section by section so memory stays bounded by the
+    # largest section rather than the whole title
+    context = etree.iterparse(str(xml_file), events=('end',), tag=_SECTION_TAG)
+
+    # Section numbers written by this run, which the up-to-date check must
+    # not mistake for output left by an earlier one
+    written = set()
 
-        # Extract section number from identifier
-        import re
-        match = re.search(r'/s(\d+[a-z]?)', identifier)
-        if not match:
+    found = 0
+    extracted = 0
+    for _, section_elem in context:
+        # A quoted section ends before its enclosing one and is freed with it
+        if next(section_elem.iterancestors(_SECTION_TAG), None) is not None:
             continue
 
-        section_num = match.group(1)
-        section_dir = output_dir / section_num
-        section_dir.mkdir(parents=True, exist_ok=True)
+        found += 1
+        extracted += _write_streamed_section(section_elem, xml_file, year, output_dir, written,
+                                             source_mtime, pretty)
 
-        # Parse the section
-        def parse_element(elem):
-            tag = elem.tag.split('}')[-1] if '}' in elem.tag else elem.tag
-            result = {
-                'id': elem.get('identifier', ''),
-                'tag': tag,
-            }
+        # Free the finished section and everything before it
+        section_elem.clear(keep_tail=True)
+        while section_elem.getprevious() is not None:
+            del section_elem.getparent()[0]
+    del context
 
-            num_elem = elem.find('.//{http://xml.house.gov/schemas/uslm/1.0}num')
-            if num_elem is not None:
-                result['num'] = ''.join(num_elem.itertext())
-
-            heading_elem = elem.find('.//{http://xml.house.gov/schemas/uslm/1.0}heading')
-            if heading_elem is not None:
-                result['heading'] = ''.join(heading_elem.itertext())
-
-            content_elem = elem.find('.//{http://xml.house.gov/schemas/uslm/1.0}content')
-            if content_elem is not None:
-                result['text'] = ''.join(content_elem.itertext())
-                refs = content_elem.findall('.//{http://xml.house.gov/schemas/uslm/1.0}ref[@href]')
-                if refs:
-                    result['refs'] = [
-                        {'target': ref.get('href'), 'text': ref.text or ''}
-                        for ref in refs
-                    ]
-
-            for child_tag in ['subsection', 'paragraph', 'subparagraph', 'clause', 'subclause']:
-                children = elem.findall(f'.//{{{ns["uslm"]}}}{child_tag}')
-                direct_children = [c for c in children if c.getparent() == elem]
-                if direct_children:
-                    result[child_tag + 's'] = [parse_element(child) for child in direct_children]
-
-            return result
-
-        data = parse_element(section_elem)
-        data['metadata'] = {
-            'year': year,
-            'source': xml_file.name,
-            'format': 'xml'
-        }
+    log(f"  Found {found} sections")
+    return extracted
 
-        output_file = section_dir / f'{year}.json'
-        with open(output_file, 'w') as f:
-            json.dump(data, f, indent=2)
 
-        extracted += 1
+def _write_streamed_section(section_elem, xml_file: Path, year: int, output_dir: Path, written: set,
+                            source_mtime: float = None, pretty: bool = False) -> int:
+    """
+    Write one section produced by extract_all_xml_sections; return 1 if written or current.
 
-    return extracted
+    written holds the section numbers already written in this run and gets
+    section_elem's number added once its JSON is written.
+    """
+    identifier = section_elem.get('identifier', '')
+
+    # Extract section number from identifier
+    match = _SECTION_ID_RE.search(identifier)
+    if not match:
+        return 0
+
+    section_num = match.group(1)
+    section_dir = output_dir / section_num
+    if (source_mtime is not None and section_num not in written
+            and _is_up_to_date(section_dir / f'{year}.json', source_mtime)):
+        return 1
+
+    section_dir.mkdir(parents=True, exist_ok=True)
+
+    data = _parse_uslm_element(section_elem)
+    data['metadata'] = {
+        'year': year,
+        'source': xml_file.name,
+        'format': 'xml'
+    }
+
+    write_section_json(section_dir, section_num, year, data, pretty)
+    written.add(section_num)
+
+    return 1
+
+
+def _extract_one(task: tuple) -> str:
+    """Extract one section for one year and write its JSON; return a status line."""
+    file_path, section_num, year, fmt, section_dir, force, pretty = task
+
+    if not file_path.exists():
+        return f"✗ {year}: File not found - {file_path}"
+
+    output_file = section_dir / f'{year}.json'
+    if not force and _is_up_to_date(output_file, file_path.stat().st_mtime):
+        return f"✓ {year}: {output_file} (up to date)"
+
+    try:
+        if fmt == 'xml':
+            data = extract_xml_section(file_path, section_num, year)
+        else:
+            data = extract_xhtml_section(file_path, section_num, year)
+
+        if not data:
+            return f"✗ {year}: Section not found"
+
+        output_file = write_section_json(section_dir, section_num, year, data, pretty)
+        return f"✓ {year}: {output_file}"
+
+    except Exception as e:
+        return f"✗ {year}: Error - {e}"
+
+
+def _extract_all_one(task: tuple) -> list:
+    """Bulk-extract one year's XML file; return the lines to print for it."""
+    file_path, year, output_dir, force, pretty = task
+
+    if not file_path.exists():
+        return [f"✗ {year}: File not found - {file_path}"]
+
+    lines = [f"{year}:"]
+    try:
+        count = extract_all_xml_sections(file_path, year, output_dir, log=lines.append,
+                                         force=force, pretty=pretty)
+        lines.append(f"  ✓ Extracted {count} sections\n")
+    except Exception as e:
+        lines.append(f"  ✗ Error: {e}\n")
+    return lines
+
+
+# Source file for each year, relative to the raw USLM download directory
+YEARS_CONFIG = {
+    2024: {'format': 'xml', 'file': '2024/usc18.xml'},
+    2022: {'format': 'xml', 'file': '2022/usc18.xml'},
+    2018: {'format': 'xhtml', 'file': '2018/2018/2018usc18.htm'},
+    2013: {'format': 'xhtml', 'file': '2013/2013/2013usc18.htm'},
+    2006: {'format': 'xhtml', 'file': '2006/2006/2006usc18.htm'},
+    2000: {'format': 'xhtml', 'file': '2000/2000/2000usc18.htm'},
+    1994: {'format': 'xhtml', 'file': '1994/1994/1994usc18.htm'},
+}
+
+
+def extract_section_list(sections: list, base_dir: Path = Path('data/raw/uslm'),
+                         output_dir: Path = Path('data/sections'), force: bool = False,
+                         pretty: bool = False, log=print) -> None:
+    """Extract the given sections for every configured year across a process pool."""
+    years = sorted(YEARS_CONFIG.items(), reverse=True)
+
+    # Every section/year pair is independent
+    worklist = []
+    for section_num in sections:
+        section_dir = output_dir / section_num
+        section_dir.mkdir(parents=True, exist_ok=True)
+        for year, config in years:
+            worklist.append((base_dir / config['file'], section_num, year, config['format'], section_dir,
+                             force, pretty))
+
+    with ProcessPoolExecutor() as executor:
+        messages = iter(executor.map(_extract_one, worklist))
+
+        for section_num in sections:
+            log(f"\n{'='*60}")
+            log(f"Extracting Section {section_num}")
+            log(f"{'='*60}")
+
+            for _ in years:
+                log(next(messages))
 
 
 def main():
@@ -309,42 +562,30 @@ def main():
     parser = argparse.ArgumentParser(description='Extract USC sections from XML/XHTML files')
     parser.add_argument('--all', action='store_true', help='Extract all sections (XML only)')
     parser.add_argument('--sections', nargs='+', default=['922', '933'], help='Specific sections to extract')
+    parser.add_argument('--force', action='store_true',
+                        help='Re-extract even when the output JSON is newer than its source file')
+    parser.add_argument('--pretty', action='store_true', help='Write indented JSON for debugging')
     args = parser.parse_args()
 
     base_dir = Path('data/raw/uslm')
     output_dir = Path('data/sections')
 
-    years_config = {
-        2024: {'format': 'xml', 'file': '2024/usc18.xml'},
-        2022: {'format': 'xml', 'file': '2022/usc18.xml'},
-        2018: {'format': 'xhtml', 'file': '2018/2018/2018usc18.htm'},
-        2013: {'format': 'xhtml', 'file': '2013/2013/2013usc18.htm'},
-        2006: {'format': 'xhtml', 'file': '2006/2006/2006usc18.htm'},
-        2000: {'format': 'xhtml', 'file': '2000/2000/2000usc18.htm'},
-        1994: {'format': 'xhtml', 'file': '1994/1994/1994usc18.htm'},
-    }
-
     if args.all:
         # Extract all sections (XML only for now)
         print(f"\n{'='*60}")
         print("Extracting ALL Title 18 Sections")
         print(f"{'='*60}\n")
 
-        for year, config in sorted(years_config.items(), reverse=True):
-            if config['format'] != 'xml':
-                continue  # Skip XHTML for bulk extraction
-
-            file_path = base_dir / config['file']
-            if not file_path.exists():
-                print(f"✗ {year}: File not found - {file_path}")
-                continue
-
-            try:
-                print(f"{year}:")
-                count = extract_all_xml_sections(file_path, year, output_dir)
-                print(f"  ✓ Extracted {count} sections\n")
-            except Exception as e:
-                print(f"  ✗ Error: {e}\n")
+        # Each year is an independent file, so years run in parallel
+        worklist = [
+            (base_dir / config['file'], year, output_dir, args.force, args.pretty)
+            for year, config in sorted(YEARS_CONFIG.items(), reverse=True)
+            if config['format'] == 'xml'  # Skip XHTML for bulk extraction
+        ]
+        with ProcessPoolExecutor() as executor:
+            for lines in executor.map(_extract_all_one, worklist):
+                for line in lines:
+                    print(line)
 
         print(f"{'='*60}")
         print("Bulk extraction complete")
@@ -352,39 +593,7 @@ def main():
         return
 
     # Extract specific sections
-    sections = args.sections
-
-    for section_num in sections:
-        section_dir = output_dir / section_num
-        section_dir.mkdir(parents=True, exist_ok=True)
-
-        print(f"\n{'='*60}")
-        print(f"Extracting Section {section_num}")
-        print(f"{'='*60}")
-
-        for year, config in sorted(years_config.items(), reverse=True):
-            file_path = base_dir / config['file']
-
-            if not file_path.exists():
-                print(f"✗ {year}: File not found - {file_path}")
-                continue
-
-            try:
-                if config['format'] == 'xml':
-                    data = extract_xml_section(file_path, section_num, year)
-                else:
-                    data = extract_xhtml_section(file_path, section_num, year)
-
-                if data:
-                    output_file = section_dir / f'{year}.json'
-                    with open(output_file, 'w') as f:
-                        json.dump(data, f, indent=2)
-                    print(f"✓ {year}: {output_file}")
-                else:
-                    print(f"✗ {year}: Section not found")
-
-            except Exception as e:
-                print(f"✗ {year}: Error - {e}")
+    extract_section_list(args.sections, base_dir, output_dir, force=args.force, pretty=args.pretty)
 
     print(f"\n{'='*60}")
     print("Extraction complete")
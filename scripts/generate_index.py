@@ -4,43 +4,76 @@ Generate HTML index of all extracted Title 18 sections.
 """
 
 import json
+import os
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _file_names(directory) -> set:
+    """Names of the regular files in a directory, read with a single scandir."""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries if entry.is_file()}
+    except FileNotFoundError:
+        return set()
+
 
 def main():
     sections_dir = Path('data/sections')
     output_file = Path('data/index.html')
 
+    # One directory listing each instead of two exists() calls per section
+    analysis_files = _file_names('data/analysis')
+    view_files = _file_names('data/views')
+
     # Collect all sections
     sections = []
-    for section_dir in sorted(sections_dir.iterdir(), key=lambda x: int(x.name) if x.name.isdigit() else 0):
-        if not section_dir.is_dir():
-            continue
+    with os.scandir(sections_dir) as entries:
+        section_entries = sorted(
+            (entry for entry in entries if entry.is_dir()),
+            key=lambda x: int(x.name) if x.name.isdigit() else 0
+        )
 
-        section_num = section_dir.name
+    for entry in section_entries:
+        section_dir = Path(entry.path)
+        section_num = entry.name
+        section_files = _file_names(section_dir)
 
         # Get latest JSON
-        json_files = list(section_dir.glob('*.json'))
+        json_files = [section_dir / name for name in section_files if name.endswith('.json')]
         if not json_files:
             continue
 
         latest_json = max(json_files, key=lambda x: int(x.stem))
 
         try:
-            with open(latest_json) as f:
-                data = json.load(f)
+            # Prefer the small sidecar written at extraction time; older
+            # extractions only have the full section JSON
+            meta_file = latest_json.with_suffix('.meta')
+            source = meta_file if meta_file.name in section_files else latest_json
+            if orjson is not None:
+                data = orjson.loads(source.read_bytes())
+            else:
+                with open(source) as f:
+                    data = json.load(f)
 
             heading = data.get('heading', 'Unknown')
             year = int(latest_json.stem)
 
             # Check if we have analysis
-            has_analysis = (Path(f'data/analysis/{section_num}_change_analysis.html')).exists()
+            has_analysis = f'{section_num}_change_analysis.html' in analysis_files
+            has_view = f'{section_num}.html' in view_files
 
             sections.append({
                 'num': section_num,
                 'heading': heading,
                 'year': year,
                 'has_analysis': has_analysis,
+                'has_view': has_view,
                 'versions': len(json_files)
             })
         except Exception as e:
@@ -50,8 +83,8 @@ def main():
     # Sort by section number
     sections.sort(key=lambda x: int(x['num']) if x['num'].isdigit() else 0)
 
-    # Generate HTML
-    html = f"""
+    # Generate HTML; rows are collected in a list and joined once at the end
+    parts = [f"""
 <!DOCTYPE html>
 <html>
 <head>
@@ -135,33 +168,30 @@ def main():
             </tr>
         </thead>
         <tbody>
-"""
+"""]
 
     for section in sections:
-        has_view = (Path(f'data/views/{section["num"]}.html')).exists()
+        if section['has_view']:
+            actions = f'<a href="views/{section["num"]}.html"><strong>View Text</strong></a>'
+        else:
+            actions = '<span style="color:#999;">No view</span>'
+
+        if section['has_analysis']:
+            actions += f' | <a href="analysis/{section["num"]}_change_analysis.html">Analysis</a>'
 
-        html += f"""
+        parts.append(f"""
             <tr>
                 <td class="section-num">§ {section['num']}</td>
                 <td>{section['heading']}</td>
                 <td>{section['year']}</td>
                 <td>{section['versions']}</td>
                 <td>
-"""
-        if has_view:
-            html += f'<a href="views/{section["num"]}.html"><strong>View Text</strong></a>'
-        else:
-            html += '<span style="color:#999;">No view</span>'
-
-        if section['has_analysis']:
-            html += f' | <a href="analysis/{section["num"]}_change_analysis.html">Analysis</a>'
-
-        html += """
+{actions}
                 </td>
             </tr>
-"""
+""")
 
-    html += """
+    parts.append("""
         </tbody>
     </table>
 
@@ -171,7 +201,8 @@ def main():
 
 </body>
 </html>
-"""
+""")
+    html = ''.join(parts)
 
     # Write HTML
     with open(output_file, 'w') as f:
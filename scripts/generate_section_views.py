@@ -3,11 +3,34 @@
 Generate HTML view pages for each section showing statute text.
 """
 
+import functools
 import json
+import multiprocessing as mp
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import html
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Section number in a Title 18 reference target, and the anchors emitted for refs
+_T18_SECTION_RE = re.compile(r'/t18/s(\d+)')
+_STATUTE_LINK = '<a href="{num}.html" class="statute-ref" title="{title}">{text}</a>'
+_EXTERNAL_LINK = ('<a href="https://uscode.house.gov/view.xhtml?req={req}" class="external-ref" '
+                  'target="_blank" title="{title}">{text}</a>')
+
+
+@functools.lru_cache(maxsize=4096)
+def _ref_pattern(escaped_refs: frozenset):
+    """Alternation over escaped reference texts, longest first so that e.g.
+    'section 921' wins over a separate '921' ref at the same position."""
+    return re.compile('|'.join(re.escape(ref) for ref in sorted(escaped_refs, key=len, reverse=True)))
+
 
 def linkify_text(text: str, refs: list) -> str:
     """Convert references to HTML links."""
@@ -16,6 +39,8 @@ def linkify_text(text: str, refs: list) -> str:
 
     result = html.escape(text)
 
+    # Map each escaped ref text to its anchor; the first ref for a text wins
+    links = {}
     for ref in refs:
         ref_text = ref.get('text', '')
         target = ref.get('target', '')
@@ -25,60 +50,25 @@ def linkify_text(text: str, refs: list) -> str:
 
         # Escape the ref_text for matching in the escaped result
         escaped_ref = html.escape(ref_text)
+        if escaped_ref in links:
+            continue
 
-        # Parse section number from target
-        match = re.search(r'/t18/s(\d+)', target)
-        if match:
-            section_num = match.group(1)
-            # Link to section view
-            link = f'<a href="{section_num}.html" class="statute-ref" title="{html.escape(target)}">{escaped_ref}</a>'
-            result = result.replace(escaped_ref, link)
-        elif '/t18/' not in target:
+        if '/t18/' in target:
+            # Link to section view; other Title 18 targets stay plain text
+            match = _T18_SECTION_RE.search(target)
+            if match:
+                links[escaped_ref] = _STATUTE_LINK.format(
+                    num=match.group(1), title=html.escape(target), text=escaped_ref)
+        else:
             # External reference
-            external_url = f'https://uscode.house.gov/view.xhtml?req={target.replace("/", ":")}'
-            link = f'<a href="{external_url}" class="external-ref" target="_blank" title="{html.escape(target)}">{escaped_ref}</a>'
-            result = result.replace(escaped_ref, link)
+            links[escaped_ref] = _EXTERNAL_LINK.format(
+                req=target.replace('/', ':'), title=html.escape(target), text=escaped_ref)
 
-    return result
+    if not links:
+        return result
 
-
-def render_provision(node: dict, level: int) -> str:
-    """Recursively render a provision and its children."""
-    tag = node.get('tag', '')
-    num = node.get('num', '')
-    text = node.get('text', '')
-    refs = node.get('refs', [])
-
-    # Level names for CSS classes
-    level_names = {
-        5: 'subsection',
-        6: 'paragraph',
-        7: 'subparagraph',
-        8: 'clause',
-        9: 'subclause'
-    }
-
-    level_class = level_names.get(level, 'provision')
-
-    html_parts = []
-    html_parts.append(f'<div class="{level_class}">')
-
-    if num:
-        html_parts.append(f'<span class="num">{html.escape(num)}</span> ')
-
-    if text:
-        html_parts.append(f'<span class="text">{linkify_text(text, refs)}</span>')
-
-    # Render children
-    for child_type in ['subsections', 'paragraphs', 'subparagraphs', 'clauses', 'subclauses']:
-        children = node.get(child_type, [])
-        for child in children:
-            child_level = level + 1 if level > 0 else TAG_TO_LEVEL.get(child.get('tag', ''), 5)
-            html_parts.append(render_provision(child, child_level))
-
-    html_parts.append('</div>')
-
-    return '\n'.join(html_parts)
+    # One scan over the text, so inserted anchors are never matched again
+    return _ref_pattern(frozenset(links)).sub(lambda m: links[m.group(0)], result)
 
 
 TAG_TO_LEVEL = {
@@ -89,17 +79,64 @@ TAG_TO_LEVEL = {
     'subclause': 9,
 }
 
+# Opening tag for levels 5-9, and the child lists of a provision in render order
+LEVEL_OPEN_TAGS = tuple(
+    f'<div class="{level_class}">'
+    for level_class in ('subsection', 'paragraph', 'subparagraph', 'clause', 'subclause')
+)
+CHILD_KEYS = ('subsections', 'paragraphs', 'subparagraphs', 'clauses', 'subclauses')
+
+
+def _render_provisions(nodes: list, level: int, out: list):
+    """Append the HTML lines for provisions at `level` and all their descendants to out."""
+    # Explicit stack instead of recursion; None marks a provision whose
+    # children have all been emitted and which still needs its closing tag
+    stack = [(node, level) for node in reversed(nodes)]
+
+    while stack:
+        item = stack.pop()
+        if item is None:
+            out.append('</div>')
+            continue
+
+        node, level = item
+        num = node.get('num', '')
+        text = node.get('text', '')
+        refs = node.get('refs', [])
+
+        # Opening tag, num and text go out as one entry; the final '\n'.join
+        # produces the same lines as appending them separately
+        head = LEVEL_OPEN_TAGS[level - 5] if 5 <= level <= 9 else '<div class="provision">'
+        if num:
+            head += f'\n<span class="num">{html.escape(num)}</span> '
+        if text:
+            head += f'\n<span class="text">{linkify_text(text, refs)}</span>'
+        out.append(head)
+
+        stack.append(None)
+
+        # Push children in reverse so they pop in document order
+        children = [child for child_type in CHILD_KEYS for child in node.get(child_type, [])]
+        for child in reversed(children):
+            child_level = level + 1 if level > 0 else TAG_TO_LEVEL.get(child.get('tag', ''), 5)
+            stack.append((child, child_level))
+
+
+def render_provision(node: dict, level: int) -> str:
+    """Render a provision and its children."""
+    out = []
+    _render_provisions([node], level, out)
+    return '\n'.join(out)
+
 
 def render_statute_text(data: dict) -> str:
     """Render the complete statute text."""
     if not data:
         return '<p>No content available</p>'
 
+    # Render all subsections into one shared list of lines
     html_parts = []
-
-    # Render all subsections
-    for subsection in data.get('subsections', []):
-        html_parts.append(render_provision(subsection, 5))
+    _render_provisions(data.get('subsections', []), 5, html_parts)
 
     # If no subsections, render text directly
     if not html_parts and data.get('text'):
@@ -110,8 +147,508 @@ def render_statute_text(data: dict) -> str:
     return '\n'.join(html_parts) if html_parts else '<p>No content available</p>'
 
 
-def generate_section_view(section_num: str, sections_data_dir: Path, output_dir: Path):
-    """Generate HTML page for a section with all versions."""
+# Fields the page script reads from an embedded version; ids, metadata and
+# any raw source markup are left out of the page
+_EMBED_NODE_KEYS = ('num', 'text', 'tag', 'refs')
+
+
+def _slim_provision(node: dict) -> dict:
+    """Copy of a provision with only the fields the page script uses."""
+    slim = {key: node[key] for key in _EMBED_NODE_KEYS if key in node}
+    for child_type in CHILD_KEYS:
+        if child_type in node:
+            slim[child_type] = [_slim_provision(child) for child in node[child_type]]
+    return slim
+
+
+def _slim_version(data: dict) -> dict:
+    """Copy of a section version for embedding: the provision fields plus the heading."""
+    slim = _slim_provision(data)
+    if 'heading' in data:
+        slim['heading'] = data['heading']
+    return slim
+
+
+# Shared by every section view and written once to assets/ by main()
+SECTION_CSS = '''body {
+    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Arial, sans-serif;
+    max-width: 1400px;
+    margin: 40px auto;
+    padding: 20px;
+    line-height: 1.8;
+}
+h1 {
+    color: #1a1a1a;
+    border-bottom: 3px solid #0066cc;
+    padding-bottom: 10px;
+}
+.controls {
+    background: #f5f5f5;
+    padding: 15px;
+    margin-bottom: 30px;
+    border-radius: 5px;
+    display: flex;
+    justify-content: space-between;
+    align-items: center;
+}
+.controls select {
+    padding: 5px 10px;
+    font-size: 14px;
+    border: 1px solid #ccc;
+    border-radius: 3px;
+}
+.controls a {
+    color: #0066cc;
+    text-decoration: none;
+    margin-left: 15px;
+}
+.controls a:hover {
+    text-decoration: underline;
+}
+
+/* Hierarchy levels */
+.subsection { margin: 20px 0; }
+.paragraph { margin: 15px 0 15px 30px; }
+.subparagraph { margin: 10px 0 10px 60px; }
+.clause { margin: 8px 0 8px 90px; }
+.subclause { margin: 5px 0 5px 120px; }
+.section-text { margin: 20px 0; }
+
+.num {
+    font-weight: 600;
+    color: #0066cc;
+}
+
+.text {
+    color: #333;
+}
+
+/* Reference links */
+.statute-ref {
+    color: #0066cc;
+    text-decoration: none;
+    border-bottom: 1px dotted #0066cc;
+}
+.statute-ref:hover {
+    background: #e3f2fd;
+    border-bottom: 1px solid #0066cc;
+}
+.external-ref {
+    color: #666;
+    text-decoration: none;
+    border-bottom: 1px dotted #666;
+}
+.external-ref::after {
+    content: ' ↗';
+    font-size: 0.8em;
+}
+.external-ref:hover {
+    background: #f5f5f5;
+}
+
+/* Comparison mode styles */
+.comparison-toggle {
+    padding: 6px 12px;
+    background: #0066cc;
+    color: white;
+    border: none;
+    border-radius: 3px;
+    cursor: pointer;
+    font-size: 14px;
+    margin-left: 15px;
+}
+.comparison-toggle:hover {
+    background: #0052a3;
+}
+.comparison-toggle.active {
+    background: #dc3545;
+}
+.comparison-controls {
+    display: none;
+    background: #fff3cd;
+    padding: 15px;
+    margin: 20px 0;
+    border-radius: 5px;
+    border-left: 4px solid #ffc107;
+}
+.comparison-controls.active {
+    display: block;
+}
+.comparison-controls select {
+    padding: 5px 10px;
+    font-size: 14px;
+    border: 1px solid #ccc;
+    border-radius: 3px;
+    margin: 0 10px;
+}
+#statute-text {
+    display: block;
+}
+#statute-text.hidden {
+    display: none;
+}
+.comparison-container {
+    display: none;
+    margin-top: 20px;
+    border: 1px solid #ddd;
+    border-radius: 5px;
+    padding: 20px;
+    background: white;
+    overflow-y: auto;
+    max-height: 80vh;
+}
+.comparison-container.active {
+    display: block;
+}
+.comparison-header {
+    display: flex;
+    gap: 20px;
+    margin-bottom: 20px;
+    padding-bottom: 10px;
+    border-bottom: 2px solid #ddd;
+}
+.comparison-header h3 {
+    flex: 1;
+    margin: 0;
+    color: #666;
+}
+.diff-row {
+    display: flex;
+    gap: 20px;
+    min-height: 40px;
+    align-items: stretch;
+}
+.diff-cell {
+    flex: 1;
+    padding: 10px;
+    min-height: 40px;
+    border-radius: 3px;
+}
+.diff-cell.empty {
+    background: #fafafa;
+    border: 1px dashed #ccc;
+}
+.diff-added {
+    background: #d4edda;
+    border-left: 4px solid #28a745;
+    padding: 8px;
+    margin: 8px 0;
+}
+.diff-deleted {
+    background: #f8d7da;
+    border-left: 4px solid #dc3545;
+    padding: 8px;
+    margin: 8px 0;
+    opacity: 0.7;
+}
+.diff-modified {
+    background: #fff3cd;
+    border-left: 4px solid #ffc107;
+    padding: 8px;
+    margin: 8px 0;
+}
+.diff-unchanged {
+    opacity: 0.6;
+}
+.diff-highlight {
+    background: #ffeb3b;
+    padding: 2px 4px;
+    border-radius: 2px;
+}
+'''
+
+SECTION_JS = '''// Statute text per year, parsed into a <template> on first view and
+// cloned on later switches instead of being re-rendered and re-parsed
+const renderedVersions = {};
+
+function switchVersion(year) {
+    const data = versions[year];
+    if (!data) return;
+
+    // Update heading
+    document.querySelector('h1').textContent = `18 U.S.C. § ${sectionNum} - ${data.heading || 'Unknown'}`;
+
+    // Re-render statute text
+    const container = document.getElementById('statute-text');
+    if (!container.replaceChildren) {
+        container.innerHTML = renderStatuteText(data);
+        return;
+    }
+
+    let template = renderedVersions[year];
+    if (!template) {
+        template = document.createElement('template');
+        template.innerHTML = renderStatuteText(data);
+        renderedVersions[year] = template;
+    }
+    container.replaceChildren(template.content.cloneNode(true));
+}
+
+function renderStatuteText(data) {
+    if (!data || !data.subsections || data.subsections.length === 0) {
+        if (data.text) {
+            return `<div class="section-text">${escapeHtml(linkifyText(data.text, data.refs || []))}</div>`;
+        }
+        return '<p>No content available</p>';
+    }
+
+    let html = '';
+    for (const subsection of data.subsections) {
+        html += renderProvision(subsection, 5);
+    }
+    return html;
+}
+
+function renderProvision(node, level) {
+    const levelNames = {5: 'subsection', 6: 'paragraph', 7: 'subparagraph', 8: 'clause', 9: 'subclause'};
+    const levelClass = levelNames[level] || 'provision';
+
+    let html = `<div class="${levelClass}">`;
+
+    if (node.num) {
+        html += `<span class="num">${escapeHtml(node.num)}</span> `;
+    }
+
+    if (node.text) {
+        html += `<span class="text">${linkifyText(node.text, node.refs || [])}</span>`;
+    }
+
+    // Render children
+    const childTypes = ['subsections', 'paragraphs', 'subparagraphs', 'clauses', 'subclauses'];
+    for (const childType of childTypes) {
+        const children = node[childType] || [];
+        for (const child of children) {
+            const childLevel = level + 1;
+            html += renderProvision(child, childLevel);
+        }
+    }
+
+    html += '</div>';
+    return html;
+}
+
+function linkifyText(text, refs) {
+    if (!text) return '';
+    const result = escapeHtml(text);
+
+    // Map each escaped ref text to its anchor; the first ref for a text wins
+    const links = new Map();
+    for (const ref of refs) {
+        const refText = ref.text || '';
+        const target = ref.target || '';
+        if (!refText || !target) continue;
+
+        const escapedRef = escapeHtml(refText);
+        if (links.has(escapedRef)) continue;
+
+        const match = target.match(/\\/t18\\/s(\\d+)/);
+
+        if (match) {
+            const sectionNum = match[1];
+            links.set(escapedRef, `<a href="${sectionNum}.html" class="statute-ref" title="${escapeHtml(target)}">${escapedRef}</a>`);
+        } else if (!target.includes('/t18/')) {
+            const externalUrl = `https://uscode.house.gov/view.xhtml?req=${target.replace(/\\//g, ':')}`;
+            links.set(escapedRef, `<a href="${externalUrl}" class="external-ref" target="_blank" title="${escapeHtml(target)}">${escapedRef}</a>`);
+        }
+    }
+
+    if (links.size === 0) return result;
+
+    // One scan, longest ref first, so inserted anchors are never matched again
+    const pattern = new RegExp(
+        [...links.keys()].sort((a, b) => b.length - a.length).map(escapeRegex).join('|'),
+        'g'
+    );
+    return result.replace(pattern, m => links.get(m));
+}
+
+function escapeRegex(text) {
+    return text.replace(/[.*+?^${}()|[\\]\\\\]/g, '\\\\$&');
+}
+
+function escapeHtml(text) {
+    const div = document.createElement('div');
+    div.textContent = text;
+    return div.innerHTML;
+}
+
+// Comparison mode functions
+function toggleComparison() {
+    const controls = document.getElementById('comparison-controls');
+    const toggle = document.querySelector('.comparison-toggle');
+    const isActive = controls.classList.contains('active');
+
+    if (isActive) {
+        // Close comparison mode
+        controls.classList.remove('active');
+        toggle.classList.remove('active');
+        toggle.textContent = 'Compare Versions';
+        document.getElementById('statute-text').classList.remove('hidden');
+        document.getElementById('comparison-container').classList.remove('active');
+    } else {
+        // Enter comparison mode
+        controls.classList.add('active');
+        toggle.classList.add('active');
+        toggle.textContent = '✕ Close Comparison';
+    }
+}
+
+function showComparison() {
+    const year1 = document.getElementById('compare-version1').value;
+    const year2 = document.getElementById('compare-version2').value;
+
+    if (year1 === year2) {
+        alert('Please select two different versions to compare');
+        return;
+    }
+
+    // Hide normal view, show comparison
+    document.getElementById('statute-text').classList.add('hidden');
+    document.getElementById('comparison-container').classList.add('active');
+
+    // Update titles
+    document.getElementById('compare-left-title').textContent = `Version ${year1}`;
+    document.getElementById('compare-right-title').textContent = `Version ${year2}`;
+
+    // Generate comparison
+    const data1 = versions[year1];
+    const data2 = versions[year2];
+
+    renderSideBySide(data1, data2, year1, year2);
+}
+
+function buildProvisionTree(data) {
+    // Build flat tree of all provisions for diffing
+    const tree = {};
+
+    function traverse(node, path = '') {
+        const key = node.num || '';
+        const fullPath = path ? `${path}/${key}` : key;
+
+        if (key) {
+            tree[fullPath] = {
+                num: node.num,
+                text: node.text || '',
+                level: node.tag || 'section'
+            };
+        }
+
+        // Traverse children
+        const childTypes = ['subsections', 'paragraphs', 'subparagraphs', 'clauses', 'subclauses'];
+        for (const childType of childTypes) {
+            const children = node[childType] || [];
+            for (const child of children) {
+                traverse(child, fullPath || key);
+            }
+        }
+    }
+
+    if (data.subsections) {
+        for (const subsection of data.subsections) {
+            traverse(subsection);
+        }
+    }
+
+    return tree;
+}
+
+function renderSideBySide(data1, data2, year1, year2) {
+    const tree1 = buildProvisionTree(data1);
+    const tree2 = buildProvisionTree(data2);
+
+    // Find all unique paths
+    const allPaths = new Set([...Object.keys(tree1), ...Object.keys(tree2)]);
+    const sortedPaths = Array.from(allPaths).sort();
+
+    let html = '';
+
+    for (const path of sortedPaths) {
+        const node1 = tree1[path];
+        const node2 = tree2[path];
+
+        if (!node1) {
+            // Added in version 2 - empty left, content right
+            html += `<div class="diff-row">
+                <div class="diff-cell empty"></div>
+                <div class="diff-cell diff-added">
+                    <span class="num">${escapeHtml(node2.num)}</span>
+                    <span class="text">${escapeHtml(node2.text)}</span>
+                </div>
+            </div>`;
+        } else if (!node2) {
+            // Deleted from version 1 - content left, empty right
+            html += `<div class="diff-row">
+                <div class="diff-cell diff-deleted">
+                    <span class="num">${escapeHtml(node1.num)}</span>
+                    <span class="text">${escapeHtml(node1.text)}</span>
+                </div>
+                <div class="diff-cell empty"></div>
+            </div>`;
+        } else if (node1.text !== node2.text) {
+            // Modified - show both versions
+            html += `<div class="diff-row">
+                <div class="diff-cell diff-modified">
+                    <span class="num">${escapeHtml(node1.num)}</span>
+                    <span class="text">${escapeHtml(node1.text)}</span>
+                </div>
+                <div class="diff-cell diff-modified">
+                    <span class="num">${escapeHtml(node2.num)}</span>
+                    <span class="text">${highlightDiff(node1.text, node2.text)}</span>
+                </div>
+            </div>`;
+        } else {
+            // Unchanged - show both (dimmed)
+            html += `<div class="diff-row">
+                <div class="diff-cell diff-unchanged">
+                    <span class="num">${escapeHtml(node1.num)}</span>
+                    <span class="text">${escapeHtml(node1.text)}</span>
+                </div>
+                <div class="diff-cell diff-unchanged">
+                    <span class="num">${escapeHtml(node2.num)}</span>
+                    <span class="text">${escapeHtml(node2.text)}</span>
+                </div>
+            </div>`;
+        }
+    }
+
+    document.getElementById('comparison-content').innerHTML = html || '<p>No differences found</p>';
+}
+
+function highlightDiff(text1, text2) {
+    // Simple word-level diff highlighting
+    const words1 = text1.split(/\\s+/);
+    const words2 = text2.split(/\\s+/);
+
+    let result = '';
+    const maxLen = Math.max(words1.length, words2.length);
+
+    for (let i = 0; i < words2.length; i++) {
+        if (words1[i] !== words2[i]) {
+            result += `<span class="diff-highlight">${escapeHtml(words2[i])}</span> `;
+        } else {
+            result += escapeHtml(words2[i]) + ' ';
+        }
+    }
+
+    return result.trim();
+}
+'''
+
+
+# Static part of a section view page, from the stylesheet link up to the
+# first version <select>
+PAGE_HEAD = '''    <link rel="stylesheet" href="../assets/section.css">
+</head>
+<body>
+    <div class="controls">
+        <div>
+            <label><strong>Version:</strong></label>
+            <select id="version-select" onchange="switchVersion(this.value)">
+'''
+
+
+def render_section_view(section_num: str, sections_data_dir: Path):
+    """Render the HTML page for a section with all versions, or None if it has none."""
 
     section_dir = sections_data_dir / section_num
     if not section_dir.exists() or not section_dir.is_dir():
@@ -122,8 +659,11 @@ def generate_section_view(section_num: str, sections_data_dir: Path, output_dir:
     for json_file in sorted(section_dir.glob('*.json')):
         try:
             year = int(json_file.stem)
-            with open(json_file) as f:
-                versions[year] = json.load(f)
+            if orjson is not None:
+                versions[year] = orjson.loads(json_file.read_bytes())
+            else:
+                with open(json_file) as f:
+                    versions[year] = json.load(f)
         except (ValueError, json.JSONDecodeError) as e:
             print(f"  Error loading {json_file}: {e}")
             continue
@@ -131,217 +671,41 @@ def generate_section_view(section_num: str, sections_data_dir: Path, output_dir:
     if not versions:
         return
 
-    latest_year = max(versions.keys())
+    # One sort serves the latest year and every version <select>
+    years_desc = sorted(versions, reverse=True)
+    latest_year = years_desc[0]
     latest_data = versions[latest_year]
     heading = latest_data.get('heading', 'Unknown')
 
-    # Generate HTML
-    html = f'''<!DOCTYPE html>
+    # Versions embedded for the client-side version switcher and comparison
+    versions_by_year = {str(k): _slim_version(v) for k, v in versions.items()}
+    if orjson is not None:
+        versions_json = orjson.dumps(versions_by_year).decode('utf-8')
+    else:
+        versions_json = json.dumps(versions_by_year)
+
+    # Version <option> tags, built once; the two newest-first lists only
+    # differ in indentation
+    latest_first = [
+        f'<option value="{year}" {"selected" if year == latest_year else ""}>{year}</option>\n'
+        for year in years_desc
+    ]
+    version_options = ''.join('                ' + option for option in latest_first)
+    compare_options_desc = ''.join('            ' + option for option in latest_first)
+    compare_options_asc = ''.join(f'            <option value="{year}">{year}</option>\n' for year in reversed(years_desc))
+
+    # Only the dynamic parts are formatted per page; the stylesheet and
+    # script are shared asset files
+    return ''.join([
+        f'''<!DOCTYPE html>
 <html>
 <head>
     <meta charset="UTF-8">
     <title>18 U.S.C. § {section_num} - {heading}</title>
-    <style>
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Arial, sans-serif;
-            max-width: 1400px;
-            margin: 40px auto;
-            padding: 20px;
-            line-height: 1.8;
-        }}
-        h1 {{
-            color: #1a1a1a;
-            border-bottom: 3px solid #0066cc;
-            padding-bottom: 10px;
-        }}
-        .controls {{
-            background: #f5f5f5;
-            padding: 15px;
-            margin-bottom: 30px;
-            border-radius: 5px;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-        }}
-        .controls select {{
-            padding: 5px 10px;
-            font-size: 14px;
-            border: 1px solid #ccc;
-            border-radius: 3px;
-        }}
-        .controls a {{
-            color: #0066cc;
-            text-decoration: none;
-            margin-left: 15px;
-        }}
-        .controls a:hover {{
-            text-decoration: underline;
-        }}
-
-        /* Hierarchy levels */
-        .subsection {{ margin: 20px 0; }}
-        .paragraph {{ margin: 15px 0 15px 30px; }}
-        .subparagraph {{ margin: 10px 0 10px 60px; }}
-        .clause {{ margin: 8px 0 8px 90px; }}
-        .subclause {{ margin: 5px 0 5px 120px; }}
-        .section-text {{ margin: 20px 0; }}
-
-        .num {{
-            font-weight: 600;
-            color: #0066cc;
-        }}
-
-        .text {{
-            color: #333;
-        }}
-
-        /* Reference links */
-        .statute-ref {{
-            color: #0066cc;
-            text-decoration: none;
-            border-bottom: 1px dotted #0066cc;
-        }}
-        .statute-ref:hover {{
-            background: #e3f2fd;
-            border-bottom: 1px solid #0066cc;
-        }}
-        .external-ref {{
-            color: #666;
-            text-decoration: none;
-            border-bottom: 1px dotted #666;
-        }}
-        .external-ref::after {{
-            content: ' ↗';
-            font-size: 0.8em;
-        }}
-        .external-ref:hover {{
-            background: #f5f5f5;
-        }}
-
-        /* Comparison mode styles */
-        .comparison-toggle {{
-            padding: 6px 12px;
-            background: #0066cc;
-            color: white;
-            border: none;
-            border-radius: 3px;
-            cursor: pointer;
-            font-size: 14px;
-            margin-left: 15px;
-        }}
-        .comparison-toggle:hover {{
-            background: #0052a3;
-        }}
-        .comparison-toggle.active {{
-            background: #dc3545;
-        }}
-        .comparison-controls {{
-            display: none;
-            background: #fff3cd;
-            padding: 15px;
-            margin: 20px 0;
-            border-radius: 5px;
-            border-left: 4px solid #ffc107;
-        }}
-        .comparison-controls.active {{
-            display: block;
-        }}
-        .comparison-controls select {{
-            padding: 5px 10px;
-            font-size: 14px;
-            border: 1px solid #ccc;
-            border-radius: 3px;
-            margin: 0 10px;
-        }}
-        #statute-text {{
-            display: block;
-        }}
-        #statute-text.hidden {{
-            display: none;
-        }}
-        .comparison-container {{
-            display: none;
-            margin-top: 20px;
-            border: 1px solid #ddd;
-            border-radius: 5px;
-            padding: 20px;
-            background: white;
-            overflow-y: auto;
-            max-height: 80vh;
-        }}
-        .comparison-container.active {{
-            display: block;
-        }}
-        .comparison-header {{
-            display: flex;
-            gap: 20px;
-            margin-bottom: 20px;
-            padding-bottom: 10px;
-            border-bottom: 2px solid #ddd;
-        }}
-        .comparison-header h3 {{
-            flex: 1;
-            margin: 0;
-            color: #666;
-        }}
-        .diff-row {{
-            display: flex;
-            gap: 20px;
-            min-height: 40px;
-            align-items: stretch;
-        }}
-        .diff-cell {{
-            flex: 1;
-            padding: 10px;
-            min-height: 40px;
-            border-radius: 3px;
-        }}
-        .diff-cell.empty {{
-            background: #fafafa;
-            border: 1px dashed #ccc;
-        }}
-        .diff-added {{
-            background: #d4edda;
-            border-left: 4px solid #28a745;
-            padding: 8px;
-            margin: 8px 0;
-        }}
-        .diff-deleted {{
-            background: #f8d7da;
-            border-left: 4px solid #dc3545;
-            padding: 8px;
-            margin: 8px 0;
-            opacity: 0.7;
-        }}
-        .diff-modified {{
-            background: #fff3cd;
-            border-left: 4px solid #ffc107;
-            padding: 8px;
-            margin: 8px 0;
-        }}
-        .diff-unchanged {{
-            opacity: 0.6;
-        }}
-        .diff-highlight {{
-            background: #ffeb3b;
-            padding: 2px 4px;
-            border-radius: 2px;
-        }}
-    </style>
-</head>
-<body>
-    <div class="controls">
-        <div>
-            <label><strong>Version:</strong></label>
-            <select id="version-select" onchange="switchVersion(this.value)">
-'''
-
-    # Add version options
-    for year in sorted(versions.keys(), reverse=True):
-        selected = 'selected' if year == latest_year else ''
-        html += f'                <option value="{year}" {selected}>{year}</option>\n'
-
-    html += f'''            </select>
+''',
+        PAGE_HEAD,
+        version_options,
+        f'''            </select>
         </div>
         <div>
             <button class="comparison-toggle" onclick="toggleComparison()">Compare Versions</button>
@@ -353,23 +717,14 @@ def generate_section_view(section_num: str, sections_data_dir: Path, output_dir:
     <div class="comparison-controls" id="comparison-controls">
         <label><strong>Compare:</strong></label>
         <select id="compare-version1">
-'''
-
-    # Add version options for comparison
-    for year in sorted(versions.keys()):
-        html += f'            <option value="{year}">{year}</option>\n'
-
-    html += '''        </select>
+''',
+        compare_options_asc,
+        '''        </select>
         <strong>with</strong>
         <select id="compare-version2">
-'''
-
-    # Add second set of version options
-    for year in sorted(versions.keys(), reverse=True):
-        selected = 'selected' if year == latest_year else ''
-        html += f'            <option value="{year}" {selected}>{year}</option>\n'
-
-    html += f'''        </select>
+''',
+        compare_options_desc,
+        f'''        </select>
         <button onclick="showComparison()" style="margin-left: 15px; padding: 5px 15px; background: #28a745; color: white; border: none; border-radius: 3px; cursor: pointer;">Show Diff</button>
     </div>
 
@@ -389,292 +744,129 @@ def generate_section_view(section_num: str, sections_data_dir: Path, output_dir:
 
     <script>
         // Store all versions
-        const versions = {json.dumps({str(k): v for k, v in versions.items()})};
-
-        function switchVersion(year) {{
-            const data = versions[year];
-            if (!data) return;
-
-            // Update heading
-            document.querySelector('h1').textContent = `18 U.S.C. § {section_num} - ${{data.heading || 'Unknown'}}`;
-
-            // Re-render statute text
-            document.getElementById('statute-text').innerHTML = renderStatuteText(data);
-        }}
-
-        function renderStatuteText(data) {{
-            if (!data || !data.subsections || data.subsections.length === 0) {{
-                if (data.text) {{
-                    return `<div class="section-text">${{escapeHtml(linkifyText(data.text, data.refs || []))}}</div>`;
-                }}
-                return '<p>No content available</p>';
-            }}
-
-            let html = '';
-            for (const subsection of data.subsections) {{
-                html += renderProvision(subsection, 5);
-            }}
-            return html;
-        }}
-
-        function renderProvision(node, level) {{
-            const levelNames = {{5: 'subsection', 6: 'paragraph', 7: 'subparagraph', 8: 'clause', 9: 'subclause'}};
-            const levelClass = levelNames[level] || 'provision';
-
-            let html = `<div class="${{levelClass}}">`;
-
-            if (node.num) {{
-                html += `<span class="num">${{escapeHtml(node.num)}}</span> `;
-            }}
-
-            if (node.text) {{
-                html += `<span class="text">${{linkifyText(node.text, node.refs || [])}}</span>`;
-            }}
-
-            // Render children
-            const childTypes = ['subsections', 'paragraphs', 'subparagraphs', 'clauses', 'subclauses'];
-            for (const childType of childTypes) {{
-                const children = node[childType] || [];
-                for (const child of children) {{
-                    const childLevel = level + 1;
-                    html += renderProvision(child, childLevel);
-                }}
-            }}
-
-            html += '</div>';
-            return html;
-        }}
-
-        function linkifyText(text, refs) {{
-            if (!text) return '';
-            let result = escapeHtml(text);
-
-            for (const ref of refs) {{
-                const refText = ref.text || '';
-                const target = ref.target || '';
-                if (!refText || !target) continue;
-
-                const escapedRef = escapeHtml(refText);
-                const match = target.match(/\\/t18\\/s(\\d+)/);
-
-                if (match) {{
-                    const sectionNum = match[1];
-                    const link = `<a href="${{sectionNum}}.html" class="statute-ref" title="${{escapeHtml(target)}}">${{escapedRef}}</a>`;
-                    result = result.replace(escapedRef, link);
-                }} else if (!target.includes('/t18/')) {{
-                    const externalUrl = `https://uscode.house.gov/view.xhtml?req=${{target.replace(/\\//g, ':')}}`;
-                    const link = `<a href="${{externalUrl}}" class="external-ref" target="_blank" title="${{escapeHtml(target)}}">${{escapedRef}}</a>`;
-                    result = result.replace(escapedRef, link);
-                }}
-            }}
-
-            return result;
-        }}
-
-        function escapeHtml(text) {{
-            const div = document.createElement('div');
-            div.textContent = text;
-            return div.innerHTML;
-        }}
-
-        // Comparison mode functions
-        function toggleComparison() {{
-            const controls = document.getElementById('comparison-controls');
-            const toggle = document.querySelector('.comparison-toggle');
-            const isActive = controls.classList.contains('active');
-
-            if (isActive) {{
-                // Close comparison mode
-                controls.classList.remove('active');
-                toggle.classList.remove('active');
-                toggle.textContent = 'Compare Versions';
-                document.getElementById('statute-text').classList.remove('hidden');
-                document.getElementById('comparison-container').classList.remove('active');
-            }} else {{
-                // Enter comparison mode
-                controls.classList.add('active');
-                toggle.classList.add('active');
-                toggle.textContent = '✕ Close Comparison';
-            }}
-        }}
-
-        function showComparison() {{
-            const year1 = document.getElementById('compare-version1').value;
-            const year2 = document.getElementById('compare-version2').value;
-
-            if (year1 === year2) {{
-                alert('Please select two different versions to compare');
-                return;
-            }}
-
-            // Hide normal view, show comparison
-            document.getElementById('statute-text').classList.add('hidden');
-            document.getElementById('comparison-container').classList.add('active');
-
-            // Update titles
-            document.getElementById('compare-left-title').textContent = `Version ${{year1}}`;
-            document.getElementById('compare-right-title').textContent = `Version ${{year2}}`;
-
-            // Generate comparison
-            const data1 = versions[year1];
-            const data2 = versions[year2];
-
-            renderSideBySide(data1, data2, year1, year2);
-        }}
-
-        function buildProvisionTree(data) {{
-            // Build flat tree of all provisions for diffing
-            const tree = {{}};
-
-            function traverse(node, path = '') {{
-                const key = node.num || '';
-                const fullPath = path ? `${{path}}/${{key}}` : key;
-
-                if (key) {{
-                    tree[fullPath] = {{
-                        num: node.num,
-                        text: node.text || '',
-                        level: node.tag || 'section'
-                    }};
-                }}
-
-                // Traverse children
-                const childTypes = ['subsections', 'paragraphs', 'subparagraphs', 'clauses', 'subclauses'];
-                for (const childType of childTypes) {{
-                    const children = node[childType] || [];
-                    for (const child of children) {{
-                        traverse(child, fullPath || key);
-                    }}
-                }}
-            }}
-
-            if (data.subsections) {{
-                for (const subsection of data.subsections) {{
-                    traverse(subsection);
-                }}
-            }}
-
-            return tree;
-        }}
-
-        function renderSideBySide(data1, data2, year1, year2) {{
-            const tree1 = buildProvisionTree(data1);
-            const tree2 = buildProvisionTree(data2);
-
-            // Find all unique paths
-            const allPaths = new Set([...Object.keys(tree1), ...Object.keys(tree2)]);
-            const sortedPaths = Array.from(allPaths).sort();
-
-            let html = '';
-
-            for (const path of sortedPaths) {{
-                const node1 = tree1[path];
-                const node2 = tree2[path];
-
-                if (!node1) {{
-                    // Added in version 2 - empty left, content right
-                    html += `<div class="diff-row">
-                        <div class="diff-cell empty"></div>
-                        <div class="diff-cell diff-added">
-                            <span class="num">${{escapeHtml(node2.num)}}</span>
-                            <span class="text">${{escapeHtml(node2.text)}}</span>
-                        </div>
-                    </div>`;
-                }} else if (!node2) {{
-                    // Deleted from version 1 - content left, empty right
-                    html += `<div class="diff-row">
-                        <div class="diff-cell diff-deleted">
-                            <span class="num">${{escapeHtml(node1.num)}}</span>
-                            <span class="text">${{escapeHtml(node1.text)}}</span>
-                        </div>
-                        <div class="diff-cell empty"></div>
-                    </div>`;
-                }} else if (node1.text !== node2.text) {{
-                    // Modified - show both versions
-                    html += `<div class="diff-row">
-                        <div class="diff-cell diff-modified">
-                            <span class="num">${{escapeHtml(node1.num)}}</span>
-                            <span class="text">${{escapeHtml(node1.text)}}</span>
-                        </div>
-                        <div class="diff-cell diff-modified">
-                            <span class="num">${{escapeHtml(node2.num)}}</span>
-                            <span class="text">${{highlightDiff(node1.text, node2.text)}}</span>
-                        </div>
-                    </div>`;
-                }} else {{
-                    // Unchanged - show both (dimmed)
-                    html += `<div class="diff-row">
-                        <div class="diff-cell diff-unchanged">
-                            <span class="num">${{escapeHtml(node1.num)}}</span>
-                            <span class="text">${{escapeHtml(node1.text)}}</span>
-                        </div>
-                        <div class="diff-cell diff-unchanged">
-                            <span class="num">${{escapeHtml(node2.num)}}</span>
-                            <span class="text">${{escapeHtml(node2.text)}}</span>
-                        </div>
-                    </div>`;
-                }}
-            }}
-
-            document.getElementById('comparison-content').innerHTML = html || '<p>No differences found</p>';
-        }}
-
-        function highlightDiff(text1, text2) {{
-            // Simple word-level diff highlighting
-            const words1 = text1.split(/\\s+/);
-            const words2 = text2.split(/\\s+/);
-
-            let result = '';
-            const maxLen = Math.max(words1.length, words2.length);
-
-            for (let i = 0; i < words2.length; i++) {{
-                if (words1[i] !== words2[i]) {{
-                    result += `<span class="diff-highlight">${{escapeHtml(words2[i])}}</span> `;
-                }} else {{
-                    result += escapeHtml(words2[i]) + ' ';
-                }}
-            }}
-
-            return result.trim();
-        }}
+        const versions = {versions_json};
+        const sectionNum = {json.dumps(section_num)};
     </script>
+    <script src="../assets/section.js" defer></script>
 </body>
 </html>
-'''
+''',
+    ])
+
 
-    # Write HTML file
+def generate_section_view(section_num: str, sections_data_dir: Path, output_dir: Path):
+    """Generate HTML page for a section with all versions."""
+    page = render_section_view(section_num, sections_data_dir)
+    if page is None:
+        return
+
+    # Write HTML file in one call
     output_file = output_dir / f'{section_num}.html'
-    with open(output_file, 'w') as f:
-        f.write(html)
+    output_file.write_text(page, encoding='utf-8')
+
+
+def _is_stale(section_num: str, sections_data_dir: Path, output_dir: Path, script_mtime: float) -> bool:
+    """True if a section's view is missing or older than its JSON versions or this script."""
+    try:
+        view_mtime = (output_dir / f'{section_num}.html').stat().st_mtime
+    except FileNotFoundError:
+        return True
+
+    # The page template lives in this script, so editing it invalidates every view
+    if script_mtime > view_mtime:
+        return True
+
+    with os.scandir(sections_data_dir / section_num) as entries:
+        return any(
+            entry.name.endswith('.json') and entry.stat().st_mtime > view_mtime
+            for entry in entries
+        )
+
+
+def _render_one(section_num: str, sections_data_dir: Path) -> tuple:
+    """Pool worker: render one section view, returning (section_num, page, error)."""
+    try:
+        return section_num, render_section_view(section_num, sections_data_dir), None
+    except Exception as e:
+        return section_num, None, e
 
 
 def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Generate HTML view pages for extracted sections')
+    parser.add_argument('--force', action='store_true',
+                        help='Regenerate every page, even when it is newer than its section JSON')
+    args = parser.parse_args()
+
     sections_data_dir = Path('data/sections')
     output_dir = Path('data/views')
     output_dir.mkdir(exist_ok=True)
 
+    # Stylesheet and script shared by every page, written once
+    assets_dir = output_dir.parent / 'assets'
+    assets_dir.mkdir(exist_ok=True)
+    (assets_dir / 'section.css').write_text(SECTION_CSS, encoding='utf-8')
+    (assets_dir / 'section.js').write_text(SECTION_JS, encoding='utf-8')
+
     print("\nGenerating section view pages...")
     print("=" * 60)
 
-    # Get all section directories
-    section_dirs = [d for d in sections_data_dir.iterdir() if d.is_dir() and d.name.isdigit()]
-    section_dirs.sort(key=lambda x: int(x.name))
-
+    # Get all section directories; scandir entries answer is_dir() without a stat
+    with os.scandir(sections_data_dir) as entries:
+        section_nums = sorted(
+            (entry.name for entry in entries if entry.is_dir() and entry.name.isdigit()),
+            key=int
+        )
+
+    # Only re-render pages whose inputs changed since they were written
+    skipped = 0
+    if not args.force:
+        script_mtime = Path(__file__).stat().st_mtime
+        stale = [
+            section_num for section_num in section_nums
+            if _is_stale(section_num, sections_data_dir, output_dir, script_mtime)
+        ]
+        skipped = len(section_nums) - len(stale)
+        section_nums = stale
+
+    # Each section page is independent, so render them across all cores
+    worker_func = functools.partial(
+        _render_one,
+        sections_data_dir=sections_data_dir
+    )
+
+    # Rendered pages are written from a few threads, so disk writes overlap
+    # with receiving the next pages instead of stalling the render loop
     count = 0
-    for section_dir in section_dirs:
-        section_num = section_dir.name
-        try:
-            generate_section_view(section_num, sections_data_dir, output_dir)
+    writes = {}
+    with mp.Pool(processes=os.cpu_count()) as pool, ThreadPoolExecutor(max_workers=4) as writer:
+        for section_num, page, error in pool.imap_unordered(worker_func, section_nums, chunksize=16):
+            if error is not None:
+                print(f"  Error generating § {section_num}: {error}")
+                continue
+            if page is not None:
+                output_file = output_dir / f'{section_num}.html'
+                writes[section_num] = writer.submit(output_file.write_text, page, encoding='utf-8')
             count += 1
             if count % 100 == 0:
                 print(f"  Generated {count} pages...")
-        except Exception as e:
-            print(f"  Error generating § {section_num}: {e}")
+
+    # Leaving the executor waited for every write; report any that failed
+    for section_num, future in writes.items():
+        error = future.exception()
+        if error is not None:
+            print(f"  Error writing § {section_num}: {error}")
+            count -= 1
 
     print(f"\n✓ Generated {count} section view pages")
+    if skipped:
+        print(f"  Skipped {skipped} up-to-date pages (use --force to regenerate)")
     print(f"  Output: {output_dir}/")
     print("=" * 60)
 
 
 if __name__ == '__main__':
+    # Required for multiprocessing on macOS/Windows
+    mp.freeze_support()
     main()
@@ -5,7 +5,7 @@ Enhanced with multiprocessing for speed and tqdm progress bars.
 """
 
 from pathlib import Path
-import json
+import os
 import sys
 from collections import defaultdict
 import multiprocessing as mp
@@ -20,40 +20,44 @@ except ImportError:
     from tqdm import tqdm
 
 sys.path.insert(0, str(Path(__file__).parent))
-from extract_sections import extract_xhtml_section
+from extract_sections import extract_xhtml_sections, write_section_json
 
 
-def process_section(section_num, xhtml_years, base_dir, sections_dir):
+def process_year(year_file, sections, base_dir, sections_dir):
     """
-    Process a single section across all XHTML years.
-    Returns: (section_num, {year: status, ...}, [errors])
+    Process all sections for a single XHTML year, parsing its file once.
+    Returns: (year, {status: count, ...}, [errors])
     """
-    results = {}
+    year, file_path = year_file
+    results = {'success': 0, 'not_found': 0, 'error': 0}
     errors = []
 
-    for year, file_path in xhtml_years.items():
-        xhtml_file = base_dir / file_path
-
-        if not xhtml_file.exists():
-            results[year] = 'file_not_found'
+    xhtml_file = base_dir / file_path
+    if not xhtml_file.exists():
+        results['file_not_found'] = len(sections)
+        return year, results, errors
+
+    try:
+        extracted = extract_xhtml_sections(xhtml_file, sections, year)
+    except Exception as e:
+        results['error'] = len(sections)
+        errors.append(('*', str(e)[:60]))
+        return year, results, errors
+
+    for section_num in sections:
+        data = extracted.get(section_num)
+        if not data:
+            results['not_found'] += 1
             continue
 
         try:
-            data = extract_xhtml_section(xhtml_file, section_num, year)
-
-            if data:
-                output_file = sections_dir / section_num / f'{year}.json'
-                with open(output_file, 'w') as f:
-                    json.dump(data, f, indent=2)
-                results[year] = 'success'
-            else:
-                results[year] = 'not_found'
-
+            write_section_json(sections_dir / section_num, section_num, year, data)
+            results['success'] += 1
         except Exception as e:
-            results[year] = 'error'
-            errors.append((year, str(e)[:60]))
+            results['error'] += 1
+            errors.append((section_num, str(e)[:60]))
 
-    return section_num, results, errors
+    return year, results, errors
 
 
 def main():
@@ -69,11 +73,13 @@ def main():
     }
 
     # Get all section numbers
-    sections = sorted([d.name for d in sections_dir.iterdir() if d.is_dir()],
-                     key=lambda x: int(x) if x.isdigit() else 0)
+    with os.scandir(sections_dir) as entries:
+        sections = sorted([entry.name for entry in entries if entry.is_dir()],
+                          key=lambda x: int(x) if x.isdigit() else 0)
 
-    # Determine number of workers
-    num_workers = max(1, 4)  # Leave 1 CPU free
+    # One task per year: each worker parses its year's file once and
+    # extracts every section from it, so the pool is never wider than that
+    num_workers = max(1, min(len(xhtml_years), (os.cpu_count() or 2) - 1))  # Leave 1 CPU free
 
     print(f"\n{'=' * 70}")
     print(f"Re-extracting XHTML sections with hierarchical structure")
@@ -84,27 +90,27 @@ def main():
     print(f"{'=' * 70}\n")
 
     # Statistics tracking
-    stats = defaultdict(lambda: {'success': 0, 'not_found': 0, 'error': 0})
+    stats = defaultdict(lambda: {'success': 0, 'not_found': 0, 'error': 0, 'file_not_found': 0})
     all_errors = []
 
     # Create worker function with fixed arguments
     worker_func = partial(
-        process_section,
-        xhtml_years=xhtml_years,
+        process_year,
+        sections=sections,
         base_dir=base_dir,
         sections_dir=sections_dir
     )
 
-    # Process sections in parallel with progress bar
+    # Process years in parallel with progress bar
     with mp.Pool(processes=num_workers) as pool:
-        with tqdm(total=len(sections), desc="Processing", unit="section") as pbar:
-            for section_num, results, errors in pool.imap_unordered(worker_func, sections):
+        with tqdm(total=len(xhtml_years), desc="Processing", unit="year") as pbar:
+            for year, results, errors in pool.imap_unordered(worker_func, xhtml_years.items()):
                 # Update statistics
-                for year, status in results.items():
-                    stats[year][status] += 1
+                for status, count in results.items():
+                    stats[year][status] += count
 
                 # Collect errors
-                for year, error_msg in errors:
+                for section_num, error_msg in errors:
                     all_errors.append(f"§{section_num} ({year}): {error_msg}")
                     # Show first few errors
                     if len(all_errors) <= 5:
@@ -4,9 +4,11 @@ Re-extract all sections from XHTML years with new hierarchical parser.
 """
 
 from pathlib import Path
-import subprocess
 import sys
 
+sys.path.insert(0, str(Path(__file__).parent))
+from extract_sections import extract_section_list
+
 def main():
     sections_dir = Path('data/sections')
 
@@ -24,12 +26,9 @@ def main():
         batch = sections[i:i+batch_size]
         print(f"Processing sections {i+1}-{min(i+batch_size, len(sections))}...")
 
-        cmd = ['python3', 'scripts/extract_sections.py', '--sections'] + batch
-        result = subprocess.run(cmd, capture_output=True, text=True)
-
-        if result.returncode != 0:
-            print(f"Error: {result.stderr}")
-            sys.exit(1)
+        # Per-year status lines are not shown, as before; force so that an
+        # existing JSON newer than its source is still re-extracted
+        extract_section_list(batch, force=True, log=lambda line: None)
 
     print(f"\n✓ Re-extracted all {len(sections)} sections")
 
@@ -1,106 +1,241 @@
 """Shared pytest fixtures for USC section parsing and comparison tests."""
 
+import os
 import pytest
 from pathlib import Path
-import sys
 
-# Add app directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / 'app'))
+# app/, backend/ and backend/app/ are put on sys.path by pytest.ini's
+# pythonpath, once per session
 
 
-@pytest.fixture
+def pytest_collection_modifyitems(config, items):
+    """Mark tests needing neither the USC data files nor a live database as no_data.
+
+    fixturenames covers every fixture a test pulls in, directly or through
+    other fixtures, so `pytest -m no_data` selects exactly the tests that
+    run without data_dir and its parsed sections (integration tests, which
+    need Neo4j, are left out).
+    """
+    for item in items:
+        if item.get_closest_marker('integration') is not None:
+            continue
+        if 'data_dir' not in getattr(item, 'fixturenames', ()):
+            item.add_marker(pytest.mark.no_data)
+
+
+@pytest.fixture(scope="session")
 def data_dir():
-    """Path to actual data directory."""
-    return Path('/Users/sergeyhlghatyan/dev/ocean/lelivre/data')
+    """Path to actual data directory ($LELIVRE_DATA, else the repo's data/).
 
+    Skips every test that needs it when the directory is missing; being
+    session-scoped, the skip is decided once rather than per test.
+    """
+    path = Path(os.environ.get('LELIVRE_DATA', Path(__file__).parent.parent / 'data'))
+    if not path.is_dir():
+        pytest.skip(f"data directory not found: {path} (set LELIVRE_DATA)")
+    return path
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def raw_data_dir(data_dir):
     """Path to raw USLM data."""
     return data_dir / 'raw' / 'uslm'
 
 
 # XML File Path Fixtures
-@pytest.fixture
+@pytest.fixture(scope="session")
 def section_922_xml_2024(raw_data_dir):
     """Path to actual 2024 XML file containing section 922."""
     return raw_data_dir / '2024' / 'usc18.xml'
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def section_922_xml_2022(raw_data_dir):
     """Path to actual 2022 XML file containing section 922."""
     return raw_data_dir / '2022' / 'usc18.xml'
 
 
 # XHTML File Path Fixtures
-@pytest.fixture
+@pytest.fixture(scope="session")
 def section_922_xhtml_2018(raw_data_dir):
     """Path to actual 2018 XHTML file containing section 922."""
     return raw_data_dir / '2018' / '2018' / '2018usc18.htm'
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def section_922_xhtml_2006(raw_data_dir):
     """Path to actual 2006 XHTML file containing section 922."""
     return raw_data_dir / '2006' / '2006' / '2006usc18.htm'
 
 
-# Parsed Section Fixtures (cached for efficiency)
-@pytest.fixture
-def parsed_section_922_2024(section_922_xml_2024):
+# Parsed Section Cache
+@pytest.fixture(scope="session")
+def usc_cache_dir(pytestconfig):
+    """Directory under .pytest_cache for parsed sections (None if caching is off)."""
+    cache = getattr(pytestconfig, 'cache', None)
+    return cache.mkdir('usc') if cache is not None else None
+
+
+def _section_922(data_loader, year):
+    """Section 922 of year from data_loader, failing loudly if it can't be loaded."""
+    section = data_loader.get_section('922', year)
+    if section is None:
+        pytest.fail(f"section 922 ({year}) could not be loaded")
+    return section
+
+
+# Parsed Section Fixtures (session-scoped; they are data_loader's own copies,
+# so each file is parsed once per run and cached on disk between runs; tests
+# only read the returned dicts)
+@pytest.fixture(scope="session")
+def parsed_section_922_2024(data_loader):
     """Parse and return section 922 from 2024 XML."""
-    from services.usc_parser import parse_xml_section
-    return parse_xml_section(section_922_xml_2024, '922', 2024)
+    return _section_922(data_loader, 2024)
 
 
-@pytest.fixture
-def parsed_section_922_2022(section_922_xml_2022):
+@pytest.fixture(scope="session")
+def parsed_section_922_2022(data_loader):
     """Parse and return section 922 from 2022 XML."""
-    from services.usc_parser import parse_xml_section
-    return parse_xml_section(section_922_xml_2022, '922', 2022)
+    return _section_922(data_loader, 2022)
 
 
-@pytest.fixture
-def parsed_section_922_2018(section_922_xhtml_2018):
+@pytest.fixture(scope="session")
+def parsed_section_922_2018(data_loader):
     """Parse and return section 922 from 2018 XHTML."""
-    from services.usc_parser import parse_xhtml_section
-    return parse_xhtml_section(section_922_xhtml_2018, '922', 2018)
+    return _section_922(data_loader, 2018)
 
 
-@pytest.fixture
-def parsed_section_922_2006(section_922_xhtml_2006):
+@pytest.fixture(scope="session")
+def parsed_section_922_2006(data_loader):
     """Parse and return section 922 from 2006 XHTML."""
-    from services.usc_parser import parse_xhtml_section
-    return parse_xhtml_section(section_922_xhtml_2006, '922', 2006)
+    return _section_922(data_loader, 2006)
+
+
+# Diff Engine Fixtures (session-scoped; built once from the parsed sections
+# above and shared by every test that needs the same tree or comparison)
+@pytest.fixture(scope="session")
+def provision_tree_2024(parsed_section_922_2024):
+    """Flat provision tree of section 922 (2024)."""
+    from services.diff_engine import build_provision_tree
+    return build_provision_tree(parsed_section_922_2024)
+
+
+@pytest.fixture(scope="session")
+def diffs_2022_vs_2024(parsed_section_922_2022, parsed_section_922_2024):
+    """Diffs of section 922 from 2022 (old) to 2024 (new)."""
+    from services.diff_engine import compare_versions
+    return compare_versions(parsed_section_922_2022, parsed_section_922_2024)
+
+
+@pytest.fixture(scope="session")
+def diffs_2024_vs_2022(parsed_section_922_2024, parsed_section_922_2022):
+    """Diffs of section 922 from 2024 (old) to 2022 (new)."""
+    from services.diff_engine import compare_versions
+    return compare_versions(parsed_section_922_2024, parsed_section_922_2022)
+
+
+@pytest.fixture(scope="session")
+def diffs_and_stats_2024_vs_2022(diffs_2024_vs_2022):
+    """(diffs, get_diff_stats(diffs)) for section 922 from 2024 to 2022."""
+    from services.diff_engine import get_diff_stats
+    return diffs_2024_vs_2022, get_diff_stats(diffs_2024_vs_2022)
+
+
+@pytest.fixture(scope="session")
+def diffs_2006_vs_2024(parsed_section_922_2006, parsed_section_922_2024):
+    """Diffs of section 922 from 2006 (old) to 2024 (new)."""
+    from services.diff_engine import compare_versions
+    return compare_versions(parsed_section_922_2006, parsed_section_922_2024)
 
 
-# Data Loader Fixture
-@pytest.fixture
-def data_loader(data_dir):
+def _bucket_diffs(diffs):
+    """Group diffs by type in one pass: {'added': [...], 'deleted': [...], ...}."""
+    buckets = {'added': [], 'deleted': [], 'modified': [], 'unchanged': []}
+    for diff in diffs:
+        buckets[diff['type']].append(diff)
+    return buckets
+
+
+@pytest.fixture(scope="session")
+def diff_buckets_2022_vs_2024(diffs_2022_vs_2024):
+    """diffs_2022_vs_2024 grouped by diff type."""
+    return _bucket_diffs(diffs_2022_vs_2024)
+
+
+@pytest.fixture(scope="session")
+def diff_buckets_2024_vs_2022(diffs_2024_vs_2022):
+    """diffs_2024_vs_2022 grouped by diff type."""
+    return _bucket_diffs(diffs_2024_vs_2022)
+
+
+@pytest.fixture(scope="session")
+def diff_buckets_2006_vs_2024(diffs_2006_vs_2024):
+    """diffs_2006_vs_2024 grouped by diff type."""
+    return _bucket_diffs(diffs_2006_vs_2024)
+
+
+# Data Loader Fixture (session-scoped; its per-(section, year) cache means each
+# version is parsed once per session, so tests that clear it restore it after,
+# and its on-disk cache skips even that on later runs)
+@pytest.fixture(scope="session")
+def data_loader(data_dir, usc_cache_dir):
     """Initialize SectionDataLoader with actual data directory."""
     from services.data_loader import SectionDataLoader
-    return SectionDataLoader(data_dir)
+    return SectionDataLoader(data_dir, cache_dir=usc_cache_dir)
+
 
+@pytest.fixture(scope="session")
+def diff_cache():
+    """(id(old), id(new)) -> (old, new, diffs, stats) for versions compared so far."""
+    return {}
 
-# Neo4j Test Fixture (for graph service tests)
-@pytest.fixture
+
+@pytest.fixture(scope="session")
+def cached_compare(diff_cache):
+    """compare_versions(old, new) plus its stats, computed once per pair of versions.
+
+    Keyed on object identity, which is stable because data_loader hands out
+    the same parsed dict for a (section, year) all session; the entry keeps
+    both versions alive so their ids can't be reused.
+    """
+    from services.diff_engine import compare_versions, get_diff_stats
+
+    def compare(old, new):
+        key = (id(old), id(new))
+        if key not in diff_cache:
+            diffs = compare_versions(old, new)
+            diff_cache[key] = (old, new, diffs, get_diff_stats(diffs))
+        return diff_cache[key][2:]
+
+    return compare
+
+
+# Neo4j Test Fixture (for graph service tests; one connection per session)
+@pytest.fixture(scope="session")
 def neo4j_test_driver():
     """Provide Neo4j driver for testing graph services."""
-    import sys
-    sys.path.insert(0, str(Path(__file__).parent.parent / 'backend' / 'app'))
+    from database import get_neo4j_driver, close_neo4j_driver
+    yield get_neo4j_driver()
+    close_neo4j_driver()
 
-    from database import get_neo4j_driver
-    return get_neo4j_driver()
 
-
-# FastAPI Test Client Fixture (for API endpoint tests)
-@pytest.fixture
+# FastAPI Test Client Fixture (for API endpoint tests; the endpoint tests only
+# issue GETs, so one app lifespan serves the whole session)
+@pytest.fixture(scope="session")
 def fastapi_client():
     """FastAPI test client for testing endpoints."""
-    import sys
-    sys.path.insert(0, str(Path(__file__).parent.parent / 'backend'))
-
+    pytest.importorskip('fastapi')
     from fastapi.testclient import TestClient
-    from app.main import app
-    return TestClient(app)
+    from pydantic import ValidationError
+
+    # Importing the app needs its settings (.env) and database drivers; without
+    # them the endpoint tests are skipped once instead of erroring one by one.
+    # Any other failure is a real error in the app
+    try:
+        from app.main import app
+    except (ImportError, ValidationError) as e:
+        pytest.skip(f"FastAPI app unavailable: {e}")
+
+    # Entering the client runs startup once; leaving it runs shutdown
+    with TestClient(app) as client:
+        yield client
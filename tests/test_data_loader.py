@@ -1,9 +1,20 @@
 """Tests for data_loader.py - SectionDataLoader class."""
 
 import pytest
+from services import data_loader as data_loader_module
 from services.data_loader import SectionDataLoader
 
 
+def _new_loader(data_loader, cache_dir=None):
+    """A fresh SectionDataLoader reusing data_loader's section index instead of rebuilding it."""
+    def copy_index(loader):
+        loader._section_index.update((year, set(nums)) for year, nums in data_loader._section_index.items())
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(SectionDataLoader, '_build_section_index', copy_index)
+        return SectionDataLoader(data_loader.data_dir, cache_dir=cache_dir)
+
+
 class TestDataLoader:
     """Tests for SectionDataLoader class."""
 
@@ -45,11 +56,55 @@ class TestDataLoader:
         # Should be the same object (from cache)
         assert result1 is result2
 
+    def test_get_section_reuses_disk_cache(self, data_loader, tmp_path, monkeypatch):
+        """Test that a loader with cache_dir reuses sections parsed by an earlier one."""
+        result = _new_loader(data_loader, cache_dir=tmp_path).get_section('922', 2024)
+        assert list(tmp_path.glob('922_2024_*.pkl'))
+
+        # A new loader must be served from disk without parsing again
+        def fail_parse(*args):
+            raise AssertionError("section was re-parsed")
+        monkeypatch.setattr(data_loader_module, 'parse_xml_section', fail_parse)
+
+        assert _new_loader(data_loader, cache_dir=tmp_path).get_section('922', 2024) == result
+
+    def test_get_section_creates_cache_dir(self, data_loader, tmp_path):
+        """Test that a cache_dir which does not exist yet is created and filled."""
+        cache_dir = tmp_path / 'cache' / 'sections'
+
+        assert _new_loader(data_loader, cache_dir=cache_dir).get_section('922', 2024) is not None
+        assert list(cache_dir.glob('922_2024_*.pkl'))
+
+    def test_get_section_replaces_corrupt_and_stale_cache_entries(self, data_loader, tmp_path):
+        """Test that a corrupt entry is parsed again and entries for old mtimes are removed."""
+        expected = data_loader.get_section('922', 2024)
+        stale_file = tmp_path / '922_2024_stale.pkl'
+        stale_file.write_bytes(b'old')
+
+        loader = _new_loader(data_loader, cache_dir=tmp_path)
+        cache_file = loader._disk_cache_file(loader.raw_dir / '2024/usc18.xml', '922', 2024)
+        cache_file.write_bytes(b'\x80\x05corrupt')
+
+        assert loader.get_section('922', 2024) == expected
+        assert list(tmp_path.glob('922_2024_*.pkl')) == [cache_file]
+
     def test_get_section_returns_none_for_invalid_section(self, data_loader):
         """Test that get_section returns None for non-existent section."""
         result = data_loader.get_section('99999', 2024)
         assert result is None
 
+    def test_get_section_skips_parse_for_unindexed_section(self, data_loader, monkeypatch):
+        """Test that a section missing from the index is not looked up by parsing."""
+        loader = _new_loader(data_loader)
+
+        parsed = []
+        monkeypatch.setattr(data_loader_module, 'parse_xml_section', lambda *args: parsed.append(args))
+        monkeypatch.setattr(data_loader_module, 'parse_xhtml_section', lambda *args: parsed.append(args))
+
+        assert loader.get_section('99999', 2024) is None
+        assert loader.get_section('99999', 2018) is None
+        assert parsed == []
+
     def test_get_section_returns_none_for_invalid_year(self, data_loader):
         """Test that get_section returns None for unsupported year."""
         result = data_loader.get_section('922', 1800)
@@ -87,8 +142,14 @@ class TestDataLoader:
         # Cache should have entry
         assert len(data_loader._cache) > 0
 
-        # Clear cache
-        data_loader.clear_cache()
-
-        # Cache should be empty
-        assert len(data_loader._cache) == 0
+        # The loader is shared by the whole session; keep its parsed sections
+        # so later tests don't have to re-parse them
+        cached = dict(data_loader._cache)
+        try:
+            # Clear cache
+            data_loader.clear_cache()
+
+            # Cache should be empty
+            assert len(data_loader._cache) == 0
+        finally:
+            data_loader._cache.update(cached)
@@ -1,15 +1,16 @@
 """Tests for diff_engine.py - Section comparison and diff generation."""
 
 import pytest
-from services.diff_engine import build_provision_tree, compare_versions, get_diff_stats
+from services.diff_engine import compare_versions, get_diff_stats
+from services.usc_parser import PROVISION_CHILD_KEYS
 
 
 class TestBuildProvisionTree:
     """Tests for build_provision_tree function."""
 
-    def test_build_provision_tree_creates_flat_structure(self, parsed_section_922_2024):
+    def test_build_provision_tree_creates_flat_structure(self, provision_tree_2024):
         """Test that build_provision_tree creates a flat dictionary of all provisions."""
-        tree = build_provision_tree(parsed_section_922_2024)
+        tree = provision_tree_2024
 
         # Should be a dict
         assert isinstance(tree, dict)
@@ -19,18 +20,21 @@ class TestBuildProvisionTree:
         assert '/us/usc/t18/s922/a/1' in tree  # Paragraph
         assert '/us/usc/t18/s922/a/1/A' in tree  # Subparagraph
 
-    def test_build_provision_tree_includes_all_provisions(self, parsed_section_922_2024):
+    def test_build_provision_tree_includes_all_provisions(self, parsed_section_922_2024, provision_tree_2024):
         """Test that build_provision_tree doesn't miss any provisions."""
-        tree = build_provision_tree(parsed_section_922_2024)
+        tree = provision_tree_2024
 
-        # Count provisions manually
-        def count_provisions(node):
+        # Count provisions manually, walking the tree with an explicit stack
+        def count_provisions(root):
             count = 0
-            for child_type in ['subsections', 'paragraphs', 'subparagraphs', 'clauses', 'subclauses']:
-                children = node.get(child_type, [])
-                count += len(children)
-                for child in children:
-                    count += count_provisions(child)
+            stack = [root]
+            while stack:
+                node = stack.pop()
+                for child_type in PROVISION_CHILD_KEYS:
+                    children = node.get(child_type)
+                    if children:
+                        count += len(children)
+                        stack.extend(children)
             return count
 
         expected_count = count_provisions(parsed_section_922_2024)
@@ -40,9 +44,9 @@ class TestBuildProvisionTree:
             f"Provision count mismatch: expected {expected_count}, got {actual_count}"
         )
 
-    def test_build_provision_tree_stores_text_and_metadata(self, parsed_section_922_2024):
+    def test_build_provision_tree_stores_text_and_metadata(self, provision_tree_2024):
         """Test that provision tree includes text and metadata."""
-        tree = build_provision_tree(parsed_section_922_2024)
+        tree = provision_tree_2024
         provision = tree['/us/usc/t18/s922/a/1/A']
 
         assert 'id' in provision
@@ -54,12 +58,10 @@ class TestBuildProvisionTree:
 class TestCompareVersions:
     """Tests for compare_versions function."""
 
-    def test_compare_versions_detects_added_provisions(self, parsed_section_922_2022, parsed_section_922_2024):
+    def test_compare_versions_detects_added_provisions(self, diff_buckets_2022_vs_2024):
         """Test that compare_versions detects provisions added in newer version."""
-        diffs = compare_versions(parsed_section_922_2022, parsed_section_922_2024)
-
         # Should find some added provisions (2024 has changes from 2022)
-        added = [d for d in diffs if d['type'] == 'added']
+        added = diff_buckets_2022_vs_2024['added']
 
         # Check structure of added diff
         if added:
@@ -70,13 +72,10 @@ class TestCompareVersions:
             assert diff['old'] is None
             assert diff['new'] is not None
 
-    def test_compare_versions_detects_deleted_provisions(self, parsed_section_922_2024, parsed_section_922_2022):
+    def test_compare_versions_detects_deleted_provisions(self, diff_buckets_2024_vs_2022):
         """Test that compare_versions detects provisions deleted in newer version."""
         # Compare 2024 (old) to 2022 (new) to find deletions
-        diffs = compare_versions(parsed_section_922_2024, parsed_section_922_2022)
-
-        # Should find some deleted provisions
-        deleted = [d for d in diffs if d['type'] == 'deleted']
+        deleted = diff_buckets_2024_vs_2022['deleted']
 
         if deleted:
             diff = deleted[0]
@@ -84,13 +83,10 @@ class TestCompareVersions:
             assert diff['old'] is not None
             assert diff['new'] is None
 
-    def test_compare_versions_detects_modified_provisions(self, parsed_section_922_2006, parsed_section_922_2024):
+    def test_compare_versions_detects_modified_provisions(self, diff_buckets_2006_vs_2024):
         """Test that compare_versions detects provisions with text changes."""
         # 2006 to 2024 should have many modifications
-        diffs = compare_versions(parsed_section_922_2006, parsed_section_922_2024)
-
-        # Should find modified provisions
-        modified = [d for d in diffs if d['type'] == 'modified']
+        modified = diff_buckets_2006_vs_2024['modified']
 
         assert len(modified) > 0, "Expected to find modified provisions between 2006 and 2024"
 
@@ -101,12 +97,10 @@ class TestCompareVersions:
         assert diff['new'] is not None
         assert diff['old']['text'] != diff['new']['text']
 
-    def test_compare_versions_detects_unchanged_provisions(self, parsed_section_922_2022, parsed_section_922_2024):
+    def test_compare_versions_detects_unchanged_provisions(self, diff_buckets_2022_vs_2024):
         """Test that compare_versions detects unchanged provisions."""
-        diffs = compare_versions(parsed_section_922_2022, parsed_section_922_2024)
-
         # Should have many unchanged provisions
-        unchanged = [d for d in diffs if d['type'] == 'unchanged']
+        unchanged = diff_buckets_2022_vs_2024['unchanged']
 
         assert len(unchanged) > 0
 
@@ -115,20 +109,25 @@ class TestCompareVersions:
         assert diff['type'] == 'unchanged'
         assert diff['old']['text'].strip() == diff['new']['text'].strip()
 
-    def test_compare_versions_maintains_hierarchical_order(self, parsed_section_922_2024, parsed_section_922_2022):
+    def test_compare_versions_maintains_hierarchical_order(self, diffs_2024_vs_2022):
         """Test that compare_versions returns diffs in hierarchical order."""
-        diffs = compare_versions(parsed_section_922_2024, parsed_section_922_2022)
+        diffs = diffs_2024_vs_2022
 
         # Extract provision IDs
         ids = [d['id'] for d in diffs]
 
-        # Should be sorted
-        assert ids == sorted(ids), "Diffs should be in hierarchical (sorted) order"
+        # Should be sorted: each ID no greater than the next, reporting the
+        # first pair out of order
+        for prev_id, next_id in zip(ids, ids[1:]):
+            assert prev_id <= next_id, (
+                f"Diffs should be in hierarchical (sorted) order: {prev_id!r} > {next_id!r}"
+            )
 
         # (a) should come before (b), (a)(1) before (a)(2), etc.
         # Check a few known orderings
-        if '/us/usc/t18/s922/a' in ids and '/us/usc/t18/s922/b' in ids:
-            assert ids.index('/us/usc/t18/s922/a') < ids.index('/us/usc/t18/s922/b')
+        positions = {provision_id: i for i, provision_id in enumerate(ids)}
+        if '/us/usc/t18/s922/a' in positions and '/us/usc/t18/s922/b' in positions:
+            assert positions['/us/usc/t18/s922/a'] < positions['/us/usc/t18/s922/b']
 
     def test_compare_identical_versions_shows_all_unchanged(self, parsed_section_922_2024):
         """Test that comparing a section to itself shows all provisions unchanged."""
@@ -141,14 +140,18 @@ class TestCompareVersions:
         assert stats['deleted'] == 0
         assert stats['modified'] == 0
 
+        # Same object on both sides takes the single-tree fast path, which
+        # pairs each provision with itself
+        assert all(d['old'] is d['new'] for d in diffs)
+        assert diffs == compare_versions(parsed_section_922_2024, dict(parsed_section_922_2024))
+
 
 class TestGetDiffStats:
     """Tests for get_diff_stats function."""
 
-    def test_get_diff_stats_counts_correctly(self, parsed_section_922_2024, parsed_section_922_2022):
+    def test_get_diff_stats_counts_correctly(self, diffs_and_stats_2024_vs_2022):
         """Test that get_diff_stats calculates correct statistics."""
-        diffs = compare_versions(parsed_section_922_2024, parsed_section_922_2022)
-        stats = get_diff_stats(diffs)
+        diffs, stats = diffs_and_stats_2024_vs_2022
 
         assert 'added' in stats
         assert 'deleted' in stats
@@ -0,0 +1,172 @@
+"""Tests for scripts/diff_paragraphs.py - hierarchical section diffs."""
+
+import json
+import pickle
+
+from scripts.diff_paragraphs import (
+    DIFF_STATUSES,
+    MODIFIED,
+    UNCHANGED,
+    _positional_word_opcodes,
+    build_xhtml_tree,
+    diff_trees,
+    load_section_tree,
+)
+
+OLD_HTML = """
+<p class="statutory-body">(a) Unchanged subsection.</p>
+<p class="statutory-body-1em">(1) Unchanged paragraph.</p>
+<p class="statutory-body-2em">(A) Unchanged subparagraph.</p>
+<p class="statutory-body-1em">(2) Second unchanged paragraph.</p>
+<p class="statutory-body">(b) Old text.</p>
+<p class="statutory-body-1em">(1) Kept under a modified parent.</p>
+<p class="statutory-body">(c) Deleted.</p>
+<p class="statutory-body-1em">(1) Deleted child.</p>"""
+
+NEW_HTML = """
+<p class="statutory-body">(a) Unchanged subsection.</p>
+<p class="statutory-body-1em">(1) Unchanged paragraph.</p>
+<p class="statutory-body-2em">(A) Unchanged subparagraph.</p>
+<p class="statutory-body-1em">(2) Second unchanged paragraph.</p>
+<p class="statutory-body">(b) New text.</p>
+<p class="statutory-body-1em">(1) Kept under a modified parent.</p>
+<p class="statutory-body-1em">(2) Added paragraph.</p>
+<p class="statutory-body">(d) Added.</p>
+<p class="statutory-body-1em">(1) Added child.</p>"""
+
+
+def _rows(diffs):
+    """Return every row of a DiffBatch as a tuple, in order."""
+    return list(zip(diffs.statuses, diffs.paths, diffs.display_paths, diffs.levels,
+                    diffs.old_texts, diffs.new_texts))
+
+
+def _unmatchable_hashes(tree: dict) -> dict:
+    """Give every node a hash equal to no other, so diff_trees compares them all."""
+    stack = list(tree.values())
+    while stack:
+        node = stack.pop()
+        node['hash'] = object()
+        stack.extend(node['children'].values())
+    return tree
+
+
+class TestDiffTrees:
+    """Tests for diff_trees and DiffBatch."""
+
+    def test_subtree_hashes_do_not_change_rows(self):
+        """Test that skipping identical subtrees gives the same rows as comparing every node."""
+        hashed = diff_trees(build_xhtml_tree(OLD_HTML), build_xhtml_tree(NEW_HTML))
+        compared = diff_trees(
+            _unmatchable_hashes(build_xhtml_tree(OLD_HTML)),
+            _unmatchable_hashes(build_xhtml_tree(NEW_HTML)),
+        )
+
+        assert _rows(hashed) == _rows(compared)
+        assert hashed.counts == compared.counts
+        assert [p for s, p in zip(hashed.statuses, hashed.paths) if s == UNCHANGED] == [
+            'a', 'a/1', 'a/1/a', 'a/2', 'b/1'
+        ]
+
+    def test_rows_and_counts(self):
+        """Test row order, display paths, status codes and the per-status counts."""
+        diffs = diff_trees(build_xhtml_tree(OLD_HTML), build_xhtml_tree(NEW_HTML))
+
+        assert [(DIFF_STATUSES[s], p) for s, p in zip(diffs.statuses, diffs.display_paths)] == [
+            ('unchanged', '(a)'),
+            ('unchanged', '(a)(1)'),
+            ('unchanged', '(a)(1)(a)'),
+            ('unchanged', '(a)(2)'),
+            ('modified', '(b)'),
+            ('unchanged', '(b)(1)'),
+            ('added', '(b)(2)'),
+            ('deleted', '(c)'),
+            ('deleted', '(c)(1)'),
+            ('added', '(d)'),
+            ('added', '(d)(1)'),
+        ]
+        assert diffs.old_texts[diffs.statuses.index(MODIFIED)] == '(b) Old text.'
+        assert diffs.new_texts[diffs.paths.index('d')] == '(d) Added.'
+        assert diffs.old_texts[diffs.paths.index('d')] == ''
+        assert diffs.stats == {'added': 3, 'deleted': 2, 'modified': 1, 'unchanged': 5}
+        assert len(diffs) == sum(diffs.counts)
+
+
+# Whether each non-equal opcode spans old words and new words
+OPCODE_SPANS = {'replace': (True, True), 'delete': (True, False), 'insert': (False, True)}
+
+
+class TestPositionalWordOpcodes:
+    """Tests for _positional_word_opcodes."""
+
+    def _assert_rebuilds(self, old_words, new_words):
+        opcodes = _positional_word_opcodes(old_words, new_words)
+        assert opcodes is not None
+
+        old_rebuilt, new_rebuilt = [], []
+        old_end = new_end = 0
+        for tag, i1, i2, j1, j2 in opcodes:
+            assert (i1, j1) == (old_end, new_end)
+            if tag == 'equal':
+                assert old_words[i1:i2] == new_words[j1:j2]
+            else:
+                assert (i1 < i2, j1 < j2) == OPCODE_SPANS[tag]
+            old_rebuilt += old_words[i1:i2]
+            new_rebuilt += new_words[j1:j2]
+            old_end, new_end = i2, j2
+
+        assert (old_end, new_end) == (len(old_words), len(new_words))
+        assert old_rebuilt == old_words
+        assert new_rebuilt == new_words
+
+    def test_opcodes_rebuild_both_word_lists(self):
+        """Test that the opcodes cover both word lists exactly, including trailing edits."""
+        words = 'it shall be unlawful for any person to ship a firearm'.split()
+
+        self._assert_rebuilds(words, words)
+        self._assert_rebuilds(words, words[:5] + ['licensed'] + words[6:])
+        self._assert_rebuilds(words, words + ['interstate'])
+        self._assert_rebuilds(words + ['interstate'], words)
+        self._assert_rebuilds([], [])
+
+    def test_dissimilar_word_lists_fall_back(self):
+        """Test that lists differing in length or most positions get no positional opcodes."""
+        words = 'it shall be unlawful for any person'.split()
+
+        assert _positional_word_opcodes(words, words[:-2]) is None
+        assert _positional_word_opcodes(words, words[1:] + ['x']) is None
+
+
+class TestLoadSectionTree:
+    """Tests for load_section_tree and its pickle cache."""
+
+    def _write_section(self, tmp_path, text: str):
+        section_file = tmp_path / '2024.json'
+        section_file.write_text(json.dumps({
+            'metadata': {'format': 'xml'},
+            'subsections': [{'id': '/us/usc/t18/s922/a', 'num': '(a)', 'text': text}],
+        }), encoding='utf-8')
+        return section_file
+
+    def test_corrupt_and_stale_cache_entries_are_rebuilt(self, tmp_path):
+        """Test that a cache entry which is corrupt or for another source is not used."""
+        section_file = self._write_section(tmp_path, 'It shall be unlawful.')
+        expected = load_section_tree(section_file)
+        cache_file = tmp_path / '.cache' / '2024.pkl'
+        assert expected['a']['text'] == 'It shall be unlawful.'
+
+        # Truncated, and a string that is not valid UTF-8
+        for corrupt in (b'\x80\x05corrupt', b'\x80\x05\x8c\x02\xff\xfe.'):
+            cache_file.write_bytes(corrupt)
+            assert load_section_tree(section_file) == expected
+
+        with open(cache_file, 'wb') as f:
+            pickle.dump(('stale',), f)
+            pickle.dump({}, f)
+        assert load_section_tree(section_file) == expected
+
+        # The rebuilt entry is written back and served on the next load
+        assert not list(cache_file.parent.glob('*.tmp'))
+        with open(cache_file, 'rb') as f:
+            pickle.load(f)
+            assert pickle.load(f) == expected
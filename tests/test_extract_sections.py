@@ -0,0 +1,124 @@
+"""Tests for scripts/extract_sections.py - extracting sections to JSON."""
+
+import json
+
+from scripts.extract_sections import (
+    extract_all_xml_sections,
+    extract_xhtml_section,
+    extract_xhtml_sections,
+    extract_xml_section,
+)
+
+
+def _write_xhtml(tmp_path, body: str):
+    """Write an XHTML title file with the given body markup and return its path."""
+    xhtml_file = tmp_path / 'usc18.htm'
+    xhtml_file.write_text(f'<html><body>\n{body}\n</body></html>', encoding='utf-8')
+    return xhtml_file
+
+
+def _write_xml(tmp_path, body: str):
+    """Write a USLM title file with the given title markup and return its path."""
+    xml_file = tmp_path / 'usc18.xml'
+    xml_file.write_text(
+        '<uscDoc xmlns="http://xml.house.gov/schemas/uslm/1.0"><main><title>'
+        f'{body}</title></main></uscDoc>',
+        encoding='utf-8'
+    )
+    return xml_file
+
+
+class TestXHTMLExtraction:
+    """Tests for extract_xhtml_section and extract_xhtml_sections."""
+
+    def test_only_sibling_paragraphs_belong_to_section(self, tmp_path):
+        """Test that paragraphs nested in another element after the heading are not collected."""
+        xhtml_file = _write_xhtml(tmp_path, """
+<h3 class="section-head">&sect;922. Unlawful acts</h3>
+<p class="statutory-body">(a) First.</p>
+<div><p class="statutory-body">(b) Inside a div.</p></div>
+<p class="statutory-body">(c) Third.</p>
+<h3 class="section-head">&sect;923. Licensing</h3>
+<p class="statutory-body">(a) Other section.</p>""")
+
+        result = extract_xhtml_section(xhtml_file, '922', 2018)
+
+        assert [s['num'] for s in result['subsections']] == ['(a)', '(c)']
+        assert extract_xhtml_sections(xhtml_file, ['922'], 2018) == {'922': result}
+
+    def test_whitespace_only_text_nodes_collapse(self, tmp_path):
+        """Test that whitespace between inline elements becomes one newline, as with BeautifulSoup."""
+        xhtml_file = _write_xhtml(tmp_path, """
+<h3 class="section-head">&sect;922. Unlawful acts</h3>
+<p class="statutory-body">(a) It shall<em></em>
+    <em>apply</em> under <a href="/uscode/18/921">section<em></em>
+    921</a>.</p>""")
+
+        subsection_a = extract_xhtml_section(xhtml_file, '922', 2018)['subsections'][0]
+
+        assert subsection_a['text'] == '(a) It shall\napply under section\n    921.'
+        assert subsection_a['refs'] == [{'target': '/uscode/18/921', 'text': 'section\n    921'}]
+
+    def test_heading_must_be_a_single_string(self, tmp_path):
+        """Test that a section heading is matched through wrappers but not with mixed content."""
+        xhtml_file = _write_xhtml(tmp_path, """
+<h3 class="section-head"><span>&sect;922. Unlawful acts</span></h3>
+<p class="statutory-body">(a) First.</p>
+<h3 class="section-head">&sect;923. <em>Licensing</em></h3>
+<p class="statutory-body">(a) Other section.</p>""")
+
+        assert extract_xhtml_section(xhtml_file, '922', 2018)['heading'] == 'Unlawful acts'
+        assert extract_xhtml_section(xhtml_file, '923', 2018) is None
+        assert list(extract_xhtml_sections(xhtml_file, ['922', '923'], 2018)) == ['922']
+
+    def test_level_comes_from_first_class(self, tmp_path):
+        """Test that only the first CSS class of a paragraph determines its level."""
+        xhtml_file = _write_xhtml(tmp_path, """
+<h3 class="section-head">&sect;922. Unlawful acts</h3>
+<p class="statutory-body">(a) First.</p>
+<p class="statutory-body-1em indent">(1) Leveled.</p>
+<p class="note statutory-body-1em">(2) Not leveled.</p>""")
+
+        result = extract_xhtml_section(xhtml_file, '922', 2018)
+
+        assert [s['num'] for s in result['subsections']] == ['(a)']
+        assert [p['num'] for p in result['subsections'][0]['paragraphs']] == ['(1)']
+
+
+class TestXMLExtraction:
+    """Tests for extract_xml_section and extract_all_xml_sections."""
+
+    def test_chapeau_is_preferred_over_content(self, tmp_path):
+        """Test that a provision's text comes from <chapeau>, falling back to <content>."""
+        xml_file = _write_xml(tmp_path, """
+<section identifier="/us/usc/t18/s922"><num>\u00a7 922.</num><heading>Unlawful acts</heading>
+<subsection identifier="/us/usc/t18/s922/a"><num>(a)</num>
+<chapeau>It shall be unlawful\u2014</chapeau>
+<paragraph identifier="/us/usc/t18/s922/a/1"><num>(1)</num><content>for any person</content></paragraph>
+<content>Trailing content.</content>
+</subsection>
+</section>""")
+
+        subsection_a = extract_xml_section(xml_file, '922', 2018)['subsections'][0]
+
+        assert subsection_a['text'] == 'It shall be unlawful\u2014'
+        assert subsection_a['paragraphs'][0]['text'] == 'for any person'
+
+    def test_extract_all_skips_quoted_sections(self, tmp_path):
+        """Test that a section quoted in another section's notes does not replace it."""
+        xml_file = _write_xml(tmp_path, """
+<section identifier="/us/usc/t18/s927"><num>\u00a7 927.</num><heading>Effect on State law</heading>
+<content>No provision of this chapter shall be construed...</content>
+<notes><note><quotedContent>
+<section identifier="/us/usc/t18/s927"><num>\u00a7 927.</num><heading>Old text</heading></section>
+</quotedContent></note></notes>
+</section>
+<section identifier="/us/usc/t18/s928"><num>\u00a7 928.</num><heading>Separability</heading></section>""")
+        output_dir = tmp_path / 'sections'
+
+        for _ in range(2):
+            assert extract_all_xml_sections(xml_file, 2024, output_dir, log=lambda line: None) == 2
+
+            data = json.loads((output_dir / '927' / '2024.json').read_text(encoding='utf-8'))
+            assert data['heading'] == 'Effect on State law'
+            assert data['text'] == 'No provision of this chapter shall be construed...'
@@ -1,38 +1,93 @@
 """Tests for graph service (Impact Radius & Change Constellation)."""
 
 import pytest
-import sys
-from pathlib import Path
 
-# Add backend app to path
-sys.path.insert(0, str(Path(__file__).parent.parent / 'backend' / 'app'))
+# The backend package, not app/services (which is also importable as "services")
+from app.services import graph as graph_service
+from app.services.graph import get_impact_radius, get_change_constellation, calculate_change_magnitude
 
-from services.graph import get_impact_radius, get_change_constellation, calculate_change_magnitude
 
+# Canned Neo4j rows for tests that only check how results are shaped
+IMPACT_ROWS = [
+    {'provision_id': '18/922/a', 'heading': None, 'year': 2024,
+     'distance': 0, 'change_type': 'unchanged', 'text_delta': 0},
+    {'provision_id': '18/922/a/1', 'heading': None, 'year': 2024,
+     'distance': 1, 'change_type': 'modified', 'text_delta': 120},
+    {'provision_id': '18/922/a/2', 'heading': None, 'year': 2024,
+     'distance': 1, 'change_type': 'added', 'text_delta': 640},
+]
+
+CONSTELLATION_ROWS = [
+    {'provision_id': '18/922/a/1', 'heading': None, 'year': 2022, 'change_type': 'modified',
+     'magnitude': 0.33, 'text_delta': 120, 'parent_id': '18/922/a'},
+    {'provision_id': '18/922/a/2', 'heading': None, 'year': 2022, 'change_type': 'added',
+     'magnitude': 0.74, 'text_delta': 640, 'parent_id': '18/922/a'},
+    {'provision_id': '18/922/b', 'heading': None, 'year': 2024, 'change_type': 'modified',
+     'magnitude': 0.15, 'text_delta': 50, 'parent_id': 'root'},
+]
+
+EDGE_ROWS = [
+    {'source': '18/922/a', 'target': '18/922/a/1', 'rel_type': 'PARENT_OF'},
+    {'source': '18/922/a', 'target': '18/922/a/2', 'rel_type': 'PARENT_OF'},
+]
+
+# Fields (and their types) every node of each graph view must carry
+RADIUS_NODE_FIELDS = {'id', 'label', 'distance', 'change_type', 'magnitude', 'text_delta'}
+RADIUS_NODE_TYPES = {'id': str, 'distance': int, 'change_type': str, 'magnitude': (int, float)}
+CONSTELLATION_NODE_FIELDS = {'id', 'label', 'year', 'change_type', 'magnitude'}
+CONSTELLATION_NODE_TYPES = {'id': str, 'year': int, 'change_type': str, 'magnitude': (int, float)}
+
+
+def _assert_node_shape(node, fields, types):
+    missing = fields - node.keys()
+    assert not missing, f"node {node.get('id')} missing fields {sorted(missing)}"
+    for key, expected_type in types.items():
+        assert isinstance(node[key], expected_type), f"{key} of node {node['id']} is {type(node[key]).__name__}"
+    assert 0.0 <= node['magnitude'] <= 1.0
+
+
+class _FakeSession:
+    """Neo4j session stand-in answering each graph query with canned rows."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def run(self, query, **params):
+        if 'as source' in query:
+            return EDGE_ROWS
+        if 'as parent_id' in query:
+            return CONSTELLATION_ROWS
+        return IMPACT_ROWS
 
-class TestCalculateChangeMagnitude:
-    """Test the change magnitude calculation helper."""
 
-    def test_zero_delta_returns_zero(self):
-        """Text delta of 0 should return magnitude 0.0."""
-        assert calculate_change_magnitude(0) == 0.0
+class _FakeDriver:
+    def session(self):
+        return _FakeSession()
 
-    def test_small_changes_under_100(self):
-        """Text deltas under 100 chars should return 0.0-0.3."""
-        assert calculate_change_magnitude(0) == 0.0
-        assert calculate_change_magnitude(50) == pytest.approx(0.15, rel=0.01)
-        assert calculate_change_magnitude(99) == pytest.approx(0.297, rel=0.01)
 
-    def test_medium_changes_100_to_500(self):
-        """Text deltas 100-500 chars should return 0.3-0.7."""
-        assert calculate_change_magnitude(100) == pytest.approx(0.3, rel=0.01)
-        assert calculate_change_magnitude(300) == pytest.approx(0.5, rel=0.01)
-        assert calculate_change_magnitude(499) == pytest.approx(0.698, rel=0.01)
+@pytest.fixture
+def mock_graph(monkeypatch):
+    """Serve graph service queries from the canned rows instead of Neo4j."""
+    monkeypatch.setattr(graph_service, 'get_neo4j_driver', _FakeDriver)
 
-    def test_large_changes_over_500(self):
-        """Text deltas over 500 chars should return 0.7-1.0."""
-        assert calculate_change_magnitude(500) == pytest.approx(0.7, rel=0.01)
-        assert calculate_change_magnitude(1000) == pytest.approx(0.85, rel=0.01)
+
+class TestCalculateChangeMagnitude:
+    """Test the change magnitude calculation helper."""
+
+    @pytest.mark.parametrize("delta,expected", [
+        # Small changes under 100 chars: 0.0-0.3
+        (0, 0.0), (50, 0.15), (99, 0.297),
+        # Medium changes 100-500 chars: 0.3-0.7
+        (100, 0.3), (300, 0.5), (499, 0.698),
+        # Large changes over 500 chars: 0.7-1.0
+        (500, 0.7), (1000, 0.85),
+    ])
+    def test_magnitude_for_text_delta(self, delta, expected):
+        """Text deltas should map onto the piecewise magnitude scale."""
+        assert calculate_change_magnitude(delta) == pytest.approx(expected, rel=0.01)
 
     def test_very_large_changes_capped_at_one(self):
         """Very large text deltas should cap at 1.0."""
@@ -40,10 +95,42 @@ class TestCalculateChangeMagnitude:
         assert calculate_change_magnitude(10000) <= 1.0
 
 
+# Query results shared by every test that issues the same query, so each
+# parameter set is traversed once per session (tests only read them)
+@pytest.fixture(scope="session")
+def impact_radius_922a_depth1(neo4j_test_driver):
+    """Hierarchy-only impact radius of 18/922/a (2024) at depth 1."""
+    return get_impact_radius(
+        provision_id='18/922/a',
+        year=2024,
+        depth=1,
+        include_hierarchical=True,
+        include_references=False,
+        include_amendments=False
+    )
+
+
+@pytest.fixture(scope="session")
+def impact_radius_922a_depth2(neo4j_test_driver):
+    """Hierarchy-only impact radius of 18/922/a (2024) at depth 2."""
+    return get_impact_radius(
+        provision_id='18/922/a',
+        year=2024,
+        depth=2,
+        include_hierarchical=True,
+        include_references=False,
+        include_amendments=False
+    )
+
+
 class TestGraphService:
-    """Test graph service functions for impact radius and change constellation."""
+    """Test graph service functions for impact radius and change constellation.
 
-    def test_get_impact_radius_returns_correct_structure(self, neo4j_test_driver):
+    Shape checks run against mock_graph; tests of traversal and filter
+    semantics need a live Neo4j and are marked integration.
+    """
+
+    def test_get_impact_radius_returns_correct_structure(self, mock_graph):
         """Impact radius should return dict with nodes, edges, and stats."""
         # Test with a known provision
         result = get_impact_radius(
@@ -72,49 +159,27 @@ class TestGraphService:
         assert isinstance(result['stats'], dict)
         assert 'total' in result['stats']
 
-    def test_get_impact_radius_respects_depth_parameter(self, neo4j_test_driver):
+    @pytest.mark.integration
+    def test_get_impact_radius_respects_depth_parameter(self, impact_radius_922a_depth1, impact_radius_922a_depth2):
         """Impact radius should limit traversal to specified depth."""
         # Depth 1 should return fewer or equal nodes than depth 2
-        result_depth_1 = get_impact_radius(
-            provision_id='18/922/a',
-            year=2024,
-            depth=1,
-            include_hierarchical=True,
-            include_references=False,
-            include_amendments=False
-        )
-
-        result_depth_2 = get_impact_radius(
-            provision_id='18/922/a',
-            year=2024,
-            depth=2,
-            include_hierarchical=True,
-            include_references=False,
-            include_amendments=False
-        )
+        result_depth_1 = impact_radius_922a_depth1
+        result_depth_2 = impact_radius_922a_depth2
 
         # Deeper traversal should find more or equal nodes
         assert len(result_depth_2['nodes']) >= len(result_depth_1['nodes'])
 
         # All nodes in depth 1 should have distance <= 1
-        for node in result_depth_1['nodes']:
-            assert node['distance'] <= 1
+        assert all(node['distance'] <= 1 for node in result_depth_1['nodes'])
 
         # Depth 2 can have distance up to 2
-        max_distance_2 = max(node['distance'] for node in result_depth_2['nodes']) if result_depth_2['nodes'] else 0
-        assert max_distance_2 <= 2
+        assert not any(node['distance'] > 2 for node in result_depth_2['nodes'])
 
-    def test_get_impact_radius_filters_by_relationship_type(self, neo4j_test_driver):
+    @pytest.mark.integration
+    def test_get_impact_radius_filters_by_relationship_type(self, impact_radius_922a_depth2):
         """Impact radius should respect relationship type filters."""
         # Test with only hierarchical relationships
-        result_hierarchical = get_impact_radius(
-            provision_id='18/922/a',
-            year=2024,
-            depth=2,
-            include_hierarchical=True,
-            include_references=False,
-            include_amendments=False
-        )
+        result_hierarchical = impact_radius_922a_depth2
 
         # Test with all relationship types
         result_all = get_impact_radius(
@@ -129,6 +194,7 @@ class TestGraphService:
         # Including more relationship types should find more or equal nodes
         assert len(result_all['nodes']) >= len(result_hierarchical['nodes'])
 
+    @pytest.mark.integration
     def test_get_impact_radius_handles_missing_provision(self, neo4j_test_driver):
         """Impact radius should handle non-existent provisions gracefully."""
         result = get_impact_radius(
@@ -145,7 +211,7 @@ class TestGraphService:
         assert isinstance(result['nodes'], list)
         assert isinstance(result['edges'], list)
 
-    def test_get_impact_radius_nodes_have_required_fields(self, neo4j_test_driver):
+    def test_get_impact_radius_nodes_have_required_fields(self, mock_graph):
         """Impact radius nodes should have all required fields."""
         result = get_impact_radius(
             provision_id='18/922/a',
@@ -156,23 +222,10 @@ class TestGraphService:
             include_amendments=False
         )
 
-        if result['nodes']:
-            node = result['nodes'][0]
-            assert 'id' in node
-            assert 'label' in node
-            assert 'distance' in node
-            assert 'change_type' in node
-            assert 'magnitude' in node
-            assert 'text_delta' in node
-
-            # Verify types
-            assert isinstance(node['id'], str)
-            assert isinstance(node['distance'], int)
-            assert isinstance(node['change_type'], str)
-            assert isinstance(node['magnitude'], (int, float))
-            assert 0.0 <= node['magnitude'] <= 1.0
-
-    def test_get_change_constellation_returns_correct_structure(self, neo4j_test_driver):
+        for node in result['nodes']:
+            _assert_node_shape(node, RADIUS_NODE_FIELDS, RADIUS_NODE_TYPES)
+
+    def test_get_change_constellation_returns_correct_structure(self, mock_graph):
         """Change constellation should return dict with nodes, edges, clusters, and year_range."""
         result = get_change_constellation(
             provision_id=None,
@@ -195,6 +248,7 @@ class TestGraphService:
         assert isinstance(result['edges'], list)
         assert isinstance(result['clusters'], list)
 
+    @pytest.mark.integration
     def test_get_change_constellation_filters_by_year_range(self, neo4j_test_driver):
         """Change constellation should only return changes in specified year range."""
         result = get_change_constellation(
@@ -210,6 +264,7 @@ class TestGraphService:
         for node in result['nodes']:
             assert 2022 <= node['year'] <= 2024
 
+    @pytest.mark.integration
     def test_get_change_constellation_filters_by_change_types(self, neo4j_test_driver):
         """Change constellation should filter by specified change types."""
         result = get_change_constellation(
@@ -225,6 +280,7 @@ class TestGraphService:
         for node in result['nodes']:
             assert node['change_type'] in ['added', 'modified']
 
+    @pytest.mark.integration
     def test_get_change_constellation_respects_magnitude_threshold(self, neo4j_test_driver):
         """Change constellation should filter by minimum magnitude."""
         result = get_change_constellation(
@@ -240,7 +296,7 @@ class TestGraphService:
         for node in result['nodes']:
             assert node['magnitude'] >= 0.5
 
-    def test_get_change_constellation_creates_clusters(self, neo4j_test_driver):
+    def test_get_change_constellation_creates_clusters(self, mock_graph):
         """Change constellation should group provisions into clusters."""
         result = get_change_constellation(
             provision_id=None,
@@ -267,7 +323,7 @@ class TestGraphService:
                 assert cluster['count'] > 0
                 assert len(cluster['provisions']) == cluster['count']
 
-    def test_get_change_constellation_nodes_have_required_fields(self, neo4j_test_driver):
+    def test_get_change_constellation_nodes_have_required_fields(self, mock_graph):
         """Change constellation nodes should have all required fields."""
         result = get_change_constellation(
             provision_id=None,
@@ -278,22 +334,11 @@ class TestGraphService:
             min_magnitude=0.0
         )
 
-        if result['nodes']:
-            node = result['nodes'][0]
-            assert 'id' in node
-            assert 'label' in node
-            assert 'year' in node
-            assert 'change_type' in node
-            assert 'magnitude' in node
-
-            # Verify types
-            assert isinstance(node['id'], str)
-            assert isinstance(node['year'], int)
-            assert isinstance(node['change_type'], str)
-            assert isinstance(node['magnitude'], (int, float))
-            assert 0.0 <= node['magnitude'] <= 1.0
+        for node in result['nodes']:
+            _assert_node_shape(node, CONSTELLATION_NODE_FIELDS, CONSTELLATION_NODE_TYPES)
 
 
+@pytest.mark.integration
 class TestGraphEndpoints:
     """Test API endpoints for graph visualizations."""
 
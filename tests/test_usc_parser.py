@@ -2,7 +2,63 @@
 
 import pytest
 from pathlib import Path
-from services.usc_parser import parse_xml_section, parse_xhtml_section
+from services.usc_parser import parse_xml_section, parse_xhtml_section, iter_provisions, PROVISION_CHILD_KEYS
+
+
+# Number -> node maps, built once per list of sibling provisions: sections
+# from the session-wide fixtures are shared (read-only) by many tests. Each
+# entry keeps its list, so a reused id() can never hit a stale map.
+_BY_NUM_CACHE = {}
+
+
+def _by_num(nodes):
+    """Map provision numbers to nodes, keeping the first node for each number."""
+    cached = _BY_NUM_CACHE.get(id(nodes))
+    if cached is not None and cached[0] is nodes:
+        return cached[1]
+
+    by_num = {}
+    for node in nodes:
+        by_num.setdefault(node['num'], node)
+    _BY_NUM_CACHE[id(nodes)] = (nodes, by_num)
+    return by_num
+
+
+def _find(node, child_key, num):
+    """Return the first child of node under child_key with this number, or None."""
+    return _by_num(node.get(child_key, ())).get(num)
+
+
+def _navigate(section, nums):
+    """
+    Follow provision numbers down from a section, one level per number.
+
+    _navigate(section, ['(z)', '(3)', '(C)']) is subsection (z) -> paragraph
+    (3) -> subparagraph (C). Returns None if any step is missing.
+    """
+    node = section
+    for child_key, num in zip(PROVISION_CHILD_KEYS, nums):
+        node = _find(node, child_key, num)
+        if node is None:
+            return None
+    return node
+
+
+# id -> node maps of whole parsed sections, kept the same way as the maps above
+_BY_ID_CACHE = {}
+
+
+def _by_id(section):
+    """Map every provision ID in a parsed section (itself included) to its first node."""
+    cached = _BY_ID_CACHE.get(id(section))
+    if cached is not None and cached[0] is section:
+        return cached[1]
+
+    by_id = {}
+    for node in iter_provisions(section):
+        by_id.setdefault(node.get('id'), node)
+    _BY_ID_CACHE[id(section)] = (section, by_id)
+    return by_id
 
 
 class TestXMLParser:
@@ -17,6 +73,16 @@ class TestXMLParser:
         assert result['tag'] == 'section'
         assert '922' in result['num']
 
+    def test_parse_xml_section_repeat_returns_independent_copy(self, section_922_xml_2024):
+        """Test that a repeated (memoized) parse is unaffected by changes to an earlier result."""
+        first = parse_xml_section(section_922_xml_2024, '922', 2024)
+        first['subsections'].clear()
+
+        second = parse_xml_section(section_922_xml_2024, '922', 2024)
+
+        assert second is not first
+        assert second['subsections'], "Modifying one result must not change later ones"
+
     def test_parse_xml_section_has_metadata(self, parsed_section_922_2024):
         """Test that parsed XML section includes metadata."""
         assert 'metadata' in parsed_section_922_2024
@@ -43,29 +109,29 @@ class TestXMLParser:
         subsection → paragraph → subparagraph → clause → subclause
         """
         # Navigate to subsection (s) → paragraph (1) → subparagraph (A) → clause (i) → subclause (I)
-        subsection_s = next((s for s in parsed_section_922_2024['subsections'] if s['num'] == '(s)'), None)
+        subsection_s = _find(parsed_section_922_2024, 'subsections', '(s)')
         assert subsection_s is not None, "Subsection (s) should exist"
         assert subsection_s['id'] == '/us/usc/t18/s922/s'
         assert subsection_s['tag'] == 'subsection'
 
-        paragraph_1 = next((p for p in subsection_s.get('paragraphs', []) if p['num'] == '(1)'), None)
+        paragraph_1 = _find(subsection_s, 'paragraphs', '(1)')
         assert paragraph_1 is not None, "Paragraph (1) should exist under subsection (s)"
         assert paragraph_1['id'] == '/us/usc/t18/s922/s/1'
         assert paragraph_1['tag'] == 'paragraph'
 
-        subparagraph_A = next((sp for sp in paragraph_1.get('subparagraphs', []) if sp['num'] == '(A)'), None)
+        subparagraph_A = _find(paragraph_1, 'subparagraphs', '(A)')
         assert subparagraph_A is not None, "Subparagraph (A) should exist under paragraph (1)"
         assert subparagraph_A['id'] == '/us/usc/t18/s922/s/1/A'
         assert subparagraph_A['tag'] == 'subparagraph'
 
         # CRITICAL: Test clause level (level 8)
-        clause_i = next((c for c in subparagraph_A.get('clauses', []) if c['num'] == '(i)'), None)
+        clause_i = _find(subparagraph_A, 'clauses', '(i)')
         assert clause_i is not None, "Clause (i) should exist under subparagraph (A)"
         assert clause_i['id'] == '/us/usc/t18/s922/s/1/A/i'
         assert clause_i['tag'] == 'clause'
 
         # CRITICAL: Test subclause level (level 9) - deepest level
-        subclause_I = next((sc for sc in clause_i.get('subclauses', []) if sc['num'] == '(I)'), None)
+        subclause_I = _find(clause_i, 'subclauses', '(I)')
         assert subclause_I is not None, "Subclause (I) should exist under clause (i)"
         assert subclause_I['id'] == '/us/usc/t18/s922/s/1/A/i/I'
         assert subclause_I['tag'] == 'subclause'
@@ -195,15 +261,8 @@ class TestXMLParser:
     def test_parse_xml_section_extracts_references(self, parsed_section_922_2024):
         """Test that XML parser extracts cross-references."""
         # Find all refs recursively
-        def find_refs(node):
-            """Recursively find all refs in a node and its children."""
-            refs = node.get('refs', [])
-            for child_type in ['subsections', 'paragraphs', 'subparagraphs', 'clauses', 'subclauses']:
-                for child in node.get(child_type, []):
-                    refs.extend(find_refs(child))
-            return refs
-
-        all_refs = find_refs(parsed_section_922_2024)
+        # All refs in the section and its provisions
+        all_refs = [ref for node in iter_provisions(parsed_section_922_2024) for ref in node.get('refs', [])]
 
         # Section 922 should have many cross-references
         assert len(all_refs) > 0, "Expected section 922 to contain cross-references"
@@ -298,13 +357,11 @@ class TestXHTMLParser:
         parsed_2018 = data_loader.get_section('922', 2018)
 
         # Navigate to subsection (d) → paragraph (8) → subparagraph (B) → clause (ii)
-        subsection_d = next(s for s in parsed_2018['subsections'] if s['num'] == '(d)')
-        paragraph_8 = next(p for p in subsection_d['paragraphs'] if p['num'] == '(8)')
-        subparagraph_b = next(sp for sp in paragraph_8['subparagraphs'] if sp['num'] == '(B)')
+        subparagraph_b = _navigate(parsed_2018, ['(d)', '(8)', '(B)'])
 
         # Check that (B) has clauses (i) and (ii)
         assert 'clauses' in subparagraph_b
-        clause_ii = next(c for c in subparagraph_b['clauses'] if c['num'] == '(ii)')
+        clause_ii = _find(subparagraph_b, 'clauses', '(ii)')
 
         # Verify correct ID
         assert clause_ii['id'] == '/us/usc/t18/s922/d/8/B/ii'
@@ -313,18 +370,16 @@ class TestXHTMLParser:
         """Test pattern: (C)(i) then (ii) at same CSS level creates correct hierarchy."""
         parsed_2018 = data_loader.get_section('922', 2018)
 
-        # Get subsection (g) → paragraph (8)
+        # Get subsection (g) → paragraph (8) → subparagraph (C), which should
+        # have clauses (i) and (ii)
         # Note: paragraph (8) is under (g), not (f)
-        subsection_g = next(s for s in parsed_2018['subsections'] if s['num'] == '(g)')
-        paragraph_8 = next(p for p in subsection_g['paragraphs'] if p['num'] == '(8)')
-
-        # Should have subparagraph (C) with clauses (i) and (ii)
-        subparagraph_c = next(sp for sp in paragraph_8['subparagraphs'] if sp['num'] == '(C)')
+        subparagraph_c = _navigate(parsed_2018, ['(g)', '(8)', '(C)'])
         clauses = subparagraph_c.get('clauses', [])
 
         assert len(clauses) >= 2
-        clause_i = next(c for c in clauses if c['num'] == '(i)')
-        clause_ii = next(c for c in clauses if c['num'] == '(ii)')
+        clauses_by_num = _by_num(clauses)
+        clause_i = clauses_by_num['(i)']
+        clause_ii = clauses_by_num['(ii)']
 
         # Verify IDs
         assert clause_i['id'] == '/us/usc/t18/s922/g/8/C/i'
@@ -369,18 +424,12 @@ class TestXHTMLParser:
         """Test that all provisions have either text or child provisions."""
         parsed_2018 = data_loader.get_section('922', 2018)
 
-        def check_node(node, path=""):
-            node_id = node.get('id', path)
+        # The section itself, then every provision below it
+        for node in iter_provisions(parsed_2018):
             has_text = bool(node.get('text', '').strip())
-            has_children = any(node.get(k) for k in ['subsections', 'paragraphs', 'subparagraphs', 'clauses', 'subclauses'])
+            has_children = any(node.get(k) for k in PROVISION_CHILD_KEYS)
 
-            assert has_text or has_children, f"Node {node_id} has no text and no children"
-
-            for child_type in ['subsections', 'paragraphs', 'subparagraphs', 'clauses', 'subclauses']:
-                for child in node.get(child_type, []):
-                    check_node(child, node_id)
-
-        check_node(parsed_2018)
+            assert has_text or has_children, f"Node {node['id']} has no text and no children"
 
     def test_xhtml_subsection_g_not_nested_under_f(self, data_loader):
         """
@@ -395,21 +444,21 @@ class TestXHTMLParser:
         parsed_2018 = data_loader.get_section('922', 2018)
 
         # 1. Check that (g) exists as a root subsection
-        subsection_nums = [s['num'] for s in parsed_2018['subsections']]
-        assert '(g)' in subsection_nums, \
-            f"Subsection (g) should exist in root subsections, got: {subsection_nums}"
+        subsections = _by_num(parsed_2018['subsections'])
+        assert '(g)' in subsections, \
+            f"Subsection (g) should exist in root subsections, got: {list(subsections)}"
 
         # 2. Check that (g) is NOT nested under (f)
-        sub_f = next((s for s in parsed_2018['subsections'] if s['num'] == '(f)'), None)
+        sub_f = subsections.get('(f)')
         assert sub_f is not None, "Subsection (f) should exist"
 
         if 'paragraphs' in sub_f:
-            para_nums = [p['num'] for p in sub_f['paragraphs']]
-            assert '(g)' not in para_nums, \
-                f"BUG: (g) is nested as paragraph under (f). Paragraphs: {para_nums}"
+            paragraphs = _by_num(sub_f['paragraphs'])
+            assert '(g)' not in paragraphs, \
+                f"BUG: (g) is nested as paragraph under (f). Paragraphs: {list(paragraphs)}"
 
         # 3. Check that (g) has correct ID
-        sub_g = next((s for s in parsed_2018['subsections'] if s['num'] == '(g)'), None)
+        sub_g = subsections.get('(g)')
         assert sub_g is not None, "Subsection (g) should exist"
         assert sub_g['id'] == '/us/usc/t18/s922/g', \
             f"Subsection (g) has wrong ID: {sub_g['id']}, expected: /us/usc/t18/s922/g"
@@ -426,23 +475,14 @@ class TestXHTMLParser:
         provisions under (g) to have wrong parent in their IDs.
         """
         parsed_2018 = data_loader.get_section('922', 2018)
-        parsed_2024 = data_loader.get_section('922', 2024)
 
         # Find physical force provisions
-        def find_by_text(data, search_text):
-            results = []
-            def traverse(node):
-                if 'text' in node and search_text.lower() in node.get('text', '').lower():
-                    results.append(node['id'])
-                for child_type in ['subsections', 'paragraphs', 'subparagraphs', 'clauses', 'subclauses']:
-                    for child in node.get(child_type, []):
-                        traverse(child)
-            for sub in data['subsections']:
-                traverse(sub)
-            return results
-
-        pf_ids_2018 = set(find_by_text(parsed_2018, 'physical force'))
-        pf_ids_2024 = set(find_by_text(parsed_2024, 'physical force'))
+        pf_ids_2018 = {
+            node['id']
+            for sub in parsed_2018['subsections']
+            for node in iter_provisions(sub)
+            if 'physical force' in node.get('text', '').lower()
+        }
 
         # Check that we don't have wrong IDs like /us/usc/t18/s922/f/8/C/ii
         # when it should be /us/usc/t18/s922/g/8/C/ii
@@ -459,7 +499,7 @@ class TestXHTMLParser:
         CRITICAL: Verify parent provisions don't include child text.
 
         This test ensures the fix for the text duplication bug is working.
-        BeautifulSoup's .get_text() recursively gets ALL text including children.
+        An element's full text recursively gets ALL text including children.
         We must extract only DIRECT text to avoid duplication in comparisons.
 
         Bug example: /us/usc/t18/s922/r/2/s (parent) was including text from
@@ -470,25 +510,7 @@ class TestXHTMLParser:
 
         # Helper to find provision by ID
         def find_provision_by_id(data, target_id):
-            def traverse(node):
-                if node.get('id') == target_id:
-                    return node
-                for child_type in ['subsections', 'paragraphs', 'subparagraphs', 'clauses', 'subclauses']:
-                    for child in node.get(child_type, []):
-                        result = traverse(child)
-                        if result:
-                            return result
-                return None
-
-            # Check root
-            if data.get('id') == target_id:
-                return data
-            # Check subsections
-            for sub in data.get('subsections', []):
-                result = traverse(sub)
-                if result:
-                    return result
-            return None
+            return _by_id(data).get(target_id)
 
         # Test case 1: Subsection (r) → paragraph (2) → subparagraph (s) → paragraph (1)
         # This is the exact case from the bug report
@@ -574,7 +596,7 @@ class TestEdgeCases:
         parsed_2018 = data_loader.get_section('922', 2018)
         
         # Find subsections u, v, x
-        subsections = {s['num']: s for s in parsed_2018['subsections']}
+        subsections = _by_num(parsed_2018['subsections'])
         
         # Verify (x) exists as root subsection
         assert '(x)' in subsections, "Subsection (x) should exist"
@@ -598,18 +620,18 @@ class TestEdgeCases:
         parsed_2018 = data_loader.get_section('922', 2018)
 
         # Navigate: subsection (z) → paragraph (3) → subparagraph (C) → clause (i)
-        subsection_z = next((s for s in parsed_2018['subsections'] if s['num'] == '(z)'), None)
+        subsection_z = _find(parsed_2018, 'subsections', '(z)')
         assert subsection_z is not None, "Subsection (z) should exist"
 
-        paragraph_3 = next((p for p in subsection_z.get('paragraphs', []) if p['num'] == '(3)'), None)
+        paragraph_3 = _find(subsection_z, 'paragraphs', '(3)')
         assert paragraph_3 is not None, "Paragraph (3) should exist under (z)"
         assert paragraph_3['id'] == '/us/usc/t18/s922/z/3'
 
-        subparagraph_C = next((sp for sp in paragraph_3.get('subparagraphs', []) if sp['num'] == '(C)'), None)
+        subparagraph_C = _find(paragraph_3, 'subparagraphs', '(C)')
         assert subparagraph_C is not None, "Subparagraph (C) should exist under (z)(3)"
         assert subparagraph_C['id'] == '/us/usc/t18/s922/z/3/C'
 
-        clause_i = next((c for c in subparagraph_C.get('clauses', []) if c['num'] == '(i)'), None)
+        clause_i = _find(subparagraph_C, 'clauses', '(i)')
         assert clause_i is not None, "Clause (i) should exist under (z)(3)(C)"
         assert clause_i['id'] == '/us/usc/t18/s922/z/3/C/i'
 
@@ -618,7 +640,7 @@ class TestEdgeCases:
         assert len(subclauses) > 0, "Clause (i) should have subclauses"
 
         # Verify at least one subclause has correct ID format
-        subclause_I = next((sc for sc in subclauses if sc['num'] == '(I)'), None)
+        subclause_I = _by_num(subclauses).get('(I)')
         assert subclause_I is not None, "Subclause (I) should exist"
         assert subclause_I['id'] == '/us/usc/t18/s922/z/3/C/i/I'
 
@@ -631,58 +653,46 @@ class TestEdgeCases:
         """
         parsed_2018 = data_loader.get_section('922', 2018)
         
-        subsection_f = next((s for s in parsed_2018['subsections'] if s['num'] == '(f)'), None)
+        subsection_f = _find(parsed_2018, 'subsections', '(f)')
         assert subsection_f is not None, "Subsection (f) should exist"
         
         # (f) should have paragraphs (1) and (2) as direct children
         paragraphs = subsection_f.get('paragraphs', [])
         assert len(paragraphs) >= 2, "Subsection (f) should have at least 2 paragraphs"
         
-        para_nums = [p['num'] for p in paragraphs]
-        assert '(1)' in para_nums, "Paragraph (1) should exist under (f)"
-        assert '(2)' in para_nums, "Paragraph (2) should exist under (f)"
+        paragraphs_by_num = _by_num(paragraphs)
+        assert '(1)' in paragraphs_by_num, "Paragraph (1) should exist under (f)"
+        assert '(2)' in paragraphs_by_num, "Paragraph (2) should exist under (f)"
         
         # Verify IDs are correct (both as children of f, not nested)
-        para_1 = next(p for p in paragraphs if p['num'] == '(1)')
-        para_2 = next(p for p in paragraphs if p['num'] == '(2)')
+        para_1 = paragraphs_by_num['(1)']
+        para_2 = paragraphs_by_num['(2)']
         
         assert para_1['id'] == '/us/usc/t18/s922/f/1'
         assert para_2['id'] == '/us/usc/t18/s922/f/2'
 
-    def test_xhtml_subsection_i_not_confused_with_clause(self, data_loader):
+    @pytest.mark.parametrize("num,expected_id", [
+        ('(i)', '/us/usc/t18/s922/i'),  # also lowercase roman 1 (a clause number)
+        ('(x)', '/us/usc/t18/s922/x'),  # also lowercase roman 10 (a clause number)
+        ('(z)', '/us/usc/t18/s922/z'),  # last letter in the alphabet
+    ])
+    def test_xhtml_ambiguous_letter_is_root_subsection(self, data_loader, num, expected_id):
         """
-        CRITICAL: Test that (i) at CSS level 5 is recognized as subsection, not clause.
-        
-        Edge case: 'i' is both a valid subsection letter AND a roman numeral for clauses.
-        After subsection (h), next (i) should be root subsection /s922/i, not /s922/h/i
-        """
-        parsed_2018 = data_loader.get_section('922', 2018)
-        
-        subsection_i = next((s for s in parsed_2018['subsections'] if s['num'] == '(i)'), None)
-        assert subsection_i is not None, "Subsection (i) should exist"
-        
-        # CRITICAL: Should be root subsection, not clause
-        assert subsection_i['id'] == '/us/usc/t18/s922/i', \
-            f"Subsection (i) should be at root, not nested. Got: {subsection_i['id']}"
-        assert subsection_i['tag'] == 'subsection', \
-            f"(i) should be tagged as subsection, not clause. Got: {subsection_i['tag']}"
+        CRITICAL: Test that letters at CSS level 5 are recognized as root subsections.
 
-    def test_xhtml_subsection_x_roman_numeral_ambiguity(self, data_loader):
-        """
-        CRITICAL: Test that (x) at CSS level 5 is recognized as subsection, not roman numeral.
-        
-        Similar to (i), 'x' is both a subsection letter AND roman numeral 10.
-        Must be recognized as subsection (x), not clause (x).
+        Edge cases: 'i' and 'x' are both subsection letters AND roman numerals
+        for clauses; after subsection (h), (i) must be /s922/i, not /s922/h/i.
+        The last letter, (z), shouldn't cause special behavior or be nested under (y).
         """
         parsed_2018 = data_loader.get_section('922', 2018)
-        
-        subsection_x = next((s for s in parsed_2018['subsections'] if s['num'] == '(x)'), None)
-        assert subsection_x is not None, "Subsection (x) should exist"
-        
-        assert subsection_x['id'] == '/us/usc/t18/s922/x', \
-            f"Subsection (x) should be at root. Got: {subsection_x['id']}"
-        assert subsection_x['tag'] == 'subsection', \
-            f"(x) should be tagged as subsection. Got: {subsection_x['tag']}"
+
+        subsection = _find(parsed_2018, 'subsections', num)
+        assert subsection is not None, f"Subsection {num} should exist"
+
+        assert subsection['id'] == expected_id, \
+            f"Subsection {num} should be at root, not nested. Got: {subsection['id']}"
+        assert subsection['tag'] == 'subsection', \
+            f"{num} should be tagged as subsection, not clause. Got: {subsection['tag']}"
 
     def test_xhtml_deep_nesting_level_9_boundary(self, data_loader):
         """
@@ -693,17 +703,8 @@ class TestEdgeCases:
         """
         parsed_2018 = data_loader.get_section('922', 2018)
 
-        # Navigate to a deep provision with subclauses - use (z)(3)(C)(i)
-        subsection_z = next((s for s in parsed_2018['subsections'] if s['num'] == '(z)'), None)
-        assert subsection_z is not None
-
-        paragraph_3 = next((p for p in subsection_z.get('paragraphs', []) if p['num'] == '(3)'), None)
-        assert paragraph_3 is not None
-
-        subparagraph_C = next((sp for sp in paragraph_3.get('subparagraphs', []) if sp['num'] == '(C)'), None)
-        assert subparagraph_C is not None
-
-        clause_i = next((c for c in subparagraph_C.get('clauses', []) if c['num'] == '(i)'), None)
+        # Find a deep provision with subclauses - use (z)(3)(C)(i)
+        clause_i = _navigate(parsed_2018, ['(z)', '(3)', '(C)', '(i)'])
         assert clause_i is not None
 
         # Should have multiple subclauses as siblings
@@ -725,7 +726,7 @@ class TestEdgeCases:
         """
         parsed_2018 = data_loader.get_section('922', 2018)
         
-        subsection_a = next((s for s in parsed_2018['subsections'] if s['num'] == '(a)'), None)
+        subsection_a = _find(parsed_2018, 'subsections', '(a)')
         assert subsection_a is not None
         assert subsection_a['id'] == '/us/usc/t18/s922/a'
         
@@ -743,19 +744,3 @@ class TestEdgeCases:
             subpara_A = para_1['subparagraphs'][0]
             assert subpara_A['id'] == '/us/usc/t18/s922/a/1/A', \
                 f"First subparagraph should have clean ID. Got: {subpara_A['id']}"
-
-    def test_xhtml_last_subsection_z_recognition(self, data_loader):
-        """
-        Test that final subsection (z) is recognized correctly as root subsection.
-        
-        Boundary condition: Last letter in alphabet shouldn't cause special behavior.
-        """
-        parsed_2018 = data_loader.get_section('922', 2018)
-        
-        subsection_z = next((s for s in parsed_2018['subsections'] if s['num'] == '(z)'), None)
-        assert subsection_z is not None, "Subsection (z) should exist"
-        
-        # Should be root subsection, not nested under (y)
-        assert subsection_z['id'] == '/us/usc/t18/s922/z', \
-            f"Subsection (z) should be at root level. Got: {subsection_z['id']}"
-        assert subsection_z['tag'] == 'subsection'